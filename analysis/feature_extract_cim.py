@@ -5,6 +5,20 @@ import cimpy  # zur Erstellung von Python-Objekten aus XML
 
 logging.basicConfig(level=logging.ERROR)  # nur echte Fehler werden angezeigt, Warnungen ausgeblendet 
 
+# Klassen, die für die Features gelesen werden
+FEATURE_CLASSES = [
+    "BusbarSection",
+    "ACLineSegment",
+    "PowerTransformer",
+    "EnergyConsumer",
+    "ConformLoad",
+    "LoadStatic",
+    "SynchronousMachine",
+    "GeneratingUnit",
+    "SvVoltage",
+    "SvPowerFlow",
+]
+
 class CIMFeatureExtractor:
     def __init__(self, extracted_folder: str):
         
@@ -29,10 +43,22 @@ class CIMFeatureExtractor:
                 continue
 
             # ---------------------------------------------
-            # CIMpy-Import
+            # CIMpy-Records lesen: es werden nur die benötigten Klassen und Attribute gelesen,
+            # ohne Objekte zu erzeugen oder Referenzen aufzulösen
             # ---------------------------------------------
-            import_result = cimpy.cim_import(xml_files, "cgmes_v2_4_15")
-            topology = import_result["topology"]
+            classes = {}  # mRID -> Klassenname, Objekte aus mehreren Profilen nur einmal zählen
+            loads_p = {}  # mRID -> p der EnergyConsumer (aus dem SSH-Profil)
+            voltages = []
+            flows_p = []
+
+            for record in cimpy.iter_records(xml_files, classes=FEATURE_CLASSES, attributes=["p", "v"]):
+                classes[record.mRID] = record.class_name
+                if record.class_name == "EnergyConsumer" and "p" in record.attrs:
+                    loads_p[record.mRID] = float(record.attrs["p"])
+                elif record.class_name == "SvVoltage" and "v" in record.attrs:
+                    voltages.append(float(record.attrs["v"]))
+                elif record.class_name == "SvPowerFlow" and "p" in record.attrs:
+                    flows_p.append(float(record.attrs["p"]))
 
             features = {
                 "structure": {},
@@ -42,7 +68,7 @@ class CIMFeatureExtractor:
             # -----------------------------
             # Struktur -> Zählen der jeweiligen Anzahl der Objekte 
             # -----------------------------
-            counter = Counter(obj.__class__.__name__ for obj in topology.values())
+            counter = Counter(classes.values())
 
             features["structure"].update({
                 "n_busbars": counter.get("BusbarSection", 0),
@@ -62,10 +88,7 @@ class CIMFeatureExtractor:
             # -----------------------------
             # Installierte Last
             # -----------------------------
-            loads_p_inst = [
-                obj.p for obj in topology.values()
-                if obj.__class__.__name__ == "EnergyConsumer" and hasattr(obj, "p")
-            ]
+            loads_p_inst = list(loads_p.values())
 
             features["structure"].update({
                 "P_load_installed": sum(loads_p_inst) if loads_p_inst else 0.0
@@ -92,18 +115,6 @@ class CIMFeatureExtractor:
             # -----------------------------
             # Snapshots
             # -----------------------------
-            # Sammlung der Spannungen
-            voltages = [
-                obj.v for obj in topology.values()
-                if obj.__class__.__name__ == "SvVoltage" and hasattr(obj, "v")
-            ]
-
-            # Sammlung der Leistungen
-            flows_p = [
-                obj.p for obj in topology.values()
-                if obj.__class__.__name__ == "SvPowerFlow" and hasattr(obj, "p")
-            ]
-
             # Extraktion der Features aus den gesammelten Spannungen / Lasten 
             if voltages:
                 v_mean = sum(voltages) / len(voltages)
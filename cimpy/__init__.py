@@ -2,7 +2,13 @@
 
 from cimpy.cimexport import cim_export
 from cimpy.cimimport import cim_import
+from cimpy.cimimport import cim_import_overlay
+from cimpy.cimimport import get_overlay_attribute
+from cimpy.cimimport import cim_import_async
+from cimpy.cimimport import iter_records
 from cimpy.cimexport import cim_export_to_string_array
+from cimpy.cimexport import cim_export_state
+from cimpy.cimexport import cim_export_iter
 import cimpy.utils
 from cimpy.cimexamples import import_example
 from cimpy.cimexamples import export_example
@@ -0,0 +1,298 @@
+from collections import namedtuple, OrderedDict
+from contextlib import contextmanager
+import io
+import mmap
+import os
+import re
+import threading
+import zipfile
+
+# Number of bytes at the beginning of a file searched for the model header by scan_header
+_HEADER_LIMIT = 1 << 20
+
+_ENCODING = re.compile(rb"<\?xml[^>]*?encoding\s*=\s*[\"']([^\"']+)")
+_XMLNS = re.compile(rb"\sxmlns(?::([^\s=]+))?\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+_PROFILE = re.compile(rb"<(?:[\w.-]+:)?Model\.profile>([^<]*)<")
+
+# Limit of the total size of the decompressed nested archives kept in memory by _open_nested in bytes
+_NESTED_CACHE_BYTES = 256 << 20
+
+# Content of the nested zip archives which are compressed members of another archive, the least recently used first:
+# {(archive path, size, modification time, member names): bytes}. _nested_bytes is the total size of the contents.
+# Both are only accessed with _nested_lock held, imports may run in several threads.
+_nested_archives = OrderedDict()
+_nested_bytes = 0
+_nested_lock = threading.Lock()
+
+
+class ZipMember(namedtuple("ZipMember", ["archive", "members"])):
+    """XML file inside of a zip archive
+
+    archive is the path of the zip file on disk and members the names of the members leading to the XML file, e.g.
+    ("EQ.zip", "EQ.xml") for an XML file inside of a zip which is itself a member of archive. The string of a
+    ZipMember is the archive path joined with the member names, e.g. "snapshot.zip/EQ.zip/EQ.xml", which is accepted
+    by :func:`~cimpy.archive.expand_sources` as well.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "/".join((os.fspath(self.archive),) + tuple(self.members))
+
+    def open(self):
+        """Returns a context manager yielding a binary stream of the member. Nothing is extracted to disk."""
+        return _open_member(self.archive, self.members)
+
+
+class MappedFile(namedtuple("MappedFile", ["path"])):
+    """XML file on disk which is parsed from a read-only memory map
+
+    The parser reads the file from the mapped pages instead of through a file object. The kernel is advised that the
+    file is read sequentially, so it reads ahead and frees the pages behind the parser early. The string of a
+    MappedFile is its path.
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return os.fspath(self.path)
+
+    def open(self):
+        """Returns a context manager yielding the mmap of the file, or the file object if the file is empty"""
+        return _map_file(self.path)
+
+
+def is_archive(path):
+    """Returns True if path is a zip file on disk"""
+    return isinstance(path, (str, os.PathLike)) and os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def expand_sources(xml_files, use_mmap=False):
+    """Replaces the zip archives in a list of sources by the XML files they contain
+
+    Zip archives nested in an archive are expanded as well. Only the member headers are read, the members are opened
+    when they are parsed. Other sources, e.g. paths of XML files or file objects, are passed through unchanged.
+
+    :param xml_files: list of paths of XML or zip files, :class:`~cimpy.archive.ZipMember`, \
+    :class:`~cimpy.archive.MappedFile` or file objects
+    :param use_mmap: if True, paths of XML files are replaced by :class:`~cimpy.archive.MappedFile`
+    :return: list of sources in the given order, members of an archive in the order of the archive
+    """
+    sources = []
+    for source in xml_files:
+        if isinstance(source, (ZipMember, MappedFile)):
+            sources.append(source)
+        elif is_archive(source):
+            with zipfile.ZipFile(source) as archive:
+                sources.extend(ZipMember(source, members) for members in _list_members(archive, source, ()))
+        elif isinstance(source, (str, os.PathLike)) and not os.path.exists(source):
+            member = _split_member_path(os.fspath(source))
+            if member is None:
+                sources.append(source)
+            elif member.members[-1].lower().endswith(".zip"):
+                with _open_archive(member.archive, member.members) as archive:
+                    sources.extend(
+                        ZipMember(member.archive, members)
+                        for members in _list_members(archive, member.archive, member.members)
+                    )
+            else:
+                sources.append(member)
+        elif use_mmap and isinstance(source, (str, os.PathLike)):
+            sources.append(MappedFile(source))
+        else:
+            sources.append(source)
+    return sources
+
+
+@contextmanager
+def open_source(source):
+    """Context manager yielding a stream of a :class:`~cimpy.archive.ZipMember` or a \
+    :class:`~cimpy.archive.MappedFile` and any other source unchanged"""
+    if isinstance(source, (ZipMember, MappedFile)):
+        with source.open() as stream:
+            yield stream
+    else:
+        yield source
+
+
+def scan_header(buffer):
+    """Returns the namespaces and the profiles of an RDF file found by a byte search in its first megabyte
+
+    The namespaces are the xmlns declarations of the root element, the profiles the texts of the Model.profile
+    elements. Nothing is parsed, so this is much faster than an XML parser for large files.
+
+    :param buffer: content of the file, e.g. an mmap or bytes
+    :return: tuple (namespaces, profiles) with namespaces as dictionary {prefix: uri}, the prefix of the default \
+    namespace is "", and profiles as list of strings. None if the header cannot be found by a byte search, e.g. for \
+    another encoding than UTF-8 or escaped characters in a namespace.
+    """
+    limit = min(len(buffer), _HEADER_LIMIT)
+    if buffer[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return None
+    encoding = _ENCODING.match(buffer, 0, min(limit, 200))
+    if encoding is not None and encoding.group(1).lower() not in (b"utf-8", b"utf8", b"us-ascii", b"ascii"):
+        return None
+
+    # Skip the XML declaration, comments and the document type
+    position = 0
+    while True:
+        start = buffer.find(b"<", position, limit)
+        if start < 0:
+            return None
+        stop = start + 4
+        markup = buffer[start:stop]
+        if markup == b"<!--":
+            close = b"-->"
+        elif markup[1:2] in (b"?", b"!"):
+            close = b">"
+        else:
+            break
+        position = buffer.find(close, start, limit)
+        if position < 0:
+            return None
+        position += len(close)
+
+    end = buffer.find(b">", start, limit)
+    if end < 0:
+        return None
+    namespaces = {}
+    for match in _XMLNS.finditer(buffer[start:end]):
+        uri = match.group(2) if match.group(2) is not None else match.group(3)
+        if b"&" in uri:
+            return None
+        namespaces[(match.group(1) or b"").decode("utf-8")] = uri.decode("utf-8")
+
+    header_start = buffer.find(b"FullModel", end, limit)
+    header_end = buffer.find(b"FullModel>", header_start + 1, limit) if header_start >= 0 else -1
+    profiles = []
+    if header_end >= 0:
+        profiles = [match.group(1).decode("utf-8").strip() for match in _PROFILE.finditer(buffer, end, header_end)]
+    return namespaces, profiles
+
+
+def source_size(source):
+    """Returns the size in bytes of a file, the uncompressed size of a :class:`~cimpy.archive.ZipMember` or None"""
+    if isinstance(source, MappedFile):
+        source = source.path
+    if isinstance(source, mmap.mmap):
+        return len(source)
+    if isinstance(source, ZipMember):
+        with _open_archive(source.archive, source.members[:-1]) as archive:
+            return archive.getinfo(source.members[-1]).file_size
+    if isinstance(source, (str, os.PathLike)):
+        try:
+            return os.path.getsize(source)
+        except OSError:
+            return None
+    return None
+
+
+# Yields the member names of all XML files in archive, members of nested zip archives as tuples of names. archive is
+# the zip file at path or the archive nested in it reached by the member names in prefix.
+def _list_members(archive, path, prefix):
+    for info in archive.infolist():
+        if info.is_dir():
+            continue
+        name = info.filename.lower()
+        if name.endswith(".xml"):
+            yield prefix + (info.filename,)
+        elif name.endswith(".zip"):
+            with _open_nested(archive, info, path, prefix + (info.filename,)) as nested:
+                yield from _list_members(nested, path, prefix + (info.filename,))
+
+
+# Maps the file at path read-only. Empty files cannot be mapped, their file object is yielded instead.
+@contextmanager
+def _map_file(path):
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            buffer = None
+        if buffer is None:
+            yield file
+            return
+        with buffer:
+            if hasattr(buffer, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+            yield buffer
+
+
+# Opens the archive member of a chain of nested zip archives
+@contextmanager
+def _open_member(path, members):
+    with _open_archive(path, members[:-1]) as archive:
+        with archive.open(members[-1]) as stream:
+            yield stream
+
+
+# Opens the zip file at path or the zip archive nested in it reached by the member names in members
+@contextmanager
+def _open_archive(path, members):
+    with zipfile.ZipFile(path) as archive:
+        for index, name in enumerate(members):
+            archive = _open_nested(archive, archive.getinfo(name), path, members[: index + 1])
+        yield archive
+
+
+# Opens a zip archive which is a member of archive, members are the names leading to it from the zip file at path.
+# Stored members are read from the archive stream directly. Compressed members cannot be seeked efficiently, they are
+# decompressed into memory once and kept in _nested_archives, so listing, sizing, hashing and parsing the members of
+# a nested archive decompress it only once. The content is decompressed again after the zip file at path changed.
+def _open_nested(archive, info, path, members):
+    if info.compress_type == zipfile.ZIP_STORED:
+        return zipfile.ZipFile(archive.open(info))
+
+    global _nested_bytes
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, members)
+    with _nested_lock:
+        content = _nested_archives.get(key)
+        if content is not None:
+            _nested_archives.move_to_end(key)
+    if content is not None:
+        return zipfile.ZipFile(io.BytesIO(content))
+
+    # Decompressed without the lock, another thread may add the same archive meanwhile
+    content = archive.read(info)
+    if len(content) <= _NESTED_CACHE_BYTES:
+        with _nested_lock:
+            if key not in _nested_archives:
+                _nested_archives[key] = content
+                _nested_bytes += len(content)
+            while _nested_bytes > _NESTED_CACHE_BYTES and len(_nested_archives) > 1:
+                _nested_bytes -= len(_nested_archives.popitem(last=False)[1])
+    return zipfile.ZipFile(io.BytesIO(content))
+
+
+# Splits "dir/archive.zip/EQ.zip/EQ.xml" into ZipMember("dir/archive.zip", ("EQ.zip", "EQ.xml"))
+def _split_member_path(path):
+    head = path
+    tail = []
+    while True:
+        head, name = os.path.split(head)
+        if not name:
+            return None
+        tail.insert(0, name)
+        if os.path.isfile(head):
+            if not zipfile.is_zipfile(head):
+                return None
+            return _resolve_members(head, "/".join(tail))
+
+
+# Resolves member_path inside of the zip file at path, descending into nested zip archives
+def _resolve_members(path, member_path):
+    with zipfile.ZipFile(path) as archive:
+        members = ()
+        while True:
+            names = set(archive.namelist())
+            if member_path in names:
+                return ZipMember(path, members + (member_path,))
+            for name in sorted(names):
+                if name.lower().endswith(".zip") and member_path.startswith(name + "/"):
+                    members += (name,)
+                    member_path = member_path.partition(name + "/")[2]
+                    archive = _open_nested(archive, archive.getinfo(name), path, members)
+                    break
+            else:
+                return None
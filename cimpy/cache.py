@@ -0,0 +1,237 @@
+from cimpy.archive import MappedFile, ZipMember, open_source
+import gc
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+logger = logging.getLogger(__name__)
+
+# Increase if the content of the cache files changes
+_CACHE_FORMAT = 1
+
+# Default limit of the total size of the cached import results in one cache directory in bytes. It can be set with
+# the environment variable CIMPY_IMPORT_CACHE_SIZE.
+DEFAULT_MAX_BYTES = 4 * 1024**3
+
+# Digests of the files hashed in this process: {(source, inode, size, mtime, ctime): digest}
+_file_digests = {}
+
+# Fingerprint of the cimpy modules, computed once per process
+_code_fingerprint = None
+
+
+def cache_key(xml_files, schema, options=()):
+    """Returns the key of an import result in the cache
+
+    The key is a hash over the content of the files in the given order, the cgmes version and the state of its
+    modules, the state of the cimpy modules and the options which change the import result.
+
+    :param xml_files: list of paths of XML files or :class:`~cimpy.archive.ZipMember`
+    :param schema: :class:`~cimpy.schema.SchemaRegistry` of the cgmes version
+    :param options: tuple of the import options which change the result, must have a stable repr
+    :return: the key as hex string or None if a source is not a file, e.g. a file object
+    """
+    key = hashlib.sha256()
+    key.update(
+        repr(
+            (_CACHE_FORMAT, sys.version_info[:2], _get_code_fingerprint(), schema.cgmes_version, schema.fingerprint)
+        ).encode()
+    )
+    key.update(repr(options).encode())
+    for source in xml_files:
+        if not isinstance(source, (str, os.PathLike, ZipMember, MappedFile)):
+            return None
+        key.update(file_digest(source).encode())
+    return key.hexdigest()
+
+
+def file_digest(source):
+    """Returns the SHA-256 of the content of a file or a :class:`~cimpy.archive.ZipMember`
+
+    The digest is kept for the rest of the process and only computed again if the inode, the size, the modification
+    time or the status change time of the file (of the archive for members) changes. Writing or replacing a file
+    changes its status change time, which unlike the modification time cannot be set back with os.utime. Only a
+    rewrite within the timestamp resolution of the file system after the file was hashed, usually a few
+    milliseconds, keeps the stale digest.
+    """
+    path = source.archive if isinstance(source, ZipMember) else source
+    if isinstance(source, MappedFile):
+        source = path = source.path
+    stat = os.stat(path)
+    memo_key = (str(source), stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    try:
+        return _file_digests[memo_key]
+    except KeyError:
+        pass
+
+    digest = hashlib.sha256()
+    with open_source(source) as stream:
+        if isinstance(stream, (str, os.PathLike)):
+            with open(stream, "rb") as file:
+                _update_digest(digest, file)
+        else:
+            _update_digest(digest, stream)
+    _file_digests[memo_key] = digest.hexdigest()
+    return _file_digests[memo_key]
+
+
+def load(cache_dir, key):
+    """Returns the cached import result of key or None
+
+    A cache file which cannot be read, e.g. written by an incompatible version, is removed.
+    """
+    cache_file = _cache_file(cache_dir, key)
+    # The loaded objects form no garbage, collections while they are created would only cost time
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(cache_file, "rb") as file:
+            import_result = _read(file)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        logger.warning("Import cache %s not readable, import again: %s", cache_file, error)
+        _remove(cache_file)
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    # The modification time orders the cache files for the eviction
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return import_result
+
+
+def store(cache_dir, key, import_result, max_bytes=None):
+    """Stores an import result and removes the least recently used results if the cache exceeds max_bytes
+
+    :param max_bytes: limit of the total size of the cache directory, by default the environment variable \
+    CIMPY_IMPORT_CACHE_SIZE or :data:`DEFAULT_MAX_BYTES`
+    """
+    if max_bytes is None:
+        max_bytes = int(os.environ.get("CIMPY_IMPORT_CACHE_SIZE") or DEFAULT_MAX_BYTES)
+
+    cache_file = _cache_file(cache_dir, key)
+    tmp_file = cache_file + ".%d.tmp" % os.getpid()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_file, "wb") as file:
+            _write(file, import_result)
+        os.replace(tmp_file, cache_file)
+    except (OSError, pickle.PicklingError) as error:
+        logger.info("Import cache %s not writable: %s", cache_file, error)
+        _remove(tmp_file)
+        return
+
+    _evict(cache_dir, max_bytes, cache_file)
+
+
+def _cache_file(cache_dir, key):
+    return os.path.join(cache_dir, "import_{}.pickle".format(key))
+
+
+def _update_digest(digest, stream):
+    for chunk in iter(lambda: stream.read(1 << 20), b""):
+        digest.update(chunk)
+
+
+# Hash over the names, sizes and modification times of the modules of cimpy
+def _get_code_fingerprint():
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        package_path = os.path.dirname(os.path.abspath(__file__))
+        fingerprint = hashlib.sha1()
+        for name in sorted(os.listdir(package_path)):
+            if name.endswith((".py", ".mustache")):
+                stat = os.stat(os.path.join(package_path, name))
+                fingerprint.update("{}:{}:{};".format(name, stat.st_size, stat.st_mtime_ns).encode())
+        _code_fingerprint = fingerprint.hexdigest()
+    return _code_fingerprint
+
+
+# The objects of the topology are written one after another, references between them are written as their index in
+# the topology. Pickling the linked objects directly would recurse along every chain of references and fail for large
+# connected grids. The entries of the serializationProfile dictionaries of the classes are written as well, because
+# they are class attributes set by the import.
+class _Pickler(pickle.Pickler):
+    def __init__(self, file, index):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.index = index
+
+    def persistent_id(self, obj):
+        return self.index.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    objects = None
+
+    def persistent_load(self, pid):
+        return self.objects[pid]
+
+
+def _write(file, import_result):
+    topology = import_result["topology"]
+    keys = list(topology.keys())
+    objects = list(topology.values())
+    classes = [obj.__class__ for obj in objects]
+    profiles = {klass: dict(klass.serializationProfile) for klass in set(classes)}
+
+    pickler = _Pickler(file, {id(obj): index for index, obj in enumerate(objects)})
+    pickler.dump((_CACHE_FORMAT, keys, classes, profiles))
+    pickler.dump((import_result["meta_info"], [obj.__dict__ for obj in objects]))
+
+
+def _read(file):
+    unpickler = _Unpickler(file)
+    cache_format, keys, classes, profiles = unpickler.load()
+    if cache_format != _CACHE_FORMAT:
+        raise ValueError("cache format {} is not supported".format(cache_format))
+
+    objects = [klass.__new__(klass) for klass in classes]
+    unpickler.objects = objects
+    meta_info, states = unpickler.load()
+    for obj, state in zip(objects, states):
+        obj.__dict__ = state
+
+    for klass, profile in profiles.items():
+        klass.serializationProfile.update(profile)
+
+    return dict(meta_info=meta_info, topology=dict(zip(keys, objects)))
+
+
+# Removes the least recently used cache files until the total size is below max_bytes. keep is never removed.
+def _evict(cache_dir, max_bytes, keep):
+    entries = []
+    total = 0
+    for name in os.listdir(cache_dir):
+        if not (name.startswith("import_") and name.endswith(".pickle")):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, path, stat.st_size))
+        total += stat.st_size
+
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep:
+            continue
+        if _remove(path):
+            total -= size
+            logger.info("Removed %s from the import cache", path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
@@ -1,482 +1,523 @@
-from .ACDCConverter import ACDCConverter as ACDCConverter
-from .ACDCConverterDCTerminal import ACDCConverterDCTerminal as ACDCConverterDCTerminal
-from .ACDCTerminal import ACDCTerminal as ACDCTerminal
-from .ACLineSegment import ACLineSegment as ACLineSegment
-from .Accumulator import Accumulator as Accumulator
-from .AccumulatorLimit import AccumulatorLimit as AccumulatorLimit
-from .AccumulatorLimitSet import AccumulatorLimitSet as AccumulatorLimitSet
-from .AccumulatorReset import AccumulatorReset as AccumulatorReset
-from .AccumulatorValue import AccumulatorValue as AccumulatorValue
-from .ActivePower import ActivePower as ActivePower
-from .ActivePowerLimit import ActivePowerLimit as ActivePowerLimit
-from .ActivePowerPerCurrentFlow import ActivePowerPerCurrentFlow as ActivePowerPerCurrentFlow
-from .ActivePowerPerFrequency import ActivePowerPerFrequency as ActivePowerPerFrequency
-from .Analog import Analog as Analog
-from .AnalogControl import AnalogControl as AnalogControl
-from .AnalogLimit import AnalogLimit as AnalogLimit
-from .AnalogLimitSet import AnalogLimitSet as AnalogLimitSet
-from .AnalogValue import AnalogValue as AnalogValue
-from .AngleDegrees import AngleDegrees as AngleDegrees
-from .AngleRadians import AngleRadians as AngleRadians
-from .ApparentPower import ApparentPower as ApparentPower
-from .ApparentPowerLimit import ApparentPowerLimit as ApparentPowerLimit
-from .Area import Area as Area
-from .AsynchronousMachine import AsynchronousMachine as AsynchronousMachine
-from .AsynchronousMachineDynamics import AsynchronousMachineDynamics as AsynchronousMachineDynamics
-from .AsynchronousMachineEquivalentCircuit import AsynchronousMachineEquivalentCircuit as AsynchronousMachineEquivalentCircuit
-from .AsynchronousMachineKind import AsynchronousMachineKind as AsynchronousMachineKind
-from .AsynchronousMachineTimeConstantReactance import AsynchronousMachineTimeConstantReactance as AsynchronousMachineTimeConstantReactance
-from .AsynchronousMachineUserDefined import AsynchronousMachineUserDefined as AsynchronousMachineUserDefined
-from .Base import Base as Base
-from .BaseVoltage import BaseVoltage as BaseVoltage
-from .BasicIntervalSchedule import BasicIntervalSchedule as BasicIntervalSchedule
-from .Bay import Bay as Bay
-from .Boolean import Boolean as Boolean
-from .Breaker import Breaker as Breaker
-from .BusNameMarker import BusNameMarker as BusNameMarker
-from .BusbarSection import BusbarSection as BusbarSection
-from .Capacitance import Capacitance as Capacitance
-from .CapacitancePerLength import CapacitancePerLength as CapacitancePerLength
-from .Command import Command as Command
-from .Conductance import Conductance as Conductance
-from .ConductingEquipment import ConductingEquipment as ConductingEquipment
-from .Conductor import Conductor as Conductor
-from .ConformLoad import ConformLoad as ConformLoad
-from .ConformLoadGroup import ConformLoadGroup as ConformLoadGroup
-from .ConformLoadSchedule import ConformLoadSchedule as ConformLoadSchedule
-from .ConnectivityNode import ConnectivityNode as ConnectivityNode
-from .ConnectivityNodeContainer import ConnectivityNodeContainer as ConnectivityNodeContainer
-from .Connector import Connector as Connector
-from .Control import Control as Control
-from .ControlArea import ControlArea as ControlArea
-from .ControlAreaGeneratingUnit import ControlAreaGeneratingUnit as ControlAreaGeneratingUnit
-from .ControlAreaTypeKind import ControlAreaTypeKind as ControlAreaTypeKind
-from .CoordinateSystem import CoordinateSystem as CoordinateSystem
-from .CsConverter import CsConverter as CsConverter
-from .CsOperatingModeKind import CsOperatingModeKind as CsOperatingModeKind
-from .CsPpccControlKind import CsPpccControlKind as CsPpccControlKind
-from .Currency import Currency as Currency
-from .CurrentFlow import CurrentFlow as CurrentFlow
-from .CurrentLimit import CurrentLimit as CurrentLimit
-from .Curve import Curve as Curve
-from .CurveData import CurveData as CurveData
-from .CurveStyle import CurveStyle as CurveStyle
-from .DCBaseTerminal import DCBaseTerminal as DCBaseTerminal
-from .DCBreaker import DCBreaker as DCBreaker
-from .DCBusbar import DCBusbar as DCBusbar
-from .DCChopper import DCChopper as DCChopper
-from .DCConductingEquipment import DCConductingEquipment as DCConductingEquipment
-from .DCConverterOperatingModeKind import DCConverterOperatingModeKind as DCConverterOperatingModeKind
-from .DCConverterUnit import DCConverterUnit as DCConverterUnit
-from .DCDisconnector import DCDisconnector as DCDisconnector
-from .DCEquipmentContainer import DCEquipmentContainer as DCEquipmentContainer
-from .DCGround import DCGround as DCGround
-from .DCLine import DCLine as DCLine
-from .DCLineSegment import DCLineSegment as DCLineSegment
-from .DCNode import DCNode as DCNode
-from .DCPolarityKind import DCPolarityKind as DCPolarityKind
-from .DCSeriesDevice import DCSeriesDevice as DCSeriesDevice
-from .DCShunt import DCShunt as DCShunt
-from .DCSwitch import DCSwitch as DCSwitch
-from .DCTerminal import DCTerminal as DCTerminal
-from .DCTopologicalIsland import DCTopologicalIsland as DCTopologicalIsland
-from .DCTopologicalNode import DCTopologicalNode as DCTopologicalNode
-from .Date import Date as Date
-from .DateTime import DateTime as DateTime
-from .DayType import DayType as DayType
-from .Decimal import Decimal as Decimal
-from .Diagram import Diagram as Diagram
-from .DiagramLayoutVersion import DiagramLayoutVersion as DiagramLayoutVersion
-from .DiagramObject import DiagramObject as DiagramObject
-from .DiagramObjectGluePoint import DiagramObjectGluePoint as DiagramObjectGluePoint
-from .DiagramObjectPoint import DiagramObjectPoint as DiagramObjectPoint
-from .DiagramObjectStyle import DiagramObjectStyle as DiagramObjectStyle
-from .DiagramStyle import DiagramStyle as DiagramStyle
-from .DiscExcContIEEEDEC1A import DiscExcContIEEEDEC1A as DiscExcContIEEEDEC1A
-from .DiscExcContIEEEDEC2A import DiscExcContIEEEDEC2A as DiscExcContIEEEDEC2A
-from .DiscExcContIEEEDEC3A import DiscExcContIEEEDEC3A as DiscExcContIEEEDEC3A
-from .Disconnector import Disconnector as Disconnector
-from .DiscontinuousExcitationControlDynamics import DiscontinuousExcitationControlDynamics as DiscontinuousExcitationControlDynamics
-from .DiscontinuousExcitationControlUserDefined import DiscontinuousExcitationControlUserDefined as DiscontinuousExcitationControlUserDefined
-from .Discrete import Discrete as Discrete
-from .DiscreteValue import DiscreteValue as DiscreteValue
-from .DroopSignalFeedbackKind import DroopSignalFeedbackKind as DroopSignalFeedbackKind
-from .DynamicsFunctionBlock import DynamicsFunctionBlock as DynamicsFunctionBlock
-from .DynamicsVersion import DynamicsVersion as DynamicsVersion
-from .EarthFaultCompensator import EarthFaultCompensator as EarthFaultCompensator
-from .EnergyArea import EnergyArea as EnergyArea
-from .EnergyConsumer import EnergyConsumer as EnergyConsumer
-from .EnergySchedulingType import EnergySchedulingType as EnergySchedulingType
-from .EnergySource import EnergySource as EnergySource
-from .Equipment import Equipment as Equipment
-from .EquipmentBoundaryVersion import EquipmentBoundaryVersion as EquipmentBoundaryVersion
-from .EquipmentContainer import EquipmentContainer as EquipmentContainer
-from .EquipmentVersion import EquipmentVersion as EquipmentVersion
-from .EquivalentBranch import EquivalentBranch as EquivalentBranch
-from .EquivalentEquipment import EquivalentEquipment as EquivalentEquipment
-from .EquivalentInjection import EquivalentInjection as EquivalentInjection
-from .EquivalentNetwork import EquivalentNetwork as EquivalentNetwork
-from .EquivalentShunt import EquivalentShunt as EquivalentShunt
-from .ExcAC1A import ExcAC1A as ExcAC1A
-from .ExcAC2A import ExcAC2A as ExcAC2A
-from .ExcAC3A import ExcAC3A as ExcAC3A
-from .ExcAC4A import ExcAC4A as ExcAC4A
-from .ExcAC5A import ExcAC5A as ExcAC5A
-from .ExcAC6A import ExcAC6A as ExcAC6A
-from .ExcAC8B import ExcAC8B as ExcAC8B
-from .ExcANS import ExcANS as ExcANS
-from .ExcAVR1 import ExcAVR1 as ExcAVR1
-from .ExcAVR2 import ExcAVR2 as ExcAVR2
-from .ExcAVR3 import ExcAVR3 as ExcAVR3
-from .ExcAVR4 import ExcAVR4 as ExcAVR4
-from .ExcAVR5 import ExcAVR5 as ExcAVR5
-from .ExcAVR7 import ExcAVR7 as ExcAVR7
-from .ExcBBC import ExcBBC as ExcBBC
-from .ExcCZ import ExcCZ as ExcCZ
-from .ExcDC1A import ExcDC1A as ExcDC1A
-from .ExcDC2A import ExcDC2A as ExcDC2A
-from .ExcDC3A import ExcDC3A as ExcDC3A
-from .ExcDC3A1 import ExcDC3A1 as ExcDC3A1
-from .ExcELIN1 import ExcELIN1 as ExcELIN1
-from .ExcELIN2 import ExcELIN2 as ExcELIN2
-from .ExcHU import ExcHU as ExcHU
-from .ExcIEEEAC1A import ExcIEEEAC1A as ExcIEEEAC1A
-from .ExcIEEEAC2A import ExcIEEEAC2A as ExcIEEEAC2A
-from .ExcIEEEAC3A import ExcIEEEAC3A as ExcIEEEAC3A
-from .ExcIEEEAC4A import ExcIEEEAC4A as ExcIEEEAC4A
-from .ExcIEEEAC5A import ExcIEEEAC5A as ExcIEEEAC5A
-from .ExcIEEEAC6A import ExcIEEEAC6A as ExcIEEEAC6A
-from .ExcIEEEAC7B import ExcIEEEAC7B as ExcIEEEAC7B
-from .ExcIEEEAC8B import ExcIEEEAC8B as ExcIEEEAC8B
-from .ExcIEEEDC1A import ExcIEEEDC1A as ExcIEEEDC1A
-from .ExcIEEEDC2A import ExcIEEEDC2A as ExcIEEEDC2A
-from .ExcIEEEDC3A import ExcIEEEDC3A as ExcIEEEDC3A
-from .ExcIEEEDC4B import ExcIEEEDC4B as ExcIEEEDC4B
-from .ExcIEEEST1A import ExcIEEEST1A as ExcIEEEST1A
-from .ExcIEEEST1AUELselectorKind import ExcIEEEST1AUELselectorKind as ExcIEEEST1AUELselectorKind
-from .ExcIEEEST2A import ExcIEEEST2A as ExcIEEEST2A
-from .ExcIEEEST3A import ExcIEEEST3A as ExcIEEEST3A
-from .ExcIEEEST4B import ExcIEEEST4B as ExcIEEEST4B
-from .ExcIEEEST5B import ExcIEEEST5B as ExcIEEEST5B
-from .ExcIEEEST6B import ExcIEEEST6B as ExcIEEEST6B
-from .ExcIEEEST7B import ExcIEEEST7B as ExcIEEEST7B
-from .ExcOEX3T import ExcOEX3T as ExcOEX3T
-from .ExcPIC import ExcPIC as ExcPIC
-from .ExcREXS import ExcREXS as ExcREXS
-from .ExcREXSFeedbackSignalKind import ExcREXSFeedbackSignalKind as ExcREXSFeedbackSignalKind
-from .ExcSCRX import ExcSCRX as ExcSCRX
-from .ExcSEXS import ExcSEXS as ExcSEXS
-from .ExcSK import ExcSK as ExcSK
-from .ExcST1A import ExcST1A as ExcST1A
-from .ExcST2A import ExcST2A as ExcST2A
-from .ExcST3A import ExcST3A as ExcST3A
-from .ExcST4B import ExcST4B as ExcST4B
-from .ExcST6B import ExcST6B as ExcST6B
-from .ExcST6BOELselectorKind import ExcST6BOELselectorKind as ExcST6BOELselectorKind
-from .ExcST7B import ExcST7B as ExcST7B
-from .ExcST7BOELselectorKind import ExcST7BOELselectorKind as ExcST7BOELselectorKind
-from .ExcST7BUELselectorKind import ExcST7BUELselectorKind as ExcST7BUELselectorKind
-from .ExcitationSystemDynamics import ExcitationSystemDynamics as ExcitationSystemDynamics
-from .ExcitationSystemUserDefined import ExcitationSystemUserDefined as ExcitationSystemUserDefined
-from .ExternalNetworkInjection import ExternalNetworkInjection as ExternalNetworkInjection
-from .Float import Float as Float
-from .FossilFuel import FossilFuel as FossilFuel
-from .FrancisGovernorControlKind import FrancisGovernorControlKind as FrancisGovernorControlKind
-from .Frequency import Frequency as Frequency
-from .FuelType import FuelType as FuelType
-from .GenICompensationForGenJ import GenICompensationForGenJ as GenICompensationForGenJ
-from .GeneratingUnit import GeneratingUnit as GeneratingUnit
-from .GeneratorControlSource import GeneratorControlSource as GeneratorControlSource
-from .GenericNonLinearLoadModelKind import GenericNonLinearLoadModelKind as GenericNonLinearLoadModelKind
-from .GeographicalLocationVersion import GeographicalLocationVersion as GeographicalLocationVersion
-from .GeographicalRegion import GeographicalRegion as GeographicalRegion
-from .GovCT1 import GovCT1 as GovCT1
-from .GovCT2 import GovCT2 as GovCT2
-from .GovGAST import GovGAST as GovGAST
-from .GovGAST1 import GovGAST1 as GovGAST1
-from .GovGAST2 import GovGAST2 as GovGAST2
-from .GovGAST3 import GovGAST3 as GovGAST3
-from .GovGAST4 import GovGAST4 as GovGAST4
-from .GovGASTWD import GovGASTWD as GovGASTWD
-from .GovHydro1 import GovHydro1 as GovHydro1
-from .GovHydro2 import GovHydro2 as GovHydro2
-from .GovHydro3 import GovHydro3 as GovHydro3
-from .GovHydro4 import GovHydro4 as GovHydro4
-from .GovHydroDD import GovHydroDD as GovHydroDD
-from .GovHydroFrancis import GovHydroFrancis as GovHydroFrancis
-from .GovHydroIEEE0 import GovHydroIEEE0 as GovHydroIEEE0
-from .GovHydroIEEE2 import GovHydroIEEE2 as GovHydroIEEE2
-from .GovHydroPID import GovHydroPID as GovHydroPID
-from .GovHydroPID2 import GovHydroPID2 as GovHydroPID2
-from .GovHydroPelton import GovHydroPelton as GovHydroPelton
-from .GovHydroR import GovHydroR as GovHydroR
-from .GovHydroWEH import GovHydroWEH as GovHydroWEH
-from .GovHydroWPID import GovHydroWPID as GovHydroWPID
-from .GovSteam0 import GovSteam0 as GovSteam0
-from .GovSteam1 import GovSteam1 as GovSteam1
-from .GovSteam2 import GovSteam2 as GovSteam2
-from .GovSteamCC import GovSteamCC as GovSteamCC
-from .GovSteamEU import GovSteamEU as GovSteamEU
-from .GovSteamFV2 import GovSteamFV2 as GovSteamFV2
-from .GovSteamFV3 import GovSteamFV3 as GovSteamFV3
-from .GovSteamFV4 import GovSteamFV4 as GovSteamFV4
-from .GovSteamIEEE1 import GovSteamIEEE1 as GovSteamIEEE1
-from .GovSteamSGO import GovSteamSGO as GovSteamSGO
-from .GrossToNetActivePowerCurve import GrossToNetActivePowerCurve as GrossToNetActivePowerCurve
-from .Ground import Ground as Ground
-from .GroundDisconnector import GroundDisconnector as GroundDisconnector
-from .GroundingImpedance import GroundingImpedance as GroundingImpedance
-from .HydroEnergyConversionKind import HydroEnergyConversionKind as HydroEnergyConversionKind
-from .HydroGeneratingUnit import HydroGeneratingUnit as HydroGeneratingUnit
-from .HydroPlantStorageKind import HydroPlantStorageKind as HydroPlantStorageKind
-from .HydroPowerPlant import HydroPowerPlant as HydroPowerPlant
-from .HydroPump import HydroPump as HydroPump
-from .IdentifiedObject import IdentifiedObject as IdentifiedObject
-from .IfdBaseKind import IfdBaseKind as IfdBaseKind
-from .Inductance import Inductance as Inductance
-from .InductancePerLength import InductancePerLength as InductancePerLength
-from .InputSignalKind import InputSignalKind as InputSignalKind
-from .Integer import Integer as Integer
-from .Junction import Junction as Junction
-from .Length import Length as Length
-from .Limit import Limit as Limit
-from .LimitSet import LimitSet as LimitSet
-from .LimitTypeKind import LimitTypeKind as LimitTypeKind
-from .Line import Line as Line
-from .LinearShuntCompensator import LinearShuntCompensator as LinearShuntCompensator
-from .LoadAggregate import LoadAggregate as LoadAggregate
-from .LoadArea import LoadArea as LoadArea
-from .LoadBreakSwitch import LoadBreakSwitch as LoadBreakSwitch
-from .LoadComposite import LoadComposite as LoadComposite
-from .LoadDynamics import LoadDynamics as LoadDynamics
-from .LoadGenericNonLinear import LoadGenericNonLinear as LoadGenericNonLinear
-from .LoadGroup import LoadGroup as LoadGroup
-from .LoadMotor import LoadMotor as LoadMotor
-from .LoadResponseCharacteristic import LoadResponseCharacteristic as LoadResponseCharacteristic
-from .LoadStatic import LoadStatic as LoadStatic
-from .LoadUserDefined import LoadUserDefined as LoadUserDefined
-from .Location import Location as Location
-from .Measurement import Measurement as Measurement
-from .MeasurementValue import MeasurementValue as MeasurementValue
-from .MeasurementValueQuality import MeasurementValueQuality as MeasurementValueQuality
-from .MeasurementValueSource import MeasurementValueSource as MeasurementValueSource
-from .MechLoad1 import MechLoad1 as MechLoad1
-from .MechanicalLoadDynamics import MechanicalLoadDynamics as MechanicalLoadDynamics
-from .MechanicalLoadUserDefined import MechanicalLoadUserDefined as MechanicalLoadUserDefined
-from .Money import Money as Money
-from .MonthDay import MonthDay as MonthDay
-from .MutualCoupling import MutualCoupling as MutualCoupling
-from .NonConformLoad import NonConformLoad as NonConformLoad
-from .NonConformLoadGroup import NonConformLoadGroup as NonConformLoadGroup
-from .NonConformLoadSchedule import NonConformLoadSchedule as NonConformLoadSchedule
-from .NonlinearShuntCompensator import NonlinearShuntCompensator as NonlinearShuntCompensator
-from .NonlinearShuntCompensatorPoint import NonlinearShuntCompensatorPoint as NonlinearShuntCompensatorPoint
-from .NuclearGeneratingUnit import NuclearGeneratingUnit as NuclearGeneratingUnit
-from .OperationalLimit import OperationalLimit as OperationalLimit
-from .OperationalLimitDirectionKind import OperationalLimitDirectionKind as OperationalLimitDirectionKind
-from .OperationalLimitSet import OperationalLimitSet as OperationalLimitSet
-from .OperationalLimitType import OperationalLimitType as OperationalLimitType
-from .OrientationKind import OrientationKind as OrientationKind
-from .OverexcLim2 import OverexcLim2 as OverexcLim2
-from .OverexcLimIEEE import OverexcLimIEEE as OverexcLimIEEE
-from .OverexcLimX1 import OverexcLimX1 as OverexcLimX1
-from .OverexcLimX2 import OverexcLimX2 as OverexcLimX2
-from .OverexcitationLimiterDynamics import OverexcitationLimiterDynamics as OverexcitationLimiterDynamics
-from .OverexcitationLimiterUserDefined import OverexcitationLimiterUserDefined as OverexcitationLimiterUserDefined
-from .PFVArControllerType1Dynamics import PFVArControllerType1Dynamics as PFVArControllerType1Dynamics
-from .PFVArControllerType1UserDefined import PFVArControllerType1UserDefined as PFVArControllerType1UserDefined
-from .PFVArControllerType2Dynamics import PFVArControllerType2Dynamics as PFVArControllerType2Dynamics
-from .PFVArControllerType2UserDefined import PFVArControllerType2UserDefined as PFVArControllerType2UserDefined
-from .PFVArType1IEEEPFController import PFVArType1IEEEPFController as PFVArType1IEEEPFController
-from .PFVArType1IEEEVArController import PFVArType1IEEEVArController as PFVArType1IEEEVArController
-from .PFVArType2Common1 import PFVArType2Common1 as PFVArType2Common1
-from .PFVArType2IEEEPFController import PFVArType2IEEEPFController as PFVArType2IEEEPFController
-from .PFVArType2IEEEVArController import PFVArType2IEEEVArController as PFVArType2IEEEVArController
-from .PU import PU as PU
-from .PerCent import PerCent as PerCent
-from .PerLengthDCLineParameter import PerLengthDCLineParameter as PerLengthDCLineParameter
-from .PetersenCoil import PetersenCoil as PetersenCoil
-from .PetersenCoilModeKind import PetersenCoilModeKind as PetersenCoilModeKind
-from .PhaseCode import PhaseCode as PhaseCode
-from .PhaseTapChanger import PhaseTapChanger as PhaseTapChanger
-from .PhaseTapChangerAsymmetrical import PhaseTapChangerAsymmetrical as PhaseTapChangerAsymmetrical
-from .PhaseTapChangerLinear import PhaseTapChangerLinear as PhaseTapChangerLinear
-from .PhaseTapChangerNonLinear import PhaseTapChangerNonLinear as PhaseTapChangerNonLinear
-from .PhaseTapChangerSymmetrical import PhaseTapChangerSymmetrical as PhaseTapChangerSymmetrical
-from .PhaseTapChangerTable import PhaseTapChangerTable as PhaseTapChangerTable
-from .PhaseTapChangerTablePoint import PhaseTapChangerTablePoint as PhaseTapChangerTablePoint
-from .PhaseTapChangerTabular import PhaseTapChangerTabular as PhaseTapChangerTabular
-from .PositionPoint import PositionPoint as PositionPoint
-from .PowerSystemResource import PowerSystemResource as PowerSystemResource
-from .PowerSystemStabilizerDynamics import PowerSystemStabilizerDynamics as PowerSystemStabilizerDynamics
-from .PowerSystemStabilizerUserDefined import PowerSystemStabilizerUserDefined as PowerSystemStabilizerUserDefined
-from .PowerTransformer import PowerTransformer as PowerTransformer
-from .PowerTransformerEnd import PowerTransformerEnd as PowerTransformerEnd
-from .ProprietaryParameterDynamics import ProprietaryParameterDynamics as ProprietaryParameterDynamics
-from .ProtectedSwitch import ProtectedSwitch as ProtectedSwitch
-from .Pss1 import Pss1 as Pss1
-from .Pss1A import Pss1A as Pss1A
-from .Pss2B import Pss2B as Pss2B
-from .Pss2ST import Pss2ST as Pss2ST
-from .Pss5 import Pss5 as Pss5
-from .PssELIN2 import PssELIN2 as PssELIN2
-from .PssIEEE1A import PssIEEE1A as PssIEEE1A
-from .PssIEEE2B import PssIEEE2B as PssIEEE2B
-from .PssIEEE3B import PssIEEE3B as PssIEEE3B
-from .PssIEEE4B import PssIEEE4B as PssIEEE4B
-from .PssPTIST1 import PssPTIST1 as PssPTIST1
-from .PssPTIST3 import PssPTIST3 as PssPTIST3
-from .PssSB4 import PssSB4 as PssSB4
-from .PssSH import PssSH as PssSH
-from .PssSK import PssSK as PssSK
-from .PssWECC import PssWECC as PssWECC
-from .Quality61850 import Quality61850 as Quality61850
-from .RaiseLowerCommand import RaiseLowerCommand as RaiseLowerCommand
-from .RatioTapChanger import RatioTapChanger as RatioTapChanger
-from .RatioTapChangerTable import RatioTapChangerTable as RatioTapChangerTable
-from .RatioTapChangerTablePoint import RatioTapChangerTablePoint as RatioTapChangerTablePoint
-from .Reactance import Reactance as Reactance
-from .ReactiveCapabilityCurve import ReactiveCapabilityCurve as ReactiveCapabilityCurve
-from .ReactivePower import ReactivePower as ReactivePower
-from .RegularIntervalSchedule import RegularIntervalSchedule as RegularIntervalSchedule
-from .RegularTimePoint import RegularTimePoint as RegularTimePoint
-from .RegulatingCondEq import RegulatingCondEq as RegulatingCondEq
-from .RegulatingControl import RegulatingControl as RegulatingControl
-from .RegulatingControlModeKind import RegulatingControlModeKind as RegulatingControlModeKind
-from .RegulationSchedule import RegulationSchedule as RegulationSchedule
-from .RemoteInputSignal import RemoteInputSignal as RemoteInputSignal
-from .RemoteSignalKind import RemoteSignalKind as RemoteSignalKind
-from .ReportingGroup import ReportingGroup as ReportingGroup
-from .Resistance import Resistance as Resistance
-from .ResistancePerLength import ResistancePerLength as ResistancePerLength
-from .RotatingMachine import RotatingMachine as RotatingMachine
-from .RotatingMachineDynamics import RotatingMachineDynamics as RotatingMachineDynamics
-from .RotationSpeed import RotationSpeed as RotationSpeed
-from .RotorKind import RotorKind as RotorKind
-from .SVCControlMode import SVCControlMode as SVCControlMode
-from .Season import Season as Season
-from .SeasonDayTypeSchedule import SeasonDayTypeSchedule as SeasonDayTypeSchedule
-from .Seconds import Seconds as Seconds
-from .SeriesCompensator import SeriesCompensator as SeriesCompensator
-from .SetPoint import SetPoint as SetPoint
-from .ShortCircuitRotorKind import ShortCircuitRotorKind as ShortCircuitRotorKind
-from .ShuntCompensator import ShuntCompensator as ShuntCompensator
-from .Simple_Float import Simple_Float as Simple_Float
-from .SolarGeneratingUnit import SolarGeneratingUnit as SolarGeneratingUnit
-from .Source import Source as Source
-from .StateVariablesVersion import StateVariablesVersion as StateVariablesVersion
-from .StaticLoadModelKind import StaticLoadModelKind as StaticLoadModelKind
-from .StaticVarCompensator import StaticVarCompensator as StaticVarCompensator
-from .StationSupply import StationSupply as StationSupply
-from .SteadyStateHypothesisVersion import SteadyStateHypothesisVersion as SteadyStateHypothesisVersion
-from .StringMeasurement import StringMeasurement as StringMeasurement
-from .StringMeasurementValue import StringMeasurementValue as StringMeasurementValue
-from .SubGeographicalRegion import SubGeographicalRegion as SubGeographicalRegion
-from .SubLoadArea import SubLoadArea as SubLoadArea
-from .Substation import Substation as Substation
-from .Susceptance import Susceptance as Susceptance
-from .SvInjection import SvInjection as SvInjection
-from .SvPowerFlow import SvPowerFlow as SvPowerFlow
-from .SvShuntCompensatorSections import SvShuntCompensatorSections as SvShuntCompensatorSections
-from .SvStatus import SvStatus as SvStatus
-from .SvTapStep import SvTapStep as SvTapStep
-from .SvVoltage import SvVoltage as SvVoltage
-from .Switch import Switch as Switch
-from .SwitchSchedule import SwitchSchedule as SwitchSchedule
-from .SynchronousMachine import SynchronousMachine as SynchronousMachine
-from .SynchronousMachineDetailed import SynchronousMachineDetailed as SynchronousMachineDetailed
-from .SynchronousMachineDynamics import SynchronousMachineDynamics as SynchronousMachineDynamics
-from .SynchronousMachineEquivalentCircuit import SynchronousMachineEquivalentCircuit as SynchronousMachineEquivalentCircuit
-from .SynchronousMachineKind import SynchronousMachineKind as SynchronousMachineKind
-from .SynchronousMachineModelKind import SynchronousMachineModelKind as SynchronousMachineModelKind
-from .SynchronousMachineOperatingMode import SynchronousMachineOperatingMode as SynchronousMachineOperatingMode
-from .SynchronousMachineSimplified import SynchronousMachineSimplified as SynchronousMachineSimplified
-from .SynchronousMachineTimeConstantReactance import SynchronousMachineTimeConstantReactance as SynchronousMachineTimeConstantReactance
-from .SynchronousMachineUserDefined import SynchronousMachineUserDefined as SynchronousMachineUserDefined
-from .TapChanger import TapChanger as TapChanger
-from .TapChangerControl import TapChangerControl as TapChangerControl
-from .TapChangerTablePoint import TapChangerTablePoint as TapChangerTablePoint
-from .TapSchedule import TapSchedule as TapSchedule
-from .Temperature import Temperature as Temperature
-from .Terminal import Terminal as Terminal
-from .TextDiagramObject import TextDiagramObject as TextDiagramObject
-from .ThermalGeneratingUnit import ThermalGeneratingUnit as ThermalGeneratingUnit
-from .TieFlow import TieFlow as TieFlow
-from .TopologicalIsland import TopologicalIsland as TopologicalIsland
-from .TopologicalNode import TopologicalNode as TopologicalNode
-from .TopologyBoundaryVersion import TopologyBoundaryVersion as TopologyBoundaryVersion
-from .TopologyVersion import TopologyVersion as TopologyVersion
-from .TransformerControlMode import TransformerControlMode as TransformerControlMode
-from .TransformerEnd import TransformerEnd as TransformerEnd
-from .TurbLCFB1 import TurbLCFB1 as TurbLCFB1
-from .TurbineGovernorDynamics import TurbineGovernorDynamics as TurbineGovernorDynamics
-from .TurbineGovernorUserDefined import TurbineGovernorUserDefined as TurbineGovernorUserDefined
-from .TurbineLoadControllerDynamics import TurbineLoadControllerDynamics as TurbineLoadControllerDynamics
-from .TurbineLoadControllerUserDefined import TurbineLoadControllerUserDefined as TurbineLoadControllerUserDefined
-from .UnderexcLim2Simplified import UnderexcLim2Simplified as UnderexcLim2Simplified
-from .UnderexcLimIEEE1 import UnderexcLimIEEE1 as UnderexcLimIEEE1
-from .UnderexcLimIEEE2 import UnderexcLimIEEE2 as UnderexcLimIEEE2
-from .UnderexcLimX1 import UnderexcLimX1 as UnderexcLimX1
-from .UnderexcLimX2 import UnderexcLimX2 as UnderexcLimX2
-from .UnderexcitationLimiterDynamics import UnderexcitationLimiterDynamics as UnderexcitationLimiterDynamics
-from .UnderexcitationLimiterUserDefined import UnderexcitationLimiterUserDefined as UnderexcitationLimiterUserDefined
-from .UnitMultiplier import UnitMultiplier as UnitMultiplier
-from .UnitSymbol import UnitSymbol as UnitSymbol
-from .VAdjIEEE import VAdjIEEE as VAdjIEEE
-from .VCompIEEEType1 import VCompIEEEType1 as VCompIEEEType1
-from .VCompIEEEType2 import VCompIEEEType2 as VCompIEEEType2
-from .Validity import Validity as Validity
-from .ValueAliasSet import ValueAliasSet as ValueAliasSet
-from .ValueToAlias import ValueToAlias as ValueToAlias
-from .VisibilityLayer import VisibilityLayer as VisibilityLayer
-from .Voltage import Voltage as Voltage
-from .VoltageAdjusterDynamics import VoltageAdjusterDynamics as VoltageAdjusterDynamics
-from .VoltageAdjusterUserDefined import VoltageAdjusterUserDefined as VoltageAdjusterUserDefined
-from .VoltageCompensatorDynamics import VoltageCompensatorDynamics as VoltageCompensatorDynamics
-from .VoltageCompensatorUserDefined import VoltageCompensatorUserDefined as VoltageCompensatorUserDefined
-from .VoltageLevel import VoltageLevel as VoltageLevel
-from .VoltageLimit import VoltageLimit as VoltageLimit
-from .VoltagePerReactivePower import VoltagePerReactivePower as VoltagePerReactivePower
-from .VolumeFlowRate import VolumeFlowRate as VolumeFlowRate
-from .VsCapabilityCurve import VsCapabilityCurve as VsCapabilityCurve
-from .VsConverter import VsConverter as VsConverter
-from .VsPpccControlKind import VsPpccControlKind as VsPpccControlKind
-from .VsQpccControlKind import VsQpccControlKind as VsQpccControlKind
-from .WindAeroConstIEC import WindAeroConstIEC as WindAeroConstIEC
-from .WindAeroLinearIEC import WindAeroLinearIEC as WindAeroLinearIEC
-from .WindContCurrLimIEC import WindContCurrLimIEC as WindContCurrLimIEC
-from .WindContPType3IEC import WindContPType3IEC as WindContPType3IEC
-from .WindContPType4aIEC import WindContPType4aIEC as WindContPType4aIEC
-from .WindContPType4bIEC import WindContPType4bIEC as WindContPType4bIEC
-from .WindContPitchAngleIEC import WindContPitchAngleIEC as WindContPitchAngleIEC
-from .WindContQIEC import WindContQIEC as WindContQIEC
-from .WindContRotorRIEC import WindContRotorRIEC as WindContRotorRIEC
-from .WindDynamicsLookupTable import WindDynamicsLookupTable as WindDynamicsLookupTable
-from .WindGenTurbineType1IEC import WindGenTurbineType1IEC as WindGenTurbineType1IEC
-from .WindGenTurbineType2IEC import WindGenTurbineType2IEC as WindGenTurbineType2IEC
-from .WindGenTurbineType3IEC import WindGenTurbineType3IEC as WindGenTurbineType3IEC
-from .WindGenTurbineType3aIEC import WindGenTurbineType3aIEC as WindGenTurbineType3aIEC
-from .WindGenTurbineType3bIEC import WindGenTurbineType3bIEC as WindGenTurbineType3bIEC
-from .WindGenType4IEC import WindGenType4IEC as WindGenType4IEC
-from .WindGenUnitKind import WindGenUnitKind as WindGenUnitKind
-from .WindGeneratingUnit import WindGeneratingUnit as WindGeneratingUnit
-from .WindLVRTQcontrolModesKind import WindLVRTQcontrolModesKind as WindLVRTQcontrolModesKind
-from .WindLookupTableFunctionKind import WindLookupTableFunctionKind as WindLookupTableFunctionKind
-from .WindMechIEC import WindMechIEC as WindMechIEC
-from .WindPitchContEmulIEC import WindPitchContEmulIEC as WindPitchContEmulIEC
-from .WindPlantDynamics import WindPlantDynamics as WindPlantDynamics
-from .WindPlantFreqPcontrolIEC import WindPlantFreqPcontrolIEC as WindPlantFreqPcontrolIEC
-from .WindPlantIEC import WindPlantIEC as WindPlantIEC
-from .WindPlantReactiveControlIEC import WindPlantReactiveControlIEC as WindPlantReactiveControlIEC
-from .WindPlantUserDefined import WindPlantUserDefined as WindPlantUserDefined
-from .WindProtectionIEC import WindProtectionIEC as WindProtectionIEC
-from .WindQcontrolModesKind import WindQcontrolModesKind as WindQcontrolModesKind
-from .WindTurbineType1or2Dynamics import WindTurbineType1or2Dynamics as WindTurbineType1or2Dynamics
-from .WindTurbineType1or2IEC import WindTurbineType1or2IEC as WindTurbineType1or2IEC
-from .WindTurbineType3or4Dynamics import WindTurbineType3or4Dynamics as WindTurbineType3or4Dynamics
-from .WindTurbineType3or4IEC import WindTurbineType3or4IEC as WindTurbineType3or4IEC
-from .WindTurbineType4aIEC import WindTurbineType4aIEC as WindTurbineType4aIEC
-from .WindTurbineType4bIEC import WindTurbineType4bIEC as WindTurbineType4bIEC
-from .WindType1or2UserDefined import WindType1or2UserDefined as WindType1or2UserDefined
-from .WindType3or4UserDefined import WindType3or4UserDefined as WindType3or4UserDefined
-from .WindingConnection import WindingConnection as WindingConnection
+"""Classes of CGMES 2.4.15
+
+Each class is defined in the module of the same name. The classes are imported on first access, e.g.
+``cimpy.cgmes_v2_4_15.ACLineSegment`` imports the module ACLineSegment with its parent classes, so importing the package
+does not import the modules of all classes.
+"""
+import importlib
+import sys
+import types
+
+# Module of each class {class name: module name relative to this package}
+_CLASS_MODULES = {
+    "ACDCConverter": ".ACDCConverter",
+    "ACDCConverterDCTerminal": ".ACDCConverterDCTerminal",
+    "ACDCTerminal": ".ACDCTerminal",
+    "ACLineSegment": ".ACLineSegment",
+    "Accumulator": ".Accumulator",
+    "AccumulatorLimit": ".AccumulatorLimit",
+    "AccumulatorLimitSet": ".AccumulatorLimitSet",
+    "AccumulatorReset": ".AccumulatorReset",
+    "AccumulatorValue": ".AccumulatorValue",
+    "ActivePower": ".ActivePower",
+    "ActivePowerLimit": ".ActivePowerLimit",
+    "ActivePowerPerCurrentFlow": ".ActivePowerPerCurrentFlow",
+    "ActivePowerPerFrequency": ".ActivePowerPerFrequency",
+    "Analog": ".Analog",
+    "AnalogControl": ".AnalogControl",
+    "AnalogLimit": ".AnalogLimit",
+    "AnalogLimitSet": ".AnalogLimitSet",
+    "AnalogValue": ".AnalogValue",
+    "AngleDegrees": ".AngleDegrees",
+    "AngleRadians": ".AngleRadians",
+    "ApparentPower": ".ApparentPower",
+    "ApparentPowerLimit": ".ApparentPowerLimit",
+    "Area": ".Area",
+    "AsynchronousMachine": ".AsynchronousMachine",
+    "AsynchronousMachineDynamics": ".AsynchronousMachineDynamics",
+    "AsynchronousMachineEquivalentCircuit": ".AsynchronousMachineEquivalentCircuit",
+    "AsynchronousMachineKind": ".AsynchronousMachineKind",
+    "AsynchronousMachineTimeConstantReactance": ".AsynchronousMachineTimeConstantReactance",
+    "AsynchronousMachineUserDefined": ".AsynchronousMachineUserDefined",
+    "Base": ".Base",
+    "BaseVoltage": ".BaseVoltage",
+    "BasicIntervalSchedule": ".BasicIntervalSchedule",
+    "Bay": ".Bay",
+    "Boolean": ".Boolean",
+    "Breaker": ".Breaker",
+    "BusNameMarker": ".BusNameMarker",
+    "BusbarSection": ".BusbarSection",
+    "Capacitance": ".Capacitance",
+    "CapacitancePerLength": ".CapacitancePerLength",
+    "Command": ".Command",
+    "Conductance": ".Conductance",
+    "ConductingEquipment": ".ConductingEquipment",
+    "Conductor": ".Conductor",
+    "ConformLoad": ".ConformLoad",
+    "ConformLoadGroup": ".ConformLoadGroup",
+    "ConformLoadSchedule": ".ConformLoadSchedule",
+    "ConnectivityNode": ".ConnectivityNode",
+    "ConnectivityNodeContainer": ".ConnectivityNodeContainer",
+    "Connector": ".Connector",
+    "Control": ".Control",
+    "ControlArea": ".ControlArea",
+    "ControlAreaGeneratingUnit": ".ControlAreaGeneratingUnit",
+    "ControlAreaTypeKind": ".ControlAreaTypeKind",
+    "CoordinateSystem": ".CoordinateSystem",
+    "CsConverter": ".CsConverter",
+    "CsOperatingModeKind": ".CsOperatingModeKind",
+    "CsPpccControlKind": ".CsPpccControlKind",
+    "Currency": ".Currency",
+    "CurrentFlow": ".CurrentFlow",
+    "CurrentLimit": ".CurrentLimit",
+    "Curve": ".Curve",
+    "CurveData": ".CurveData",
+    "CurveStyle": ".CurveStyle",
+    "DCBaseTerminal": ".DCBaseTerminal",
+    "DCBreaker": ".DCBreaker",
+    "DCBusbar": ".DCBusbar",
+    "DCChopper": ".DCChopper",
+    "DCConductingEquipment": ".DCConductingEquipment",
+    "DCConverterOperatingModeKind": ".DCConverterOperatingModeKind",
+    "DCConverterUnit": ".DCConverterUnit",
+    "DCDisconnector": ".DCDisconnector",
+    "DCEquipmentContainer": ".DCEquipmentContainer",
+    "DCGround": ".DCGround",
+    "DCLine": ".DCLine",
+    "DCLineSegment": ".DCLineSegment",
+    "DCNode": ".DCNode",
+    "DCPolarityKind": ".DCPolarityKind",
+    "DCSeriesDevice": ".DCSeriesDevice",
+    "DCShunt": ".DCShunt",
+    "DCSwitch": ".DCSwitch",
+    "DCTerminal": ".DCTerminal",
+    "DCTopologicalIsland": ".DCTopologicalIsland",
+    "DCTopologicalNode": ".DCTopologicalNode",
+    "Date": ".Date",
+    "DateTime": ".DateTime",
+    "DayType": ".DayType",
+    "Decimal": ".Decimal",
+    "Diagram": ".Diagram",
+    "DiagramLayoutVersion": ".DiagramLayoutVersion",
+    "DiagramObject": ".DiagramObject",
+    "DiagramObjectGluePoint": ".DiagramObjectGluePoint",
+    "DiagramObjectPoint": ".DiagramObjectPoint",
+    "DiagramObjectStyle": ".DiagramObjectStyle",
+    "DiagramStyle": ".DiagramStyle",
+    "DiscExcContIEEEDEC1A": ".DiscExcContIEEEDEC1A",
+    "DiscExcContIEEEDEC2A": ".DiscExcContIEEEDEC2A",
+    "DiscExcContIEEEDEC3A": ".DiscExcContIEEEDEC3A",
+    "Disconnector": ".Disconnector",
+    "DiscontinuousExcitationControlDynamics": ".DiscontinuousExcitationControlDynamics",
+    "DiscontinuousExcitationControlUserDefined": ".DiscontinuousExcitationControlUserDefined",
+    "Discrete": ".Discrete",
+    "DiscreteValue": ".DiscreteValue",
+    "DroopSignalFeedbackKind": ".DroopSignalFeedbackKind",
+    "DynamicsFunctionBlock": ".DynamicsFunctionBlock",
+    "DynamicsVersion": ".DynamicsVersion",
+    "EarthFaultCompensator": ".EarthFaultCompensator",
+    "EnergyArea": ".EnergyArea",
+    "EnergyConsumer": ".EnergyConsumer",
+    "EnergySchedulingType": ".EnergySchedulingType",
+    "EnergySource": ".EnergySource",
+    "Equipment": ".Equipment",
+    "EquipmentBoundaryVersion": ".EquipmentBoundaryVersion",
+    "EquipmentContainer": ".EquipmentContainer",
+    "EquipmentVersion": ".EquipmentVersion",
+    "EquivalentBranch": ".EquivalentBranch",
+    "EquivalentEquipment": ".EquivalentEquipment",
+    "EquivalentInjection": ".EquivalentInjection",
+    "EquivalentNetwork": ".EquivalentNetwork",
+    "EquivalentShunt": ".EquivalentShunt",
+    "ExcAC1A": ".ExcAC1A",
+    "ExcAC2A": ".ExcAC2A",
+    "ExcAC3A": ".ExcAC3A",
+    "ExcAC4A": ".ExcAC4A",
+    "ExcAC5A": ".ExcAC5A",
+    "ExcAC6A": ".ExcAC6A",
+    "ExcAC8B": ".ExcAC8B",
+    "ExcANS": ".ExcANS",
+    "ExcAVR1": ".ExcAVR1",
+    "ExcAVR2": ".ExcAVR2",
+    "ExcAVR3": ".ExcAVR3",
+    "ExcAVR4": ".ExcAVR4",
+    "ExcAVR5": ".ExcAVR5",
+    "ExcAVR7": ".ExcAVR7",
+    "ExcBBC": ".ExcBBC",
+    "ExcCZ": ".ExcCZ",
+    "ExcDC1A": ".ExcDC1A",
+    "ExcDC2A": ".ExcDC2A",
+    "ExcDC3A": ".ExcDC3A",
+    "ExcDC3A1": ".ExcDC3A1",
+    "ExcELIN1": ".ExcELIN1",
+    "ExcELIN2": ".ExcELIN2",
+    "ExcHU": ".ExcHU",
+    "ExcIEEEAC1A": ".ExcIEEEAC1A",
+    "ExcIEEEAC2A": ".ExcIEEEAC2A",
+    "ExcIEEEAC3A": ".ExcIEEEAC3A",
+    "ExcIEEEAC4A": ".ExcIEEEAC4A",
+    "ExcIEEEAC5A": ".ExcIEEEAC5A",
+    "ExcIEEEAC6A": ".ExcIEEEAC6A",
+    "ExcIEEEAC7B": ".ExcIEEEAC7B",
+    "ExcIEEEAC8B": ".ExcIEEEAC8B",
+    "ExcIEEEDC1A": ".ExcIEEEDC1A",
+    "ExcIEEEDC2A": ".ExcIEEEDC2A",
+    "ExcIEEEDC3A": ".ExcIEEEDC3A",
+    "ExcIEEEDC4B": ".ExcIEEEDC4B",
+    "ExcIEEEST1A": ".ExcIEEEST1A",
+    "ExcIEEEST1AUELselectorKind": ".ExcIEEEST1AUELselectorKind",
+    "ExcIEEEST2A": ".ExcIEEEST2A",
+    "ExcIEEEST3A": ".ExcIEEEST3A",
+    "ExcIEEEST4B": ".ExcIEEEST4B",
+    "ExcIEEEST5B": ".ExcIEEEST5B",
+    "ExcIEEEST6B": ".ExcIEEEST6B",
+    "ExcIEEEST7B": ".ExcIEEEST7B",
+    "ExcOEX3T": ".ExcOEX3T",
+    "ExcPIC": ".ExcPIC",
+    "ExcREXS": ".ExcREXS",
+    "ExcREXSFeedbackSignalKind": ".ExcREXSFeedbackSignalKind",
+    "ExcSCRX": ".ExcSCRX",
+    "ExcSEXS": ".ExcSEXS",
+    "ExcSK": ".ExcSK",
+    "ExcST1A": ".ExcST1A",
+    "ExcST2A": ".ExcST2A",
+    "ExcST3A": ".ExcST3A",
+    "ExcST4B": ".ExcST4B",
+    "ExcST6B": ".ExcST6B",
+    "ExcST6BOELselectorKind": ".ExcST6BOELselectorKind",
+    "ExcST7B": ".ExcST7B",
+    "ExcST7BOELselectorKind": ".ExcST7BOELselectorKind",
+    "ExcST7BUELselectorKind": ".ExcST7BUELselectorKind",
+    "ExcitationSystemDynamics": ".ExcitationSystemDynamics",
+    "ExcitationSystemUserDefined": ".ExcitationSystemUserDefined",
+    "ExternalNetworkInjection": ".ExternalNetworkInjection",
+    "Float": ".Float",
+    "FossilFuel": ".FossilFuel",
+    "FrancisGovernorControlKind": ".FrancisGovernorControlKind",
+    "Frequency": ".Frequency",
+    "FuelType": ".FuelType",
+    "GenICompensationForGenJ": ".GenICompensationForGenJ",
+    "GeneratingUnit": ".GeneratingUnit",
+    "GeneratorControlSource": ".GeneratorControlSource",
+    "GenericNonLinearLoadModelKind": ".GenericNonLinearLoadModelKind",
+    "GeographicalLocationVersion": ".GeographicalLocationVersion",
+    "GeographicalRegion": ".GeographicalRegion",
+    "GovCT1": ".GovCT1",
+    "GovCT2": ".GovCT2",
+    "GovGAST": ".GovGAST",
+    "GovGAST1": ".GovGAST1",
+    "GovGAST2": ".GovGAST2",
+    "GovGAST3": ".GovGAST3",
+    "GovGAST4": ".GovGAST4",
+    "GovGASTWD": ".GovGASTWD",
+    "GovHydro1": ".GovHydro1",
+    "GovHydro2": ".GovHydro2",
+    "GovHydro3": ".GovHydro3",
+    "GovHydro4": ".GovHydro4",
+    "GovHydroDD": ".GovHydroDD",
+    "GovHydroFrancis": ".GovHydroFrancis",
+    "GovHydroIEEE0": ".GovHydroIEEE0",
+    "GovHydroIEEE2": ".GovHydroIEEE2",
+    "GovHydroPID": ".GovHydroPID",
+    "GovHydroPID2": ".GovHydroPID2",
+    "GovHydroPelton": ".GovHydroPelton",
+    "GovHydroR": ".GovHydroR",
+    "GovHydroWEH": ".GovHydroWEH",
+    "GovHydroWPID": ".GovHydroWPID",
+    "GovSteam0": ".GovSteam0",
+    "GovSteam1": ".GovSteam1",
+    "GovSteam2": ".GovSteam2",
+    "GovSteamCC": ".GovSteamCC",
+    "GovSteamEU": ".GovSteamEU",
+    "GovSteamFV2": ".GovSteamFV2",
+    "GovSteamFV3": ".GovSteamFV3",
+    "GovSteamFV4": ".GovSteamFV4",
+    "GovSteamIEEE1": ".GovSteamIEEE1",
+    "GovSteamSGO": ".GovSteamSGO",
+    "GrossToNetActivePowerCurve": ".GrossToNetActivePowerCurve",
+    "Ground": ".Ground",
+    "GroundDisconnector": ".GroundDisconnector",
+    "GroundingImpedance": ".GroundingImpedance",
+    "HydroEnergyConversionKind": ".HydroEnergyConversionKind",
+    "HydroGeneratingUnit": ".HydroGeneratingUnit",
+    "HydroPlantStorageKind": ".HydroPlantStorageKind",
+    "HydroPowerPlant": ".HydroPowerPlant",
+    "HydroPump": ".HydroPump",
+    "IdentifiedObject": ".IdentifiedObject",
+    "IfdBaseKind": ".IfdBaseKind",
+    "Inductance": ".Inductance",
+    "InductancePerLength": ".InductancePerLength",
+    "InputSignalKind": ".InputSignalKind",
+    "Integer": ".Integer",
+    "Junction": ".Junction",
+    "Length": ".Length",
+    "Limit": ".Limit",
+    "LimitSet": ".LimitSet",
+    "LimitTypeKind": ".LimitTypeKind",
+    "Line": ".Line",
+    "LinearShuntCompensator": ".LinearShuntCompensator",
+    "LoadAggregate": ".LoadAggregate",
+    "LoadArea": ".LoadArea",
+    "LoadBreakSwitch": ".LoadBreakSwitch",
+    "LoadComposite": ".LoadComposite",
+    "LoadDynamics": ".LoadDynamics",
+    "LoadGenericNonLinear": ".LoadGenericNonLinear",
+    "LoadGroup": ".LoadGroup",
+    "LoadMotor": ".LoadMotor",
+    "LoadResponseCharacteristic": ".LoadResponseCharacteristic",
+    "LoadStatic": ".LoadStatic",
+    "LoadUserDefined": ".LoadUserDefined",
+    "Location": ".Location",
+    "Measurement": ".Measurement",
+    "MeasurementValue": ".MeasurementValue",
+    "MeasurementValueQuality": ".MeasurementValueQuality",
+    "MeasurementValueSource": ".MeasurementValueSource",
+    "MechLoad1": ".MechLoad1",
+    "MechanicalLoadDynamics": ".MechanicalLoadDynamics",
+    "MechanicalLoadUserDefined": ".MechanicalLoadUserDefined",
+    "Money": ".Money",
+    "MonthDay": ".MonthDay",
+    "MutualCoupling": ".MutualCoupling",
+    "NonConformLoad": ".NonConformLoad",
+    "NonConformLoadGroup": ".NonConformLoadGroup",
+    "NonConformLoadSchedule": ".NonConformLoadSchedule",
+    "NonlinearShuntCompensator": ".NonlinearShuntCompensator",
+    "NonlinearShuntCompensatorPoint": ".NonlinearShuntCompensatorPoint",
+    "NuclearGeneratingUnit": ".NuclearGeneratingUnit",
+    "OperationalLimit": ".OperationalLimit",
+    "OperationalLimitDirectionKind": ".OperationalLimitDirectionKind",
+    "OperationalLimitSet": ".OperationalLimitSet",
+    "OperationalLimitType": ".OperationalLimitType",
+    "OrientationKind": ".OrientationKind",
+    "OverexcLim2": ".OverexcLim2",
+    "OverexcLimIEEE": ".OverexcLimIEEE",
+    "OverexcLimX1": ".OverexcLimX1",
+    "OverexcLimX2": ".OverexcLimX2",
+    "OverexcitationLimiterDynamics": ".OverexcitationLimiterDynamics",
+    "OverexcitationLimiterUserDefined": ".OverexcitationLimiterUserDefined",
+    "PFVArControllerType1Dynamics": ".PFVArControllerType1Dynamics",
+    "PFVArControllerType1UserDefined": ".PFVArControllerType1UserDefined",
+    "PFVArControllerType2Dynamics": ".PFVArControllerType2Dynamics",
+    "PFVArControllerType2UserDefined": ".PFVArControllerType2UserDefined",
+    "PFVArType1IEEEPFController": ".PFVArType1IEEEPFController",
+    "PFVArType1IEEEVArController": ".PFVArType1IEEEVArController",
+    "PFVArType2Common1": ".PFVArType2Common1",
+    "PFVArType2IEEEPFController": ".PFVArType2IEEEPFController",
+    "PFVArType2IEEEVArController": ".PFVArType2IEEEVArController",
+    "PU": ".PU",
+    "PerCent": ".PerCent",
+    "PerLengthDCLineParameter": ".PerLengthDCLineParameter",
+    "PetersenCoil": ".PetersenCoil",
+    "PetersenCoilModeKind": ".PetersenCoilModeKind",
+    "PhaseCode": ".PhaseCode",
+    "PhaseTapChanger": ".PhaseTapChanger",
+    "PhaseTapChangerAsymmetrical": ".PhaseTapChangerAsymmetrical",
+    "PhaseTapChangerLinear": ".PhaseTapChangerLinear",
+    "PhaseTapChangerNonLinear": ".PhaseTapChangerNonLinear",
+    "PhaseTapChangerSymmetrical": ".PhaseTapChangerSymmetrical",
+    "PhaseTapChangerTable": ".PhaseTapChangerTable",
+    "PhaseTapChangerTablePoint": ".PhaseTapChangerTablePoint",
+    "PhaseTapChangerTabular": ".PhaseTapChangerTabular",
+    "PositionPoint": ".PositionPoint",
+    "PowerSystemResource": ".PowerSystemResource",
+    "PowerSystemStabilizerDynamics": ".PowerSystemStabilizerDynamics",
+    "PowerSystemStabilizerUserDefined": ".PowerSystemStabilizerUserDefined",
+    "PowerTransformer": ".PowerTransformer",
+    "PowerTransformerEnd": ".PowerTransformerEnd",
+    "ProprietaryParameterDynamics": ".ProprietaryParameterDynamics",
+    "ProtectedSwitch": ".ProtectedSwitch",
+    "Pss1": ".Pss1",
+    "Pss1A": ".Pss1A",
+    "Pss2B": ".Pss2B",
+    "Pss2ST": ".Pss2ST",
+    "Pss5": ".Pss5",
+    "PssELIN2": ".PssELIN2",
+    "PssIEEE1A": ".PssIEEE1A",
+    "PssIEEE2B": ".PssIEEE2B",
+    "PssIEEE3B": ".PssIEEE3B",
+    "PssIEEE4B": ".PssIEEE4B",
+    "PssPTIST1": ".PssPTIST1",
+    "PssPTIST3": ".PssPTIST3",
+    "PssSB4": ".PssSB4",
+    "PssSH": ".PssSH",
+    "PssSK": ".PssSK",
+    "PssWECC": ".PssWECC",
+    "Quality61850": ".Quality61850",
+    "RaiseLowerCommand": ".RaiseLowerCommand",
+    "RatioTapChanger": ".RatioTapChanger",
+    "RatioTapChangerTable": ".RatioTapChangerTable",
+    "RatioTapChangerTablePoint": ".RatioTapChangerTablePoint",
+    "Reactance": ".Reactance",
+    "ReactiveCapabilityCurve": ".ReactiveCapabilityCurve",
+    "ReactivePower": ".ReactivePower",
+    "RegularIntervalSchedule": ".RegularIntervalSchedule",
+    "RegularTimePoint": ".RegularTimePoint",
+    "RegulatingCondEq": ".RegulatingCondEq",
+    "RegulatingControl": ".RegulatingControl",
+    "RegulatingControlModeKind": ".RegulatingControlModeKind",
+    "RegulationSchedule": ".RegulationSchedule",
+    "RemoteInputSignal": ".RemoteInputSignal",
+    "RemoteSignalKind": ".RemoteSignalKind",
+    "ReportingGroup": ".ReportingGroup",
+    "Resistance": ".Resistance",
+    "ResistancePerLength": ".ResistancePerLength",
+    "RotatingMachine": ".RotatingMachine",
+    "RotatingMachineDynamics": ".RotatingMachineDynamics",
+    "RotationSpeed": ".RotationSpeed",
+    "RotorKind": ".RotorKind",
+    "SVCControlMode": ".SVCControlMode",
+    "Season": ".Season",
+    "SeasonDayTypeSchedule": ".SeasonDayTypeSchedule",
+    "Seconds": ".Seconds",
+    "SeriesCompensator": ".SeriesCompensator",
+    "SetPoint": ".SetPoint",
+    "ShortCircuitRotorKind": ".ShortCircuitRotorKind",
+    "ShuntCompensator": ".ShuntCompensator",
+    "Simple_Float": ".Simple_Float",
+    "SolarGeneratingUnit": ".SolarGeneratingUnit",
+    "Source": ".Source",
+    "StateVariablesVersion": ".StateVariablesVersion",
+    "StaticLoadModelKind": ".StaticLoadModelKind",
+    "StaticVarCompensator": ".StaticVarCompensator",
+    "StationSupply": ".StationSupply",
+    "SteadyStateHypothesisVersion": ".SteadyStateHypothesisVersion",
+    "StringMeasurement": ".StringMeasurement",
+    "StringMeasurementValue": ".StringMeasurementValue",
+    "SubGeographicalRegion": ".SubGeographicalRegion",
+    "SubLoadArea": ".SubLoadArea",
+    "Substation": ".Substation",
+    "Susceptance": ".Susceptance",
+    "SvInjection": ".SvInjection",
+    "SvPowerFlow": ".SvPowerFlow",
+    "SvShuntCompensatorSections": ".SvShuntCompensatorSections",
+    "SvStatus": ".SvStatus",
+    "SvTapStep": ".SvTapStep",
+    "SvVoltage": ".SvVoltage",
+    "Switch": ".Switch",
+    "SwitchSchedule": ".SwitchSchedule",
+    "SynchronousMachine": ".SynchronousMachine",
+    "SynchronousMachineDetailed": ".SynchronousMachineDetailed",
+    "SynchronousMachineDynamics": ".SynchronousMachineDynamics",
+    "SynchronousMachineEquivalentCircuit": ".SynchronousMachineEquivalentCircuit",
+    "SynchronousMachineKind": ".SynchronousMachineKind",
+    "SynchronousMachineModelKind": ".SynchronousMachineModelKind",
+    "SynchronousMachineOperatingMode": ".SynchronousMachineOperatingMode",
+    "SynchronousMachineSimplified": ".SynchronousMachineSimplified",
+    "SynchronousMachineTimeConstantReactance": ".SynchronousMachineTimeConstantReactance",
+    "SynchronousMachineUserDefined": ".SynchronousMachineUserDefined",
+    "TapChanger": ".TapChanger",
+    "TapChangerControl": ".TapChangerControl",
+    "TapChangerTablePoint": ".TapChangerTablePoint",
+    "TapSchedule": ".TapSchedule",
+    "Temperature": ".Temperature",
+    "Terminal": ".Terminal",
+    "TextDiagramObject": ".TextDiagramObject",
+    "ThermalGeneratingUnit": ".ThermalGeneratingUnit",
+    "TieFlow": ".TieFlow",
+    "TopologicalIsland": ".TopologicalIsland",
+    "TopologicalNode": ".TopologicalNode",
+    "TopologyBoundaryVersion": ".TopologyBoundaryVersion",
+    "TopologyVersion": ".TopologyVersion",
+    "TransformerControlMode": ".TransformerControlMode",
+    "TransformerEnd": ".TransformerEnd",
+    "TurbLCFB1": ".TurbLCFB1",
+    "TurbineGovernorDynamics": ".TurbineGovernorDynamics",
+    "TurbineGovernorUserDefined": ".TurbineGovernorUserDefined",
+    "TurbineLoadControllerDynamics": ".TurbineLoadControllerDynamics",
+    "TurbineLoadControllerUserDefined": ".TurbineLoadControllerUserDefined",
+    "UnderexcLim2Simplified": ".UnderexcLim2Simplified",
+    "UnderexcLimIEEE1": ".UnderexcLimIEEE1",
+    "UnderexcLimIEEE2": ".UnderexcLimIEEE2",
+    "UnderexcLimX1": ".UnderexcLimX1",
+    "UnderexcLimX2": ".UnderexcLimX2",
+    "UnderexcitationLimiterDynamics": ".UnderexcitationLimiterDynamics",
+    "UnderexcitationLimiterUserDefined": ".UnderexcitationLimiterUserDefined",
+    "UnitMultiplier": ".UnitMultiplier",
+    "UnitSymbol": ".UnitSymbol",
+    "VAdjIEEE": ".VAdjIEEE",
+    "VCompIEEEType1": ".VCompIEEEType1",
+    "VCompIEEEType2": ".VCompIEEEType2",
+    "Validity": ".Validity",
+    "ValueAliasSet": ".ValueAliasSet",
+    "ValueToAlias": ".ValueToAlias",
+    "VisibilityLayer": ".VisibilityLayer",
+    "Voltage": ".Voltage",
+    "VoltageAdjusterDynamics": ".VoltageAdjusterDynamics",
+    "VoltageAdjusterUserDefined": ".VoltageAdjusterUserDefined",
+    "VoltageCompensatorDynamics": ".VoltageCompensatorDynamics",
+    "VoltageCompensatorUserDefined": ".VoltageCompensatorUserDefined",
+    "VoltageLevel": ".VoltageLevel",
+    "VoltageLimit": ".VoltageLimit",
+    "VoltagePerReactivePower": ".VoltagePerReactivePower",
+    "VolumeFlowRate": ".VolumeFlowRate",
+    "VsCapabilityCurve": ".VsCapabilityCurve",
+    "VsConverter": ".VsConverter",
+    "VsPpccControlKind": ".VsPpccControlKind",
+    "VsQpccControlKind": ".VsQpccControlKind",
+    "WindAeroConstIEC": ".WindAeroConstIEC",
+    "WindAeroLinearIEC": ".WindAeroLinearIEC",
+    "WindContCurrLimIEC": ".WindContCurrLimIEC",
+    "WindContPType3IEC": ".WindContPType3IEC",
+    "WindContPType4aIEC": ".WindContPType4aIEC",
+    "WindContPType4bIEC": ".WindContPType4bIEC",
+    "WindContPitchAngleIEC": ".WindContPitchAngleIEC",
+    "WindContQIEC": ".WindContQIEC",
+    "WindContRotorRIEC": ".WindContRotorRIEC",
+    "WindDynamicsLookupTable": ".WindDynamicsLookupTable",
+    "WindGenTurbineType1IEC": ".WindGenTurbineType1IEC",
+    "WindGenTurbineType2IEC": ".WindGenTurbineType2IEC",
+    "WindGenTurbineType3IEC": ".WindGenTurbineType3IEC",
+    "WindGenTurbineType3aIEC": ".WindGenTurbineType3aIEC",
+    "WindGenTurbineType3bIEC": ".WindGenTurbineType3bIEC",
+    "WindGenType4IEC": ".WindGenType4IEC",
+    "WindGenUnitKind": ".WindGenUnitKind",
+    "WindGeneratingUnit": ".WindGeneratingUnit",
+    "WindLVRTQcontrolModesKind": ".WindLVRTQcontrolModesKind",
+    "WindLookupTableFunctionKind": ".WindLookupTableFunctionKind",
+    "WindMechIEC": ".WindMechIEC",
+    "WindPitchContEmulIEC": ".WindPitchContEmulIEC",
+    "WindPlantDynamics": ".WindPlantDynamics",
+    "WindPlantFreqPcontrolIEC": ".WindPlantFreqPcontrolIEC",
+    "WindPlantIEC": ".WindPlantIEC",
+    "WindPlantReactiveControlIEC": ".WindPlantReactiveControlIEC",
+    "WindPlantUserDefined": ".WindPlantUserDefined",
+    "WindProtectionIEC": ".WindProtectionIEC",
+    "WindQcontrolModesKind": ".WindQcontrolModesKind",
+    "WindTurbineType1or2Dynamics": ".WindTurbineType1or2Dynamics",
+    "WindTurbineType1or2IEC": ".WindTurbineType1or2IEC",
+    "WindTurbineType3or4Dynamics": ".WindTurbineType3or4Dynamics",
+    "WindTurbineType3or4IEC": ".WindTurbineType3or4IEC",
+    "WindTurbineType4aIEC": ".WindTurbineType4aIEC",
+    "WindTurbineType4bIEC": ".WindTurbineType4bIEC",
+    "WindType1or2UserDefined": ".WindType1or2UserDefined",
+    "WindType3or4UserDefined": ".WindType3or4UserDefined",
+    "WindingConnection": ".WindingConnection",
+}
+
+__all__ = list(_CLASS_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module_name = _CLASS_MODULES[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    klass = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = klass
+    return klass
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASS_MODULES))
+
+
+class _ClassPackage(types.ModuleType):
+    # The import system binds every imported module of a class to this package, e.g. Conductor when ACLineSegment
+    # imports its parent class. The class is bound instead, like the eager imports of the package did.
+    def __setattr__(self, name, value):
+        if name in _CLASS_MODULES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ClassPackage
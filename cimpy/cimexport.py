@@ -1,16 +1,32 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from time import time
 import chevron
-import copy
+import errno
 import importlib
+import io
 import logging
 import os
+import zipfile
 from cimpy.cgmes_v2_4_15.CGMESProfile import Profile
 
 
 logger = logging.getLogger(__name__)
 
+# Writers of cim_export
+_WRITERS = ("mustache", "stream")
+
+# Default size of the chunks of cim_export_iter in bytes
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Attributes of the classes exported in this process: {class: _ClassAttributes}
+_class_attributes = {}
+
+# Base class of each cgmes version: {version: Base}
+_base_classes = {}
+
 
 # This function gets all attributes of an object and resolves references to other objects
 def _get_class_attributes_with_references(import_result, version):
@@ -18,26 +34,60 @@ def _get_class_attributes_with_references(import_result, version):
     # Extract topology and urls
     topology = import_result["topology"]
     urls = import_result["meta_info"]["urls"]
+    references = import_result["meta_info"].get("overlay_references", {})
+    keys = _get_topology_keys(topology)
     for key in topology.keys():
         class_dict = dict(name=topology[key].__class__.__name__)
         class_dict["mRID"] = key
         # Array containing all attributes, attribute references to objects
         attributes_dict = _get_attributes(topology[key])
+        if key in references:
+            _apply_overlay_references(attributes_dict, topology[key], references[key])
         # Change attribute references to mRID of the object, res needed because classes like SvPowerFlow does not have
         # mRID as an attribute. Therefore the corresponding class has to be searched in the res dictionary
-        class_dict["attributes"] = _get_reference_uuid(attributes_dict, version, topology, key, urls)
+        class_dict["attributes"] = _get_reference_uuid(attributes_dict, version, keys, key, urls)
         class_attributes_list.append(class_dict)
         del class_dict
 
     return class_attributes_list
 
 
-# This function resolves references to objects
-def _get_reference_uuid(attr_dict, version, topology, mRID, urls):
+# Sets the inverse references an overlay import holds for obj, see cim_import_overlay, in the attributes_dict of obj.
+# Only the attributes already in attributes_dict are set.
+def _apply_overlay_references(attributes_dict, obj, references):
+    class_attributes = _get_class_attributes(obj.__class__)
+    for attribute, value in references.items():
+        if attribute in class_attributes.inherited_keys:
+            attribute_name = _get_qualified_attribute_name(obj.__class__, attribute)
+        else:
+            attribute_name = obj.__class__.__name__ + "." + attribute
+        if attribute_name in attributes_dict:
+            attributes_dict[attribute_name] = value
+
+
+# Returns the reverse index {id(object): key} of the topology. An object mapped to several keys is found by its first
+# key, like a search through the topology.
+def _get_topology_keys(topology):
+    keys = {}
+    for key, obj in topology.items():
+        keys.setdefault(id(obj), key)
+    return keys
+
+
+# Returns the Base class of the cgmes version
+def _get_base_class(version):
+    try:
+        return _base_classes[version]
+    except KeyError:
+        base_module = importlib.import_module("cimpy." + version + ".Base")
+        _base_classes[version] = getattr(base_module, "Base")
+        return _base_classes[version]
+
+
+# This function resolves references to objects. keys is the reverse index of the topology from _get_topology_keys.
+def _get_reference_uuid(attr_dict, version, keys, mRID, urls):
     reference_list = []
-    base_class_name = "cimpy." + version + ".Base"
-    base_module = importlib.import_module(base_class_name)
-    base_class = getattr(base_module, "Base")
+    base_class = _get_base_class(version)
     for key in attr_dict:
         if key in ["serializationProfile", "possibleProfileList", "recommendedClassProfile"]:
             reference_list.append({key: attr_dict[key]})
@@ -53,7 +103,7 @@ def _get_reference_uuid(attr_dict, version, topology, mRID, urls):
                     # The % added before the mRID is used in the lambda _set_attribute_or_reference
                     if not hasattr(elem, "mRID"):
                         # Search for the object in the res dictionary and return the mRID
-                        uuid = "%" + _search_mRID(elem, topology)
+                        uuid = "%" + _search_mRID(elem, keys)
                         if uuid == "%":
                             logger.warning(
                                 "Object of type %s not found as reference for object with UUID %s.",
@@ -75,7 +125,7 @@ def _get_reference_uuid(attr_dict, version, topology, mRID, urls):
             if not hasattr(attr_dict[key], "mRID"):
                 # Search for object in res dict and return mRID
                 # The % added before the mRID is used in the lambda _set_attribute_or_reference
-                uuid = "%" + _search_mRID(attr_dict[key], topology)
+                uuid = "%" + _search_mRID(attr_dict[key], keys)
                 if uuid == "%":
                     logger.warning(
                         "Object of type %s not found as reference for object with UUID %s.",
@@ -114,18 +164,19 @@ def _get_reference_uuid(attr_dict, version, topology, mRID, urls):
     return reference_list
 
 
-# This function searches a class_object in the res dictionary and returns the corresponding key (the mRID). Necessary
-# for classes without mRID as attribute like SvVoltage
-def _search_mRID(class_object, topology):
-    for id, class_obj in topology.items():
-        if class_object == class_obj:
-            return id
-    return ""
+# This function looks up a class_object in the reverse index of the res dictionary and returns the corresponding key
+# (the mRID). Necessary for classes without mRID as attribute like SvVoltage
+def _search_mRID(class_object, keys):
+    return keys.get(id(class_object), "")
 
 
 # Lambda function for chevron renderer to decide whether the current element is a reference or an attribute
 def _set_attribute_or_reference(text, render):
-    result = render(text)
+    return _attribute_or_reference(render(text))
+
+
+# Returns the end of an attribute or reference element from the rendered text 'value@attr_name'
+def _attribute_or_reference(result):
     result = result.split("@")
     value = result[0]
     attr_name = result[1]
@@ -141,7 +192,11 @@ def _set_attribute_or_reference(text, render):
 
 # Lambda function for chevron renderer to set an attribute or a reference in the model description.
 def _set_attribute_or_reference_model(text, render):
-    result = render(text)
+    return _attribute_or_reference_model(render(text))
+
+
+# Returns the end of an element of the model description from the rendered text 'value@attr_name'
+def _attribute_or_reference_model(result):
     result = result.split("@")
     value = result[0]
     attr_name = result[1]
@@ -181,9 +236,10 @@ def _sort_classes_to_profile(class_attributes_list, activeProfileList):
 
         # Store serializationProfile and possibleProfileList
         # serializationProfile class attribute, same for multiple instances
-        # of same class, only last origin of variable stored
-        serialization_profile = copy.deepcopy(klass["attributes"][0]["serializationProfile"])
-        possible_profile_list = copy.deepcopy(klass["attributes"][1]["possibleProfileList"])
+        # of same class, only last origin of variable stored. Both dictionaries are only read, the
+        # possibleProfileList is shared by all instances of the class.
+        serialization_profile = klass["attributes"][0]["serializationProfile"]
+        possible_profile_list = klass["attributes"][1]["possibleProfileList"]
         recommended_class_profile = klass["attributes"][2]["recommendedClassProfile"]
 
         class_serialization_profile = ""
@@ -334,7 +390,7 @@ def _sort_classes_to_profile(class_attributes_list, activeProfileList):
     return export_dict, export_about_dict
 
 
-def cim_export_to_string_array(import_result, model_name, version, activeProfileList=()):
+def cim_export_to_string_array(import_result, model_name, version, activeProfileList=(), writer="mustache"):
     """Function for serialization of cgmes classes to a list of strings
 
     See :func:`~cimpy.cimexport.cim_export()` for details.
@@ -345,18 +401,87 @@ def cim_export_to_string_array(import_result, model_name, version, activeProfile
     :param version: cgmes version, e.g. ``version="cgmes_v2_4_15"``
     :param activeProfileList: a list containing the strings of all short names of the profiles \
     used for serialization, no activeProfileList means output to all profile files with data
+    :param writer: "mustache" (default) renders each profile with the template engine chevron, "stream" writes the \
+    same text without the template engine, see :func:`~cimpy.cimexport.cim_export`
     :return: a list of strings with the CIM RDF/XML data
     """
+    if writer not in _WRITERS:
+        raise ValueError("writer must be one of {}, not {!r}".format(", ".join(_WRITERS), writer))
+
     result = []
     profile_list = list(map(lambda a: Profile[a], activeProfileList))
+    export_data = _prepare_export(import_result, version, profile_list)
     for profile in profile_list or [p for p in Profile]:
-        output = generate_xml(import_result, version, model_name, profile, profile_list)
+        if writer == "stream":
+            pieces = _stream_profile(export_data, model_name, profile, profile_list)
+            output = "".join(pieces) if pieces is not None else ""
+        else:
+            output = _render_profile(export_data, model_name, profile, profile_list)
         if output:
             result.append(output)
     return result
 
 
-def cim_export(import_result, file_name, version, activeProfileList=()):
+def cim_export_iter(import_result, model_name, version, activeProfileList=(), chunk_size=DEFAULT_CHUNK_SIZE):
+    """Function for serialization of cgmes classes to chunks of UTF-8 encoded bytes
+
+    The same text as :func:`~cimpy.cimexport.cim_export_to_string_array` with the "stream" writer is produced profile
+    by profile and yielded in chunks while it is written, e.g. to send it to a socket, a compressor or a hash function
+    without holding the text of a profile in memory:
+
+        for profile, chunk in cimpy.cim_export_iter(import_result, "Model", "cgmes_v2_4_15", ["EQ", "SV"]):
+            digests[profile].update(chunk)
+
+    The attributes of all objects are resolved when the first chunk is requested.
+
+    :param import_result: a dictionary containing the topology and meta information. It can be created via \
+    :func:`~cimpy.cimimport.cim_import()`
+    :param model_name: a string with the name of the model.
+    :param version: cgmes version, e.g. ``version="cgmes_v2_4_15"``
+    :param activeProfileList: a list containing the strings of all short names of the profiles \
+    used for serialization, no activeProfileList means output of all profiles with data
+    :param chunk_size: size of the chunks in bytes, only the last chunk of a profile is shorter
+    :return: an iterator over pairs (short name of the profile, bytes), e.g. ("EQ", b"<?xml ...")
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, not {!r}".format(chunk_size))
+
+    profile_list = list(map(lambda a: Profile[a], activeProfileList))
+    return _iter_export_chunks(import_result, model_name, version, profile_list, chunk_size)
+
+
+# Generator of cim_export_iter
+def _iter_export_chunks(import_result, model_name, version, profile_list, chunk_size):
+    export_data = _prepare_export(import_result, version, profile_list)
+    for profile in profile_list or [p for p in Profile]:
+        pieces = _stream_profile(export_data, model_name, profile, profile_list)
+        if pieces is not None:
+            for chunk in _iter_chunks(pieces, chunk_size):
+                yield profile.name, chunk
+
+
+# Encodes the text pieces and yields them in chunks of chunk_size bytes, the last chunk is shorter
+def _iter_chunks(pieces, chunk_size):
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece.encode("utf-8")
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    if buffer:
+        yield bytes(buffer)
+
+
+def cim_export(
+    import_result,
+    file_name,
+    version,
+    activeProfileList=(),
+    writer="mustache",
+    workers=None,
+    archive=None,
+    compression=zipfile.ZIP_DEFLATED,
+):
     """Function for serialization of cgmes classes
 
     This function serializes cgmes classes with the template engine chevron. The classes are separated by their profile
@@ -373,36 +498,150 @@ def cim_export(import_result, file_name, version, activeProfileList=()):
     accessible via the name of the attribute, \
     e.g. import_result['meta_info']['urls'}[attr_name] = {mapping like example above}. \
     'namespaces' is a dictionary containing all RDF namespaces used in the imported xml files.
-    :param file_name: a string with the name of the xml files which will be created
+    :param file_name: a string with the name of the xml files which will be created. A FileExistsError is raised if \
+    one of the files already exists, before any file is written.
     :param version: cgmes version, e.g. ``version="cgmes_v2_4_15"``
     :param activeProfileList: a list containing the strings of all short names of the profiles \
     used for serialization, no activeProfileList means output to all profile files with data
+    :param writer: "mustache" (default) renders each profile into one string with the template engine chevron \
+    before it is written. "stream" writes the header and every class and rdf:about element to the file as soon as \
+    it is formatted, without the template engine. The files are identical, but the memory used does not grow with \
+    the size of the files.
+    :param workers: number of processes rendering and writing the profile files in parallel. The attributes are \
+    resolved and sorted to the profiles once in this process, every worker gets the plain class lists of one \
+    profile, not the objects of the topology.
+    :param archive: path of a zip archive written instead of the xml files, e.g. "model.zip". Every profile is \
+    written as UTF-8 directly into a member named like the xml file without the directories of file_name, no \
+    files are written next to file_name. With writer="stream" no profile is held in memory as a whole. A \
+    FileExistsError is raised if the archive already exists. The archive is removed if the export fails. The \
+    profiles of an archive are written by this process, workers cannot be combined with archive.
+    :param compression: compression of the members of archive, a constant of the zipfile module, by default \
+    zipfile.ZIP_DEFLATED
     """
+    if writer not in _WRITERS:
+        raise ValueError("writer must be one of {}, not {!r}".format(", ".join(_WRITERS), writer))
+    if archive is not None and workers and workers > 1:
+        raise ValueError("workers cannot be combined with archive")
+    if archive is not None and os.path.exists(archive):
+        raise FileExistsError(errno.EEXIST, "Archive already exists, delete it or change the name", archive)
 
     t0 = time()
     logger.info("Start export procedure.")
 
     profile_list = list(map(lambda a: Profile[a], activeProfileList))
 
+    # Resolve the attributes and sort them to the profiles once for all files
+    export_data = _prepare_export(import_result, version, profile_list)
+
+    jobs = _get_export_jobs(export_data, file_name, profile_list or [p for p in Profile], profile_list, writer, archive)
+    _write_export_jobs(jobs, archive, compression, workers)
+
+    logger.info("End export procedure. Elapsed time: %s", time() - t0)
+
+
+def cim_export_state(
+    import_result,
+    file_name,
+    version,
+    values=None,
+    profiles=("SV",),
+    dependent_on=(),
+    writer="stream",
+    archive=None,
+    compression=zipfile.ZIP_DEFLATED,
+):
+    """Function for serialization of the state variables of a model
+
+    Only the files of profiles, by default the SV profile, are written, e.g. after the state variables of a base model
+    were changed by a study. Only the objects of classes which have data in these profiles are resolved, e.g. the
+    SvVoltage, SvPowerFlow, TopologicalNode and Terminal objects, the other objects of the topology are not touched.
+    The files are the same as the files of these profiles written by :func:`~cimpy.cimexport.cim_export` with all
+    profiles, except for the md:Model.DependentOn entries of the header.
+
+    The new values are either set on the objects of import_result before the export or given by values, which does not
+    change import_result:
+
+        cimpy.cim_export_state(import_result, "Study", "cgmes_v2_4_15",
+                               values={"SvVoltage.v": (node_mrids, voltages), "SvVoltage.angle": (node_mrids, angles)},
+                               dependent_on=["Base_Equipment", "Base_Topology"])
+
+    :param import_result: a dictionary containing the topology and meta information, e.g. the base model of a study \
+    imported with :func:`~cimpy.cimimport.cim_import()`
+    :param file_name: a string with the name of the xml files which will be created
+    :param version: cgmes version, e.g. ``version="cgmes_v2_4_15"``
+    :param values: a dictionary {"Class.attribute": values} of new values. The values of a state class are keyed by \
+    the mRID of the object they refer to: SvVoltage and SvInjection by the TopologicalNode, SvPowerFlow by the \
+    Terminal, SvTapStep by the TapChanger, SvStatus by the ConductingEquipment and SvShuntCompensatorSections by the \
+    ShuntCompensator. Objects of other classes, e.g. the EnergyConsumer of SSH, are keyed by their own mRID. values \
+    is either a dictionary {mRID: value} or a pair (mRIDs, values) of sequences, e.g. numpy arrays. A KeyError is \
+    raised for an mRID without object.
+    :param profiles: a list of the short names of the profiles written, e.g. ["SV", "SSH"]
+    :param dependent_on: a list of the identifiers of the models the written models depend on, written as \
+    md:Model.DependentOn, e.g. the unchanged EQ and TP models. :func:`~cimpy.cimexport.cim_export` identifies the \
+    models by file_name + "_" + the long profile name, e.g. "Base_Equipment".
+    :param writer: the writer of the files, by default "stream", see :func:`~cimpy.cimexport.cim_export`
+    :param archive: path of a zip archive written instead of the xml files, see :func:`~cimpy.cimexport.cim_export`
+    :param compression: compression of the members of archive
+    """
+    if writer not in _WRITERS:
+        raise ValueError("writer must be one of {}, not {!r}".format(", ".join(_WRITERS), writer))
+    if archive is not None and os.path.exists(archive):
+        raise FileExistsError(errno.EEXIST, "Archive already exists, delete it or change the name", archive)
+
+    t0 = time()
+    profile_list = [Profile[profile] for profile in profiles]
+
+    export_data = _prepare_state_export(import_result, version, profile_list, values)
+
+    jobs = _get_export_jobs(export_data, file_name, profile_list, profile_list, writer, archive, dependent_on)
+    _write_export_jobs(jobs, archive, compression)
+
+    logger.info("End state export. Elapsed time: %s", time() - t0)
+
+
+# Returns the arguments of _write_profile_file for every profile with data. Raises a FileExistsError if one of the
+# files exists and no archive is written.
+def _get_export_jobs(export_data, file_name, profiles, available_profiles, writer, archive, dependent_on=()):
+    jobs = []
+
     # Iterate over all profiles
-    for profile in profile_list or [p for p in Profile]:
+    for profile in profiles:
 
         # File name
         full_file_name = file_name + "_" + profile.long_name() + ".xml"
 
-        if not os.path.exists(full_file_name):
-            output = generate_xml(import_result, version, file_name, profile, profile_list)
-            if output:
-                with open(full_file_name, "w") as file:
-                    logger.info('Write file "%s"', full_file_name)
-                    file.write(output)
-        else:
-            logger.error(
-                "File %s already exists. Delete file or change file name to serialize CGMES classes.", full_file_name
+        if archive is None and os.path.exists(full_file_name):
+            raise FileExistsError(
+                errno.EEXIST,
+                "File already exists, delete it or change the file name to serialize CGMES classes",
+                full_file_name,
             )
-            exit(-1)
 
-    logger.info("End export procedure. Elapsed time: %s", time() - t0)
+        profile_classes = _get_profile_classes(export_data, profile, available_profiles)
+        if profile_classes is not None:
+            model_description = _get_model_description(file_name, profile, dependent_on)
+            jobs.append((full_file_name, writer, export_data.namespaces_list, model_description) + profile_classes)
+
+    return jobs
+
+
+# Writes the jobs of _get_export_jobs to their files, in a process pool if workers is greater than one, or to archive
+def _write_export_jobs(jobs, archive, compression, workers=None):
+    if archive is not None:
+        logger.info('Write archive "%s"', archive)
+        _write_archive(archive, compression, jobs)
+    elif workers and workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            futures = []
+            for job in jobs:
+                logger.info('Write file "%s"', job[0])
+                futures.append(executor.submit(_write_profile_file, *job))
+            for future in futures:
+                future.result()
+    else:
+        for job in jobs:
+            logger.info('Write file "%s"', job[0])
+            _write_profile_file(*job)
 
 
 def generate_xml(cim_data, version, model_name, profile, available_profiles):
@@ -420,6 +659,22 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
     :result: a string with the CIM RDF/XML data
     """
 
+    return _render_profile(
+        _prepare_export(cim_data, version, available_profiles), model_name, profile, available_profiles
+    )
+
+
+# Intermediate of an export shared by all profiles
+# export_dict: {profile name: {"classes": [class]}} of the classes defined in the profile
+# about_dict: {profile name: {"classes": [class]}} of the rdf:about elements of the profile
+# namespaces_list: the namespaces written in the RDF header
+_ExportData = namedtuple("_ExportData", ["export_dict", "about_dict", "namespaces_list"])
+
+
+# This function resolves the attributes and references of all objects and sorts the classes and attributes to the
+# profiles. It walks the topology once, every profile is rendered from the result by _render_profile.
+def _prepare_export(cim_data, version, available_profiles):
+
     # Returns all classes with their attributes and resolved references
     class_attributes_list = _get_class_attributes_with_references(cim_data, version)
 
@@ -432,6 +687,178 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
 
     namespaces_list = _create_namespaces_list(cim_data["meta_info"]["namespaces"])
 
+    return _ExportData(export_dict, about_dict, namespaces_list)
+
+
+# Attribute of the state classes referring to the object their values are keyed by in cim_export_state
+_STATE_KEYS = {
+    "SvVoltage": "TopologicalNode",
+    "SvInjection": "TopologicalNode",
+    "SvPowerFlow": "Terminal",
+    "SvTapStep": "TapChanger",
+    "SvStatus": "ConductingEquipment",
+    "SvShuntCompensatorSections": "ShuntCompensator",
+}
+
+
+# This function prepares the intermediate of cim_export_state. Only the objects of classes which have data in profiles
+# are resolved and sorted, with the new values applied to their attributes. The objects are sorted with all profiles
+# active like in cim_export, the sorted classes of the other profiles are only incomplete.
+def _prepare_state_export(cim_data, version, profiles, values):
+    topology = cim_data["topology"]
+    urls = cim_data["meta_info"]["urls"]
+    references = cim_data["meta_info"].get("overlay_references", {})
+    keys = _get_topology_keys(topology)
+
+    # Attributes of the classes with data in profiles: {class: [(key, 'Class_Name.Attribute_Name')]}
+    relevant = {}
+    for klass in set(obj.__class__ for obj in topology.values()):
+        profile_attributes = _get_profile_attributes(klass, profiles)
+        if profile_attributes is not None:
+            relevant[klass] = profile_attributes
+
+    updates = _get_state_updates(topology, keys, relevant, values or {})
+
+    class_attributes_list = []
+    for key, obj in topology.items():
+        if obj.__class__ not in relevant:
+            continue
+        # Like _get_attributes, but only with the attributes written to profiles
+        attributes_dict = dict(
+            serializationProfile=obj.serializationProfile,
+            possibleProfileList=_get_class_attributes(obj.__class__).possible_profiles,
+            recommendedClassProfile=obj.recommendedClassProfile,
+        )
+        for attribute, attribute_name in relevant[obj.__class__]:
+            attributes_dict[attribute_name] = getattr(obj, attribute)
+        if key in references:
+            _apply_overlay_references(attributes_dict, obj, references[key])
+        if id(obj) in updates:
+            attributes_dict.update(updates[id(obj)])
+        class_attributes_list.append(
+            dict(
+                name=obj.__class__.__name__,
+                mRID=key,
+                attributes=_get_reference_uuid(attributes_dict, version, keys, key, urls),
+            )
+        )
+
+    export_dict, about_dict = _sort_classes_to_profile(class_attributes_list, [p for p in Profile])
+    namespaces_list = _create_namespaces_list(cim_data["meta_info"]["namespaces"])
+
+    return _ExportData(export_dict, about_dict, namespaces_list)
+
+
+# Returns the attributes [(key, 'Class_Name.Attribute_Name')] of klass which are sorted to one of profiles in the order
+# of _get_attributes, or None if neither the class nor its attributes are sorted to profiles. The class is sorted like
+# an object with a value for every attribute, so the list includes every attribute an object of klass could write.
+def _get_profile_attributes(klass, profiles):
+    class_attributes = _get_class_attributes(klass)
+    all_attributes = list(class_attributes.inherited)
+    for key in klass().__dict__.keys():
+        if key not in class_attributes.inherited_keys:
+            all_attributes.append((key, klass.__name__ + "." + key))
+
+    attributes = [
+        {"serializationProfile": klass.serializationProfile},
+        {"possibleProfileList": class_attributes.possible_profiles},
+        {"recommendedClassProfile": klass.recommendedClassProfile},
+    ]
+    attributes += [{"attr_name": name, "value": "%"} for _, name in all_attributes]
+    export_dict, about_dict = _sort_classes_to_profile(
+        [dict(name=klass.__name__, mRID="", attributes=attributes)], [p for p in Profile]
+    )
+
+    profile_attribute_names = set()
+    in_profiles = False
+    for profile in profiles:
+        for sorted_classes in (export_dict, about_dict):
+            if profile.name in sorted_classes:
+                in_profiles = True
+                for attribute in sorted_classes[profile.name]["classes"][0]["attributes"]:
+                    profile_attribute_names.add(attribute["attr_name"])
+    if not in_profiles:
+        return None
+    return [(key, name) for key, name in all_attributes if name in profile_attribute_names]
+
+
+# Returns the new values of cim_export_state as {id(object): {'Class_Name.Attribute_Name': value}}. values is the
+# dictionary {"Class.attribute": values} of cim_export_state, relevant the classes with data in the exported profiles.
+def _get_state_updates(topology, keys, relevant, values):
+    classes = {klass.__name__: klass for klass in relevant}
+    updates = {}
+    # Objects of each class by the key of their values: {class name: {key: object}}
+    objects = {}
+    for name, class_values in values.items():
+        class_name, _, attribute = name.partition(".")
+        if class_name not in classes:
+            raise ValueError("Class {} of {} has no objects written to the exported profiles".format(class_name, name))
+        klass = classes[class_name]
+        attribute_name = _get_qualified_attribute_name(klass, attribute)
+        if attribute_name not in [name for _, name in relevant[klass]]:
+            raise ValueError("Attribute {} is not written to the exported profiles".format(name))
+
+        if class_name not in objects:
+            objects[class_name] = _get_state_objects(topology, keys, klass)
+        class_objects = objects[class_name]
+
+        if isinstance(class_values, dict):
+            class_values = class_values.items()
+        else:
+            mrids, new_values = class_values
+            class_values = zip(_to_list(mrids), _to_list(new_values))
+        for mrid, value in class_values:
+            try:
+                obj = class_objects[mrid]
+            except KeyError:
+                raise KeyError("No {} object for {}".format(class_name, mrid)) from None
+            updates.setdefault(id(obj), {})[attribute_name] = value
+    return updates
+
+
+# Returns the name 'Class_Name.Attribute_Name' of an attribute of klass like _get_attributes, the class name is the
+# class defining the attribute. Raises a ValueError if klass has no such attribute.
+def _get_qualified_attribute_name(klass, attribute):
+    for key, attribute_name in _get_class_attributes(klass).inherited:
+        if key == attribute:
+            return attribute_name
+    if attribute in klass().__dict__:
+        return klass.__name__ + "." + attribute
+    raise ValueError("Class {} has no attribute {}".format(klass.__name__, attribute))
+
+
+# Returns the objects of klass in the topology by the key of their values in cim_export_state, the mRID of the object
+# referred to by the attribute in _STATE_KEYS or the key of the object itself for other classes
+def _get_state_objects(topology, keys, klass):
+    reference = _STATE_KEYS.get(klass.__name__)
+    state_objects = {}
+    for key, obj in topology.items():
+        if obj.__class__ is not klass:
+            continue
+        if reference is None:
+            state_objects[key] = obj
+            continue
+        referred = getattr(obj, reference, None)
+        if referred is None or referred == "" or isinstance(referred, list):
+            continue
+        mrid = getattr(referred, "mRID", None) or keys.get(id(referred))
+        if mrid is not None:
+            state_objects[mrid] = obj
+    return state_objects
+
+
+# Converts a sequence, e.g. a numpy array, to a list of Python values
+def _to_list(sequence):
+    if hasattr(sequence, "tolist"):
+        return sequence.tolist()
+    return list(sequence)
+
+
+# Returns the classes and the rdf:about elements of profile, False if there are none. Returns None if the profile has
+# no data and available_profiles is empty, raises a RuntimeError if a requested profile has no data.
+def _get_profile_classes(export_data, profile, available_profiles):
+    export_dict, about_dict, _ = export_data
+
     if profile.name not in export_dict.keys() and profile.name not in about_dict.keys():
         if available_profiles:
             raise RuntimeError(
@@ -444,7 +871,7 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
                 + "."
             )
         else:
-            return ""
+            return None
 
     # Extract class lists from export_dict and about_dict
     if profile.name in export_dict.keys():
@@ -457,7 +884,11 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
     else:
         about = False
 
-    # Model header
+    return classes, about
+
+
+# Returns the model header of a profile, dependent_on are the identifiers of the models it depends on
+def _get_model_description(model_name, profile, dependent_on=()):
     model_description = {
         "mRID": model_name + "_" + profile.long_name(),
         "description": [
@@ -470,10 +901,32 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
     }
     for uri in profile.uris():
         model_description["description"].append({"attr_name": "profile", "value": uri})
+    # The % marks a reference for the lambda _set_attribute_or_reference_model
+    for model in dependent_on:
+        model_description["description"].append({"attr_name": "DependentOn", "value": "%" + model})
+    return model_description
+
+
+# This function renders the RDF/XML of one profile from the intermediate of _prepare_export with the mustache
+# template. Returns an empty string if the profile has no data and available_profiles is empty, raises a RuntimeError
+# if a requested profile has no data.
+def _render_profile(export_data, model_name, profile, available_profiles):
+    profile_classes = _get_profile_classes(export_data, profile, available_profiles)
+    if profile_classes is None:
+        return ""
+    classes, about = profile_classes
+
+    # Model header
+    model_description = _get_model_description(model_name, profile)
+
+    return _render_template(export_data.namespaces_list, model_description, classes, about)
+
 
+# Renders the mustache template with the header and the class lists of one profile
+def _render_template(namespaces_list, model_description, classes, about):
     template_path = Path(os.path.join(os.path.dirname(__file__), "export_template.mustache")).resolve()
     with open(template_path) as f:
-        output = chevron.render(
+        return chevron.render(
             f,
             {
                 "classes": classes,
@@ -484,53 +937,161 @@ def generate_xml(cim_data, version, model_name, profile, available_profiles):
                 "model": [model_description],
             },
         )
-    del model_description
-    return output
 
 
-# This function extracts all attributes from class_object in the form of Class_Name.Attribute_Name
-def _get_attributes(class_object):
-    inheritance_list = [class_object]
-    class_type = type(class_object)
-    parent = class_object
+# Writes the file of one profile with the writer of cim_export. Defined on module level to run in worker processes,
+# the arguments are the plain lists and dictionaries of the intermediate.
+def _write_profile_file(full_file_name, writer, namespaces_list, model_description, classes, about):
+    pieces = _get_profile_pieces(writer, namespaces_list, model_description, classes, about)
+    with open(full_file_name, "w") as file:
+        file.writelines(pieces)
+
+
+# Writes the profiles of the jobs of cim_export as members of a new zip archive. Each profile is encoded and
+# compressed while it is written. A partly written archive is removed.
+def _write_archive(archive, compression, jobs):
+    zip_file = zipfile.ZipFile(archive, "x", compression)
+    try:
+        with zip_file:
+            for full_file_name, writer, namespaces_list, model_description, classes, about in jobs:
+                pieces = _get_profile_pieces(writer, namespaces_list, model_description, classes, about)
+                member = os.path.basename(full_file_name)
+                with zip_file.open(member, "w", force_zip64=True) as binary:
+                    with io.TextIOWrapper(binary, encoding="utf-8", newline="\n") as file:
+                        file.writelines(pieces)
+    except BaseException:
+        try:
+            os.remove(archive)
+        except OSError:
+            pass
+        raise
+
+
+# Returns the text of one profile with the writer of cim_export, an iterator for "stream" and a list of the rendered
+# template otherwise
+def _get_profile_pieces(writer, namespaces_list, model_description, classes, about):
+    if writer == "stream":
+        return _iter_profile_xml(namespaces_list, model_description, classes, about)
+    return [_render_template(namespaces_list, model_description, classes, about)]
+
+
+# This function writes the RDF/XML of one profile without the template engine. It returns an iterator over the text
+# of the header and of every class and rdf:about element, which is the same text as the mustache template renders.
+# Returns None if the profile has no data and available_profiles is empty, raises a RuntimeError if a requested
+# profile has no data.
+def _stream_profile(export_data, model_name, profile, available_profiles):
+    profile_classes = _get_profile_classes(export_data, profile, available_profiles)
+    if profile_classes is None:
+        return None
+    classes, about = profile_classes
+    return _iter_profile_xml(export_data.namespaces_list, _get_model_description(model_name, profile), classes, about)
+
+
+def _iter_profile_xml(namespaces_list, model_description, classes, about):
+    namespaces = "".join(
+        'xmlns:{}="{}" '.format(_escape(namespace["key"]), _escape(namespace["url"])) for namespace in namespaces_list
+    )
+    yield '<?xml version="1.0" encoding="UTF-8"?>\n<rdf:RDF ' + namespaces + ">\n"
+
+    lines = ['<md:FullModel rdf:about="' + _escape(model_description["mRID"]) + '">\n']
+    for description in model_description["description"]:
+        attr_name = _escape(description["attr_name"])
+        value = _attribute_or_reference_model(_escape(description["value"]) + "@" + attr_name)
+        lines.append("    <md:Model." + attr_name + value + "\n")
+    lines.append("</md:FullModel>\n")
+    yield "".join(lines)
+
+    for klass in classes or ():
+        yield _class_xml(klass, ' rdf:ID="')
+    for klass in about or ():
+        yield _class_xml(klass, ' rdf:about="#')
+    yield "</rdf:RDF>\n"
+
+
+# Returns the element of a class with its attributes, identifier is the start of the rdf:ID or rdf:about attribute
+def _class_xml(klass, identifier):
+    name = _escape(klass["name"])
+    lines = ["<cim:" + name + identifier + _escape(klass["mRID"]) + '">\n']
+    for attribute in klass["attributes"]:
+        attr_name = _escape(attribute["attr_name"])
+        value = _attribute_or_reference(_escape(attribute["value"]) + "@" + attr_name)
+        lines.append("    <cim:" + attr_name + value + "\n")
+    lines.append("</cim:" + name + ">\n")
+    return "".join(lines)
+
+
+# Converts a value to text and escapes it like a variable of the mustache template
+def _escape(value):
+    # Falsy values are empty, except 0 and False
+    if value in (0, False):
+        value = str(value)
+    elif not isinstance(value, str):
+        value = str(value or "")
+    return value.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+# Attributes of a class derived once from its inheritance chain
+# inherited: [(key, 'Class_Name.Attribute_Name')] of the attributes of the parent classes, top to bottom
+# inherited_keys: set of the keys in inherited
+# possible_profiles: {class name: possibleProfileList} of the class and its parent classes except Base
+_ClassAttributes = namedtuple("_ClassAttributes", ["inherited", "inherited_keys", "possible_profiles"])
+
+
+# Returns the attributes of klass from the cache, derived from a default instance of each parent class on first use
+def _get_class_attributes(klass):
+    try:
+        return _class_attributes[klass]
+    except KeyError:
+        pass
 
     # Get parent classes
-    while "Base.Base" not in str(class_type):
-        parent = parent.__class__.__bases__[0]()
+    inheritance_list = []
+    parent = klass
+    while "Base.Base" not in str(parent):
+        parent = parent.__bases__[0]
         # Insert parent class at beginning of list, classes inherit from top to bottom
         inheritance_list.insert(0, parent)
-        class_type = type(parent)
+
+    inherited = []
+    inherited_keys = set()
+    possible_profiles = {}
+    for parent_class in inheritance_list:
+        # __dict__ of a subclass returns also the attributes of the parent classes, keep the first class defining it
+        for key in parent_class().__dict__.keys():
+            if key not in inherited_keys:
+                inherited_keys.add(key)
+                inherited.append((key, parent_class.__name__ + "." + key))
+
+        # The serializationProfile from parent classes is not needed because entries in the serializationProfile
+        # are only generated for the inherited class
+        if parent_class.__name__ != "Base":
+            possible_profiles[parent_class.__name__] = parent_class.possibleProfileList
+    possible_profiles[klass.__name__] = klass.possibleProfileList
+
+    _class_attributes[klass] = _ClassAttributes(inherited, frozenset(inherited_keys), possible_profiles)
+    return _class_attributes[klass]
+
+
+# This function extracts all attributes from class_object in the form of Class_Name.Attribute_Name. The attributes of
+# the parent classes are taken from the cache of _get_class_attributes, the attributes of the class itself from the
+# __dict__ of class_object.
+def _get_attributes(class_object):
+    class_attributes = _get_class_attributes(class_object.__class__)
 
     # Dictionary containing all attributes with key: 'Class_Name.Attribute_Name'
     attributes_dict = dict(
         serializationProfile=class_object.serializationProfile,
-        possibleProfileList={},
+        possibleProfileList=class_attributes.possible_profiles,
         recommendedClassProfile=class_object.recommendedClassProfile,
     )
 
-    # __dict__ of a subclass returns also the attributes of the parent classes
-    # to avoid multiple attributes create list with all attributes already processed
-    attributes_list = []
+    for key, attributes_name in class_attributes.inherited:
+        attributes_dict[attributes_name] = getattr(class_object, key)
 
-    # Iterate over parent classes from top to bottom
-    for parent_class in inheritance_list:
-        # Get all attributes of the current parent class
-        parent_attributes_dict = parent_class.__dict__
-        class_name = parent_class.__class__.__name__
-
-        # Check if new attribute or old attribute
-        for key in parent_attributes_dict.keys():
-            if key not in attributes_list:
-                attributes_list.append(key)
-                attributes_name = class_name + "." + key
-                attributes_dict[attributes_name] = getattr(class_object, key)
-            else:
-                continue
-
-        # Get all possibleProfileLists from all parent classes except the Base class (no attributes)
-        # the serializationProfile from parent classes is not needed because entries in the serializationProfile
-        # are only generated for the inherited class
-        if class_name != "Base":
-            attributes_dict["possibleProfileList"][class_name] = parent_class.possibleProfileList
+    class_name = class_object.__class__.__name__
+    inherited_keys = class_attributes.inherited_keys
+    for key, value in class_object.__dict__.items():
+        if key not in inherited_keys:
+            attributes_dict[class_name + "." + key] = value
 
     return attributes_dict
@@ -1,13 +1,75 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from lxml import etree
-from time import time
-import importlib
+from contextlib import contextmanager
+from time import perf_counter, time
+import asyncio
+import gc
 import logging
+import mmap
+import os
+import threading
+from cimpy.archive import expand_sources, MappedFile, open_source, scan_header, ZipMember
+from cimpy import cache as import_cache
+from cimpy.cimexport import _get_topology_keys
 from cimpy.cgmes_v2_4_15.CGMESProfile import short_profile_name
+from cimpy.diagnostics import ImportDiagnostics
+from cimpy.schema import get_schema, MANY, ReferenceList
+from cimpy.stats import ImportProgress, ImportStats
 
 logger = logging.getLogger(__name__)
 
-
-def cim_import(xml_files, cgmes_version, start_dict=None):
+# Kinds of the records yielded by _iter_records
+_MODEL = 0  # (_MODEL, tag, text): element of the model header, e.g. md:Model.profile
+_CLASS = 1  # (_CLASS, uuid, tag, package): start of a class element with rdf:ID
+_ABOUT = 2  # (_ABOUT, uuid, tag, package): start of a class element with rdf:about
+_ATTRIBUTE = 3  # (_ATTRIBUTE, attr, text, resource): attribute or reference of the current class element
+_SKIPPED = 4  # (_SKIPPED, uuid): class element removed by the filter, uuid is None if the rest of the file is skipped
+
+# Parser backends of _iter_records
+_PARSERS = ("iterparse", "target")
+
+# Modes of the garbage collector during cim_import
+_GC_MODES = (None, "pause", "freeze")
+
+# Class element yielded by iter_records
+# mRID: the rdf:ID or the rdf:about of the element without '#'
+# class_name: the class of the element, e.g. "SvVoltage"
+# profile: the short name of the profile of the file, e.g. "SV", None if the file has no known profile
+# attrs: {attribute: text} of the attributes, enumerations as the name of the value, e.g. {"v": "20.3"}
+# refs: {attribute: mRID} of the references, a list of mRIDs if a reference is read more than once
+CIMRecord = namedtuple("CIMRecord", ["mRID", "class_name", "profile", "attrs", "refs"])
+
+# State of an overlay import, see cim_import_overlay
+# base_topology: the topology of the base model, its objects are not changed
+# references: {key: {attribute: value}} of the inverse references of the objects shared with the base model
+_Overlay = namedtuple("_Overlay", ["base_topology", "references"])
+
+# Entries of the meta information of an overlay import result which are not taken over from its base model
+# object_keys: reverse index {id(object): key} of the topology, cached by the first overlay on the result
+# base_object_keys: the object_keys of the base model
+# overlay_references: the references of _Overlay
+_OVERLAY_META_INFO = ("object_keys", "base_object_keys", "overlay_references")
+
+
+def cim_import(
+    xml_files,
+    cgmes_version,
+    start_dict=None,
+    single_pass=False,
+    workers=None,
+    include_classes=None,
+    exclude_classes=None,
+    profiles=None,
+    include_referenced=False,
+    cache_dir=None,
+    stats_callback=None,
+    parser="iterparse",
+    progress_callback=None,
+    use_mmap=False,
+    intern_table=None,
+    gc_mode=None,
+):
     """Function to read cimgen files and instantiate the classes
 
     This function parses xml files containing a cgmes topology and instantiates these classes with their attributes.
@@ -15,394 +77,1207 @@ def cim_import(xml_files, cgmes_version, start_dict=None):
     in a second step the attributes contained in the xml files are set. The origin of all classes and attributes are
     stored in the class attribute serializationProfile.
 
-    :param xml_files: CIM RDF/XML file.
+    :param xml_files: CIM RDF/XML file. Zip archives, also nested ones, are replaced by the XML files they contain. \
+    The members are streamed into the parser without extracting them to disk. A nested archive which is stored \
+    uncompressed in its parent archive is streamed as well. A compressed nested archive cannot be streamed, its \
+    content (the still compressed XML members) is read into memory once and reused while it is listed, hashed and \
+    parsed. Up to 256 MiB of such archives are kept in memory per process.
     :param cgmes_version: cgmes version, e.g. "cgmes_v2_4_15"
-    :param start_dict: a list of classes which indicates which classes will be read
-        e.g. elements=["BaseVoltage", "ACLineSegment"]
-        * If start_dict=None the complete file will be read
+    :param start_dict: a dictionary with the keys 'meta_info' and 'topology' the imported objects are added to
+        * If start_dict=None a new dictionary is created
+    :param single_pass: if True every xml file is parsed only once. Classes are instantiated as soon as they are read \
+    and their attributes are set right away. Attributes referencing objects which are not read yet are stored in a \
+    fixup table which is applied after the last file. The result is identical to the default two step import.
+    :param workers: number of processes parsing the xml files in parallel, implies single_pass. Every process turns \
+    one file into a list of records which are linked to the topology in the main process in the order of xml_files. \
+    File objects are parsed in the main process.
+    :param include_classes: a list of classes which will be read, e.g. include_classes=["SvVoltage", "SvPowerFlow"]. \
+    Elements of other classes are skipped while parsing, before any object is created. Implies single_pass.
+    :param exclude_classes: a list of classes which will be skipped while parsing. Implies single_pass.
+    :param profiles: a list of short profile names which will be read, e.g. profiles=["SV"]. Files of other profiles \
+    are skipped after their model header. Implies single_pass.
+    :param include_referenced: if True, objects which are filtered by include_classes, exclude_classes or profiles \
+    but referenced by an imported object are imported as well. Their own references to filtered objects are not set. \
+    The files are parsed a second time for these objects.
+    :param cache_dir: directory of the import cache. The import result is stored in cache_dir and loaded from there \
+    if cim_import is called again with files of the same content, the same cgmes version and the same filter \
+    options. The files are hashed once per process, the digest is reused until the size or a timestamp of a file \
+    changes, see :func:`~cimpy.cache.file_digest`. The least recently used results are removed if the cache grows \
+    beyond the environment variable CIMPY_IMPORT_CACHE_SIZE in bytes (default 4 GiB). The cache is not used with \
+    start_dict or file objects.
+    :param stats_callback: function called with the statistics of each file after it is imported, e.g. to report \
+    the progress of a large import. The statistics of all files are returned in import_result['meta_info']['stats'].
+    :param parser: "iterparse" (default) parses the files with lxml.etree.iterparse, "target" with an lxml parser \
+    calling a handler for every start tag, text and end tag without creating elements. The result is the same.
+    :param progress_callback: function called with a :class:`~cimpy.stats.ImportProgress` at the start of each \
+    phase and file and after every 4096 elements. An exception raised by progress_callback aborts the import, see \
+    also :func:`~cimpy.cimimport.cim_import_async`.
+    :param use_mmap: if True, XML files given as paths are mapped into memory with mmap and parsed from the mapped \
+    pages instead of being read through a file object, see :class:`~cimpy.archive.MappedFile`. This reduces the \
+    copies and system calls for very large files. Memory maps (mmap.mmap) can also be passed in xml_files directly.
+    :param intern_table: dictionary used to intern the mRIDs, the enumeration values and the string attributes read, \
+    so equal strings are stored only once. By default every import uses a new dictionary. Passing the same \
+    dictionary to the imports of several snapshots of a grid shares these strings between their results. The \
+    dictionary only grows, it should be dropped with the results. Results loaded from the cache are not interned.
+    :param gc_mode: None (default) keeps the cyclic garbage collector running. "pause" disables it while importing, \
+    the created objects reference each other but form no garbage, so the collections would scan the growing model \
+    for nothing. The collector is disabled for the whole process and enabled again afterwards. "freeze" \
+    additionally moves all objects of the process, including the import result, to the permanent generation with \
+    gc.freeze() so later collections skip them. Frozen objects which form cycles are not freed when the result is \
+    dropped, call gc.unfreeze() to restore the normal behaviour. The collections and the time spent in them during \
+    the import are reported in import_result['meta_info']['stats']['gc'].
     :return: import_result: a dictionary containing the topology and meta information. The topology can be extracted \
     via import_result['topology']. The topology dictionary contains all objects accessible via their mRID. The meta \
     information can be extracted via import_result['meta_info']. The meta_info dictionary contains a new dictionary \
-    with the keys: 'author', 'namespaces' and 'urls'. The last two are also dictionaries. 'urls' contains a mapping \
-    between references to URLs and the extracted value of the URL, e.g. 'absoluteValue': \
+    with the keys: 'author', 'namespaces', 'urls', 'diagnostics' and 'stats'. The last four are also dictionaries. \
+    'urls' contains a mapping between references to URLs and the extracted value of the URL, e.g. 'absoluteValue': \
     'http://iec.ch/TC57/2012/CIM-schema-cim16#OperationalLimitDirectionKind.absoluteValue'. These mappings are \
     accessible via the name of the attribute, \
     e.g. import_result['meta_info']['urls'}[attr_name] = {mapping like example above}. \
-    'namespaces' is a dictionary containing all RDF namespaces used in the imported xml files.
+    'namespaces' is a dictionary containing all RDF namespaces used in the imported xml files. 'diagnostics' \
+    contains the counted errors and infos of the import, see :meth:`~cimpy.diagnostics.ImportDiagnostics.as_dict`. \
+    'stats' contains the bytes, elements, times and created objects of the import and of each file, see \
+    :meth:`~cimpy.stats.ImportStats.as_dict`.
     """
 
-    # Import cim version class
-    cgmes_version_path = "cimpy." + cgmes_version
+    if parser not in _PARSERS:
+        raise ValueError("parser must be one of {}, not {!r}".format(", ".join(_PARSERS), parser))
+    if gc_mode not in _GC_MODES:
+        raise ValueError("gc_mode must be one of {}, not {!r}".format(", ".join(map(repr, _GC_MODES)), gc_mode))
+
+    # Classes and attributes of the cim version
+    schema = get_schema(cgmes_version)
+
+    # Replace zip archives by their XML members
+    xml_files = expand_sources(xml_files, use_mmap)
 
     # Start the clock.
     t0 = time()
+    stats = ImportStats(stats_callback, progress_callback)
+
+    with _garbage_collection(gc_mode, stats):
+        # Serve the import result from the cache
+        cache_key = None
+        if cache_dir is not None and start_dict is None:
+            options = (
+                tuple(sorted(include_classes)) if include_classes is not None else None,
+                tuple(sorted(exclude_classes)) if exclude_classes is not None else None,
+                tuple(sorted(profiles)) if profiles is not None else None,
+                bool(include_referenced),
+            )
+            cache_key = import_cache.cache_key(xml_files, schema, options)
+            if cache_key is not None:
+                import_result = import_cache.load(cache_dir, cache_key)
+                if import_result is not None:
+                    stats.start_phase("cache_load")
+                    stats.add_phase("cache_load", time() - t0)
+                    import_result["meta_info"]["stats"] = stats.as_dict()
+                    logger.info(
+                        "Loaded %s CIM objects from the import cache in %.2f s\n\n",
+                        len(import_result["topology"]),
+                        time() - t0,
+                    )
+                    return import_result
+
+        # Counters of the errors and infos
+        diagnostics = ImportDiagnostics()
+
+        # Strings read by the import: {string: string}
+        strings = intern_table if intern_table is not None else {}
+
+        # Create a dict which will contain meta information and the topology
+        import_result = start_dict if start_dict is not None else dict(meta_info={}, topology={})
+
+        # Create sub-dictionaries
+        import_result["meta_info"] = dict(namespaces=_get_namespaces(xml_files[0]), urls={})
+        namespace_rdf = _get_rdf_namespace(import_result["meta_info"]["namespaces"])
+
+        # CIM element tag base (e.g. {http://iec.ch/TC57/2012/CIM-schema-cim16#} )
+        base = "{" + import_result["meta_info"]["namespaces"]["cim"] + "}"
+
+        # Filter of the class elements
+        keep = None
+        if include_classes is not None or exclude_classes is not None:
+            keep = _ElementFilter(include_classes, exclude_classes)
+        if profiles is not None:
+            profiles = frozenset(profiles)
+
+        if single_pass or workers or keep is not None or profiles is not None:
+            import_result, diagnostics = _import_single_pass(
+                import_result,
+                xml_files,
+                schema,
+                namespace_rdf,
+                base,
+                diagnostics,
+                stats,
+                workers,
+                keep,
+                profiles,
+                include_referenced,
+                parser=parser,
+                strings=strings,
+            )
+        else:
+            import_result, diagnostics = _instantiate_classes(
+                import_result,
+                xml_files,
+                schema,
+                namespace_rdf,
+                base,
+                diagnostics,
+                stats,
+                parser,
+                strings,
+            )
+
+            import_result, diagnostics = _set_attributes(
+                import_result, xml_files, schema, namespace_rdf, base, diagnostics, stats, parser, strings
+            )
+
+        diagnostics.log(logger)
+        import_result["meta_info"]["diagnostics"] = diagnostics.as_dict()
+        import_result["meta_info"]["stats"] = stats.as_dict(diagnostics)
+
+        if cache_key is not None:
+            import_cache.store(cache_dir, cache_key, import_result)
 
-    # Map used to group errors and infos
-    logger_grouped = dict(errors={}, info={})
+    elapsed_time = time() - t0
+    logger.info("Created totally %s CIM objects in %.2f s\n\n", len(import_result["topology"]), elapsed_time)
 
-    # Create a dict which will contain meta information and the topology
-    import_result = start_dict if start_dict is not None else dict(meta_info={}, topology={})
+    return import_result
 
-    # Create sub-dictionaries
-    import_result["meta_info"] = dict(namespaces=_get_namespaces(xml_files[0]), urls={})
-    namespace_rdf = _get_rdf_namespace(import_result["meta_info"]["namespaces"])
 
-    # CIM element tag base (e.g. {http://iec.ch/TC57/2012/CIM-schema-cim16#} )
-    base = "{" + import_result["meta_info"]["namespaces"]["cim"] + "}"
-
-    import_result, logger_grouped = _instantiate_classes(
-        import_result,
-        xml_files,
-        cgmes_version_path,
-        namespace_rdf,
-        base,
-        logger_grouped,
-    )
+def cim_import_overlay(base_import_result, xml_files, cgmes_version="cgmes_v2_4_15", intern_table=None, gc_mode=None):
+    """Function to read SSH and SV files on top of an already imported base model
+
+    The objects of xml_files are added to a new import result which also contains all objects of base_import_result.
+    References are resolved against the base topology, the files of the base model are not parsed again. The base
+    model itself is not changed, so one base model, e.g. the EQ and TP of a grid, can be shared by many overlays, e.g.
+    the SSH and SV of hourly snapshots. Apart from a shallow copy of the topology dictionary, the work per overlay is
+    proportional to the number of elements in xml_files.
+
+    Objects of the base model named by the class elements of xml_files, e.g. an EnergyConsumer with SSH values, are
+    copied on the first write and replaced by the copy in the new topology. Only these objects are copied: the other
+    objects of the base model still refer to the original, e.g. the ConductingEquipment of a Terminal is the
+    EnergyConsumer without the SSH values. The inverse references of the new objects to the objects shared with the
+    base model, e.g. TopologicalNode.SvVoltage or Terminal.SvPowerFlow, are not set on these objects but held in
+    meta_info["overlay_references"]. :func:`~cimpy.cimimport.get_overlay_attribute` reads an attribute through both,
+    and the export functions of :mod:`cimpy.cimexport` write the same files as for a full import:
+
+        overlay = cimpy.cim_import_overlay(base, ssh_and_sv_files, "cgmes_v2_4_15")
+        voltage = cimpy.get_overlay_attribute(overlay, terminal.TopologicalNode, "SvVoltage")
+
+    The reverse index of the base topology needed for this is built by the first overlay and cached in the meta_info
+    of base_import_result.
+
+    The base model should not contain objects of the profiles in xml_files, e.g. the SvVoltages of another snapshot,
+    because these would be part of the new topology as well.
+
+    :param base_import_result: result of :func:`~cimpy.cimimport.cim_import`, e.g. of the EQ and TP files
+    :param xml_files: CIM RDF/XML files read on top of the base model, e.g. the SSH and SV files. Zip archives are \
+    expanded like in :func:`~cimpy.cimimport.cim_import`.
+    :param cgmes_version: cgmes version, e.g. "cgmes_v2_4_15"
+    :param intern_table: dictionary interning the strings read, see :func:`~cimpy.cimimport.cim_import`. Passing the \
+    dictionary used for the base model shares the strings of the overlays with it.
+    :param gc_mode: mode of the garbage collector during the import, see :func:`~cimpy.cimimport.cim_import`
+    :return: import_result: a dictionary with the keys 'topology' and 'meta_info' like the result of \
+    :func:`~cimpy.cimimport.cim_import`. The topology is a new dictionary with the objects of the base model and of \
+    xml_files.
+    """
 
-    import_result, logger_grouped = _set_attributes(import_result, xml_files, namespace_rdf, base, logger_grouped)
+    if gc_mode not in _GC_MODES:
+        raise ValueError("gc_mode must be one of {}, not {!r}".format(", ".join(map(repr, _GC_MODES)), gc_mode))
 
-    if logger_grouped["errors"]:
-        for error, count in logger_grouped["errors"].items():
-            logger.warning("%s: %d times", error, count)
+    # Classes and attributes of the cim version
+    schema = get_schema(cgmes_version)
 
-    if logger_grouped["info"]:
-        for info, count in logger_grouped["info"].items():
-            logger.info("%s: %d times", info, count)
+    # Replace zip archives by their XML members
+    xml_files = expand_sources(xml_files)
+
+    # Start the clock.
+    t0 = time()
+
+    # Counters of the errors and infos
+    diagnostics = ImportDiagnostics()
+    stats = ImportStats()
+
+    # Reverse index of the base topology, built once per base model
+    base_topology = base_import_result["topology"]
+    base_meta_info = base_import_result["meta_info"]
+    if "object_keys" not in base_meta_info:
+        base_meta_info["object_keys"] = _get_topology_keys(base_topology)
+
+    # New meta information and topology, the dictionaries of the base model are not changed
+    meta_info = {key: value for key, value in base_meta_info.items() if key not in _OVERLAY_META_INFO}
+    meta_info["base_object_keys"] = base_meta_info["object_keys"]
+    meta_info["overlay_references"] = {}
+    meta_info["namespaces"] = dict(meta_info.get("namespaces", {}))
+    meta_info["namespaces"].update(_get_namespaces(xml_files[0]))
+    meta_info["urls"] = {attr: dict(mapping) for attr, mapping in meta_info.get("urls", {}).items()}
+    import_result = dict(meta_info=meta_info, topology=dict(base_topology))
+
+    namespace_rdf = _get_rdf_namespace(meta_info["namespaces"])
+
+    # CIM element tag base (e.g. {http://iec.ch/TC57/2012/CIM-schema-cim16#} )
+    base = "{" + meta_info["namespaces"]["cim"] + "}"
+
+    with _garbage_collection(gc_mode, stats):
+        import_result, diagnostics = _import_single_pass(
+            import_result,
+            xml_files,
+            schema,
+            namespace_rdf,
+            base,
+            diagnostics,
+            stats,
+            overlay=_Overlay(base_topology, meta_info["overlay_references"]),
+            strings=intern_table if intern_table is not None else {},
+        )
+
+        diagnostics.log(logger)
+        import_result["meta_info"]["diagnostics"] = diagnostics.as_dict()
+        import_result["meta_info"]["stats"] = stats.as_dict(diagnostics)
 
     elapsed_time = time() - t0
-    logger.info("Created totally %s CIM objects in %.2f s\n\n", len(import_result["topology"]), elapsed_time)
+    logger.info(
+        "Created totally %s CIM objects on top of %s base objects in %.2f s\n\n",
+        len(import_result["topology"]) - len(base_topology),
+        len(base_topology),
+        elapsed_time,
+    )
 
     return import_result
 
 
-# This function instantiates the classes defined in all RDF files. All attributes are set to default values.
-# The only exception is the mRID which is set for all classes that have this attribute. The attributes of a class
-# are set in the _set_attributes function because some attributes might be stored in one package and the class in
-# another. Since after this function all classes are instantiated, there should be no problem in setting the attributes.
-# Also the information from which package file a class was read is stored in the serializationProfile dictionary.
-def _instantiate_classes(import_result, xml_files, cgmes_version_path, namespace_rdf, base, logger_grouped):
+def get_overlay_attribute(import_result, obj, attr):
+    """Function to read an attribute of an object in the result of :func:`~cimpy.cimimport.cim_import_overlay`
 
-    # Extract topology from import_result
-    topology = import_result["topology"]
+    The overlay does not change the objects shared with its base model. Their inverse references to the objects of the
+    overlay files are held in the meta information, and the objects named by the overlay files are replaced by copies
+    in the topology, while the other objects of the base model still refer to the originals. This function returns the
+    value of the attribute in the overlay for an object of the topology and for an object of the base model reached by
+    a reference, e.g.
 
-    # Length of element tag base
-    m = len(base)
+        voltage = cimpy.get_overlay_attribute(overlay, terminal.TopologicalNode, "SvVoltage")
+        connected = cimpy.get_overlay_attribute(overlay, terminal, "connected")
 
-    # First step: create the dict res{uuid}=instance_of_the_cim_class
-    for xml_file in xml_files:
+    For other import results, e.g. of :func:`~cimpy.cimimport.cim_import`, this is getattr(obj, attr).
 
-        logger.info('START of parsing file "%s"', xml_file)
+    :param import_result: a dictionary with the keys 'topology' and 'meta_info', e.g. the result of \
+    :func:`~cimpy.cimimport.cim_import_overlay`
+    :param obj: an object of the topology or of the base model of import_result
+    :param attr: name of the attribute, e.g. "SvVoltage"
+    :return: the value of the attribute in import_result
+    """
+    meta_info = import_result["meta_info"]
+    key = meta_info.get("base_object_keys", {}).get(id(obj))
+    if key is None:
+        return getattr(obj, attr)
+    references = meta_info["overlay_references"].get(key, {})
+    if attr in references:
+        return references[attr]
+    return getattr(import_result["topology"].get(key, obj), attr)
 
-        # Reset stream
-        if hasattr(xml_file, "seek"):
-            xml_file.seek(0)
 
-        # Get an iterable
-        context = etree.iterparse(xml_file, ("start", "end"))
+async def cim_import_async(xml_files, cgmes_version, executor=None, **kwargs):
+    """Asynchronous version of :func:`~cimpy.cimimport.cim_import` reporting its progress
+
+    The import runs in executor (by default the executor of the event loop), so the event loop keeps serving other
+    tasks. This function is an asynchronous generator of :class:`~cimpy.stats.ImportProgress` events. The last event
+    is "done" with the import result:
+
+        async for event in cimpy.cim_import_async(xml_files, "cgmes_v2_4_15"):
+            if event.event == "done":
+                import_result = event.result
+            else:
+                print(event.event, event.phase, event.file, event.elements)
 
-        # Turn it into an iterator (required for cElementTree).
-        context = iter(context)
+    If the consuming task is cancelled or stops iterating, the import is aborted at the next progress event, i.e.
+    after at most 4096 elements.
+
+    :param xml_files: CIM RDF/XML files like for :func:`~cimpy.cimimport.cim_import`
+    :param cgmes_version: cgmes version, e.g. "cgmes_v2_4_15"
+    :param executor: a concurrent.futures.Executor running the import, e.g. a ThreadPoolExecutor. The progress is \
+    reported by a callback, so the executor has to run the import in this process.
+    :param kwargs: further arguments of :func:`~cimpy.cimimport.cim_import` except progress_callback
+    """
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+    cancelled = threading.Event()
+
+    def progress(event):
+        if cancelled.is_set():
+            raise _ImportCancelled()
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    def run():
+        try:
+            return cim_import(xml_files, cgmes_version, progress_callback=progress, **kwargs)
+        finally:
+            loop.call_soon_threadsafe(events.put_nowait, None)
+
+    future = loop.run_in_executor(executor, run)
+    try:
+        while True:
+            event = await events.get()
+            if event is None:
+                break
+            yield event
+        import_result = await future
+    finally:
+        if not future.done():
+            cancelled.set()
+            # The import stops in the background, its _ImportCancelled is not of interest
+            future.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    yield ImportProgress("done", None, None, 0, import_result)
+
+
+# Raised by the progress callback of cim_import_async to abort the import
+class _ImportCancelled(Exception):
+    pass
+
+
+# Runs the import with the garbage collector mode of cim_import and counts the collections in stats. The collector is
+# enabled again afterwards if it was enabled before. The objects are frozen only if the import succeeded.
+@contextmanager
+def _garbage_collection(gc_mode, stats):
+    enabled = gc.isenabled()
+    if gc_mode is not None:
+        gc.disable()
+    stats.watch_gc(gc_mode)
+    try:
+        yield
+    finally:
+        stats.unwatch_gc()
+        if enabled:
+            gc.enable()
+    if gc_mode == "freeze":
+        gc.freeze()
+
+
+def iter_records(xml_files, classes=None, attributes=None, parser="iterparse", use_mmap=False):
+    """Function to read the class elements of cimgen files without instantiating the classes
+
+    The files are parsed one after another and every class element is yielded as a
+    :class:`~cimpy.cimimport.CIMRecord` as soon as it is read. No objects are created and no references are
+    resolved, so the memory used does not grow with the size of the files. This is useful for consumers which only
+    count objects or read a few attributes, e.g. the SvVoltages of a snapshot:
+
+        for record in cimpy.iter_records(xml_files, classes=["SvVoltage"], attributes=["v", "TopologicalNode"]):
+            voltages[record.refs["TopologicalNode"]] = float(record.attrs["v"])
+
+    An object whose attributes are spread over several files, e.g. an EnergyConsumer in the EQ and the SSH file, is
+    yielded once per class element. The values are the texts of the XML elements, they are not converted.
+
+    :param xml_files: CIM RDF/XML files, zip archives are expanded like in :func:`~cimpy.cimimport.cim_import`
+    :param classes: a list of class names which are read, e.g. classes=["SvVoltage"]. Other class elements are \
+    skipped while parsing. By default all class elements are read.
+    :param attributes: a list of attribute names which are read, e.g. attributes=["v", "angle"]. By default all \
+    attributes are read.
+    :param parser: "iterparse" (default) or "target", see :func:`~cimpy.cimimport.cim_import`
+    :param use_mmap: if True, XML files are parsed from a memory map, see :func:`~cimpy.cimimport.cim_import`
+    :return: iterator of :class:`~cimpy.cimimport.CIMRecord`
+    """
+    if parser not in _PARSERS:
+        raise ValueError("parser must be one of {}, not {!r}".format(", ".join(_PARSERS), parser))
+
+    keep = _ElementFilter(include=classes) if classes is not None else None
+    if attributes is not None:
+        attributes = frozenset(attributes)
+
+    for source in expand_sources(xml_files, use_mmap):
+        namespaces = _get_namespaces(source)
+        namespace_rdf = _get_rdf_namespace(namespaces)
+        base = "{" + namespaces["cim"] + "}"
+
+        current = None
+        records = _iter_records(
+            source, namespace_rdf, base, attributes=attributes is None or bool(attributes), keep=keep, parser=parser
+        )
+        for record in records:
+            kind = record[0]
+            if kind == _ATTRIBUTE:
+                if current is None:
+                    continue
+                _, attr, text, resource = record
+                if attributes is not None and attr not in attributes:
+                    continue
+                if resource is None:
+                    current.attrs[attr] = text
+                elif resource[0] == "#":
+                    # A reference read more than once is a list of mRIDs
+                    refs = current.refs
+                    if attr not in refs:
+                        refs[attr] = resource[1:]
+                    elif isinstance(refs[attr], list):
+                        refs[attr].append(resource[1:])
+                    else:
+                        refs[attr] = [refs[attr], resource[1:]]
+                else:
+                    # Enumeration, e.g. http://iec.ch/TC57/2013/CIM-schema-cim16#PhaseCode.ABC
+                    current.attrs[attr] = resource.rsplit(".", 1)[-1]
+            elif kind == _CLASS or kind == _ABOUT:
+                if current is not None:
+                    yield current
+                _, uuid, tag, package = record
+                current = CIMRecord(uuid, tag, short_profile_name.get(package), {}, {})
+            elif kind == _SKIPPED:
+                if current is not None:
+                    yield current
+                current = None
+
+        if current is not None:
+            yield current
+
+
+# This function parses one RDF file and yields a flat stream of records: the header elements of the model description,
+# the start of every class element (rdf:ID or rdf:about) and the attributes/references inside of it. The package the
+# class was read from is determined by the md:Model.profile element and added to the class records. Attribute records
+# are skipped if attributes is False. All import steps work on this stream, so the file is read in exactly one place.
+# Class elements for which keep(tag, uuid) returns False are skipped together with their attributes. If profiles is
+# given, the rest of a file is skipped at its first class element if the profile of the file is not in profiles.
+# The file is parsed with iterparse or, if parser is "target", with _iter_records_target.
+def _iter_records(source, namespace_rdf, base, attributes=True, keep=None, profiles=None, parser="iterparse"):
+
+    if parser == "target":
+        yield from _iter_records_target(source, namespace_rdf, base, attributes, keep, profiles)
+        return
+
+    rdf_id = "{%s}ID" % namespace_rdf
+    rdf_about = "{%s}about" % namespace_rdf
+    rdf_resource = "{%s}resource" % namespace_rdf
+
+    # Length of element tag base
+    m = len(base)
+
+    with open_source(source) as stream:
+        # Reset stream
+        if hasattr(stream, "seek"):
+            stream.seek(0)
+
+        # Get an iterable and turn it into an iterator (required for cElementTree).
+        context = iter(etree.iterparse(stream, ("start", "end")))
 
         # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
         _, root = next(context)
 
         package = ""
+        in_class = False
+        skip = False
 
         for event, elem in context:
-
-            # Process 'end' elements in the CGMES namespace.
-            if event == "end" and elem.tag[:m] == base:
-
-                # Check if the element has the attribute "rdf:ID" --> CGMES class located
-                uuid = elem.get("{%s}ID" % namespace_rdf)
-                if uuid is not None:  # CIM class
-                    # Element tag without namespace (e.g. VoltageLevel).
-                    tag = elem.tag[m:]
-                    try:
-                        # Import the module for the CGMES object.
-                        module_name = cgmes_version_path + "." + tag
-                        module = importlib.import_module(module_name)
-                    except ModuleNotFoundError:
-                        error_msg = "Module {} not implemented".format(tag)
-                        try:
-                            logger_grouped["errors"][error_msg] += 1
-                        except KeyError:
-                            logger_grouped["errors"][error_msg] = 1
-
-                        root.clear()
+            tag = elem.tag
+
+            # Process elements in the CGMES namespace.
+            if tag[:m] == base:
+                if event == "start":
+                    if not in_class:
+                        kind = _CLASS
+                        uuid = elem.get(rdf_id)
+                        if uuid is None:
+                            kind = _ABOUT
+                            uuid = elem.get(rdf_about)
+                            if uuid is not None:
+                                uuid = uuid[1:]
+                        if uuid is not None:
+                            in_class = True
+                            if profiles is not None and short_profile_name.get(package) not in profiles:
+                                # All classes of a file belong to the profile of the file
+                                yield _SKIPPED, None
+                                return
+                            skip = keep is not None and not keep(tag[m:], uuid)
+                            if skip:
+                                yield _SKIPPED, uuid
+                            else:
+                                yield kind, uuid, tag[m:], package
+                    continue
+
+                if in_class:
+                    if elem.get(rdf_id) is None and elem.get(rdf_about) is None:
+                        if attributes and not skip:
+                            # Get the attribute/reference name and use the rdf:resource attribute to distinguish between
+                            # attributes and references/enums.
+                            yield _ATTRIBUTE, tag[m:].rsplit(".")[-1], elem.text, elem.get(rdf_resource)
                         continue
 
-                    # Get the CGMES class from the module.
-                    klass = getattr(module, tag)
-                    # Instantiate the class and map it to the uuid.
-                    topology[uuid] = klass()
-                    info_msg = "CIM object {} created".format(module_name.split(".")[-1])
-                    try:
-                        logger_grouped["info"][info_msg] += 1
-                    except KeyError:
-                        logger_grouped["info"][info_msg] = 1
-
-                    # Check if the class has the attribute mRID and set the mRID to the read in UUID. If the class
-                    # does not has this attribute, the UUID is only stored in the res dictionary.
-                    if hasattr(topology[uuid], "mRID"):
-                        topology[uuid].mRID = uuid
-
-                    if package != "":
-                        topology[uuid].serializationProfile["class"] = short_profile_name[package]
-                    else:
-                        error_msg = "Package information not found for class {}".format(klass.__class__.__name__)
-                        try:
-                            logger_grouped["errors"][error_msg] += 1
-                        except KeyError:
-                            logger_grouped["errors"][error_msg] = 1
+                    # Class closing element (e.g. </cim:Terminal>).
+                    in_class = False
 
-            # Check which package is read
-            elif event == "end":
-                if "Model.profile" in elem.tag:
+            # Check which package is read and pass on the model description
+            elif event == "end" and not in_class and "Model." in tag:
+                if "Model.profile" in tag:
                     for package_key in short_profile_name.keys():
                         if package_key in elem.text:
                             package = package_key
                             break
-
-                # The author of all imported files should be the same, avoid multiple entries
-                elif "author" in import_result["meta_info"].keys():
-                    pass
-
-                # Extract author
-                elif "Model.createdBy" in elem.tag:
-                    import_result["meta_info"]["author"] = elem.text
-                elif "Model.modelingAuthoritySet" in elem.tag:
-                    import_result["meta_info"]["author"] = elem.text
+                yield _MODEL, tag, elem.text
 
             # Clear children of the root element to minimise memory usage.
             root.clear()
 
-    return import_result, logger_grouped
+
+# Number of bytes fed to the target parser at once
+_FEED_SIZE = 1 << 16
+
+
+# Yields the same records as _iter_records, but the file is parsed by an lxml parser with a _RecordTarget. The parser
+# calls the target for every start tag, text and end tag, no element objects are created. The records collected for
+# each chunk of the file are yielded before the next chunk is parsed.
+def _iter_records_target(source, namespace_rdf, base, attributes=True, keep=None, profiles=None):
+    target = _RecordTarget(namespace_rdf, base, attributes, keep, profiles)
+    parser = etree.XMLParser(target=target)
+    records = target.records
+
+    with open_source(source) as stream:
+        if isinstance(stream, (str, os.PathLike)):
+            stream = file = open(stream, "rb")
+        else:
+            file = None
+            # Reset stream
+            if hasattr(stream, "seek"):
+                stream.seek(0)
+
+        try:
+            for chunk in iter(lambda: stream.read(_FEED_SIZE), b""):
+                parser.feed(chunk)
+                yield from records
+                del records[:]
+                if target.done:
+                    return
+            parser.close()
+            yield from records
+        finally:
+            if file is not None:
+                file.close()
+
+
+# Parser target turning the events of an RDF file into the records of _iter_records. The state is the same as in
+# _iter_records: whether a class element is open and skipped, and the package of the file. The attributes of the open
+# elements are kept on a stack because the end event has no element to read them from. The text of an element is the
+# text before its first child, like the text of an lxml element. The parser appends the text directly to parts.
+class _RecordTarget:
+    def __init__(self, namespace_rdf, base, attributes, keep, profiles):
+        self.rdf_id = "{%s}ID" % namespace_rdf
+        self.rdf_about = "{%s}about" % namespace_rdf
+        self.rdf_resource = "{%s}resource" % namespace_rdf
+        self.base = base
+        self.m = len(base)
+        self.attributes = attributes
+        self.keep = keep
+        self.profiles = profiles
+
+        self.records = []
+        # True after the rest of the file is skipped
+        self.done = False
+        self.package = ""
+        self.in_class = False
+        self.skip = False
+        # Attributes of the open elements
+        self.stack = []
+        # Text parts read since the last start or end tag, the text of the innermost element if open is True
+        self.parts = []
+        self.data = self.parts.append
+        self.open = False
+        # Text of open elements with children by their depth
+        self.texts = {}
+
+    def start(self, tag, attrib):
+        stack = self.stack
+        parts = self.parts
+        if self.open and parts:
+            self.texts[len(stack)] = "".join(parts)
+        del parts[:]
+        self.open = True
+        if not attrib:
+            # The empty mapping passed by lxml is slow to look up
+            attrib = {}
+        stack.append(attrib)
+
+        m = self.m
+        if self.in_class or self.done or tag[:m] != self.base:
+            return
+
+        kind = _CLASS
+        uuid = attrib.get(self.rdf_id)
+        if uuid is None:
+            kind = _ABOUT
+            uuid = attrib.get(self.rdf_about)
+            if uuid is not None:
+                uuid = uuid[1:]
+        if uuid is not None:
+            self.in_class = True
+            if self.profiles is not None and short_profile_name.get(self.package) not in self.profiles:
+                # All classes of a file belong to the profile of the file
+                self.records.append((_SKIPPED, None))
+                self.done = True
+                return
+            self.skip = self.keep is not None and not self.keep(tag[m:], uuid)
+            if self.skip:
+                self.records.append((_SKIPPED, uuid))
+            else:
+                self.records.append((kind, uuid, tag[m:], self.package))
+
+    def end(self, tag):
+        stack = self.stack
+        parts = self.parts
+        attrib = stack.pop()
+        if self.open:
+            text = "".join(parts) if parts else None
+            self.open = False
+        else:
+            text = self.texts.pop(len(stack) + 1, None)
+        del parts[:]
+
+        m = self.m
+        if self.done:
+            return
+        if tag[:m] == self.base:
+            if self.in_class:
+                if attrib.get(self.rdf_id) is None and attrib.get(self.rdf_about) is None:
+                    if self.attributes and not self.skip:
+                        self.records.append((_ATTRIBUTE, tag[m:].rsplit(".")[-1], text, attrib.get(self.rdf_resource)))
+                else:
+                    # Class closing element (e.g. </cim:Terminal>).
+                    self.in_class = False
+
+        # Check which package is read and pass on the model description
+        elif not self.in_class and "Model." in tag:
+            if "Model.profile" in tag:
+                for package_key in short_profile_name.keys():
+                    if package_key in text:
+                        self.package = package_key
+                        break
+            self.records.append((_MODEL, tag, text))
+
+    def close(self):
+        return None
+
+
+# This function extracts the author from the model description. The author of all imported files should be the same,
+# therefore only the first entry is stored.
+def _set_author(meta_info, tag, text):
+    if "Model.profile" in tag or "author" in meta_info.keys():
+        return
+    if "Model.createdBy" in tag or "Model.modelingAuthoritySet" in tag:
+        meta_info["author"] = text
+
+
+# This function instantiates the class of a CGMES element with default values and maps it to the uuid. The mRID is
+# set for all classes that have this attribute and the package the class was read from is stored in the
+# serializationProfile dictionary. The uuid is interned in strings. Returns None if the class is not implemented.
+def _create_object(topology, uuid, tag, package, schema, diagnostics, strings):
+    # Get the CGMES class from the schema registry.
+    klass = schema.get_class(tag)
+    if klass is None:
+        diagnostics.add("class_not_implemented", tag, sample=uuid)
+        return None
+
+    # Instantiate the class and map it to the uuid.
+    uuid = strings.setdefault(uuid, uuid)
+    obj = klass()
+    topology[uuid] = obj
+    diagnostics.add("object_created", tag)
+
+    # Check if the class has the attribute mRID and set the mRID to the read in UUID. If the class
+    # does not has this attribute, the UUID is only stored in the res dictionary.
+    if "mRID" in schema.attributes(klass):
+        obj.mRID = uuid
+
+    if package != "":
+        obj.serializationProfile["class"] = short_profile_name[package]
+    else:
+        diagnostics.add("package_not_found", tag, sample=uuid)
+
+    return obj
+
+
+# This function instantiates the classes defined in all RDF files. All attributes are set to default values.
+# The only exception is the mRID which is set for all classes that have this attribute. The attributes of a class
+# are set in the _set_attributes function because some attributes might be stored in one package and the class in
+# another. Since after this function all classes are instantiated, there should be no problem in setting the attributes.
+# Also the information from which package file a class was read is stored in the serializationProfile dictionary.
+def _instantiate_classes(
+    import_result, xml_files, schema, namespace_rdf, base, diagnostics, stats, parser="iterparse", strings=None
+):
+
+    if strings is None:
+        strings = {}
+
+    # Extract topology from import_result
+    topology = import_result["topology"]
+    meta_info = import_result["meta_info"]
+    start = perf_counter()
+    stats.start_phase("instantiate_classes")
+
+    # First step: create the dict res{uuid}=instance_of_the_cim_class
+    for xml_file in xml_files:
+
+        logger.info('START of parsing file "%s"', xml_file)
+
+        records = _iter_records(xml_file, namespace_rdf, base, attributes=False, parser=parser)
+        for record in stats.records(xml_file, "instantiate_classes", records):
+            if record[0] == _CLASS:
+                _create_object(topology, record[1], record[2], record[3], schema, diagnostics, strings)
+            elif record[0] == _MODEL:
+                _set_author(meta_info, record[1], record[2])
+
+    stats.add_phase("instantiate_classes", perf_counter() - start)
+    return import_result, diagnostics
 
 
 # This function sets all attributes after the classes are instantiated by _instanciate_classes. Cyclic attributes like
 # PowerTransformerEnd <-> PowerTransformer are set. This function also stores the information from which package file
 # the attributes are read in the serializationProfile dictionary.
-def _set_attributes(import_result, xml_files, namespace_rdf, base, logger_grouped):
+def _set_attributes(
+    import_result, xml_files, schema, namespace_rdf, base, diagnostics, stats, parser="iterparse", strings=None
+):
+
+    if strings is None:
+        strings = {}
 
     topology = import_result["topology"]
     urls = import_result["meta_info"]["urls"]
-
-    m = len(base)
+    start = perf_counter()
+    stats.start_phase("set_attributes")
 
     # Second step pass sets attributes and references.
     for xml_file in xml_files:
 
-        # Get an iterable and turn it into an iterator (required for cElementTree).
-        context = iter(etree.iterparse(xml_file, ("start", "end")))
+        obj = uuid = package = None
+
+        records = _iter_records(xml_file, namespace_rdf, base, parser=parser)
+        for record in stats.records(xml_file, "set_attributes", records):
+            if record[0] == _ATTRIBUTE:
+                if obj is not None:
+                    _set_attribute(
+                        obj,
+                        uuid,
+                        record[1],
+                        record[2],
+                        record[3],
+                        package,
+                        topology,
+                        urls,
+                        schema,
+                        diagnostics,
+                        stats,
+                        strings,
+                    )
+            elif record[0] == _CLASS or record[0] == _ABOUT:
+                _, uuid, tag, package = record
+                # Locate the CGMES object using the uuid.
+                obj = _get_object(topology, uuid, tag, diagnostics)
 
-        # Reset stream
-        if hasattr(xml_file, "seek"):
-            xml_file.seek(0)
+        logger.info('END of parsing file "%s"', xml_file)
 
-        # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-        _, root = next(context)
+    stats.add_phase("set_attributes", perf_counter() - start)
+    return import_result, diagnostics
+
+
+# This function parses every RDF file only once. Classes are instantiated as soon as their rdf:ID is read and
+# attributes are set right away. An attribute record is stored in a fixup table instead if its object or the referenced
+# object does not exist yet (rdf:about before rdf:ID or forward rdf:resource). To keep the result identical to the two
+# step import, every later record touching an object, a referenced object, a serializationProfile entry or an url
+# mapping which is already waiting in the fixup table is also stored there. The fixup table is applied in document
+# order after the last file was parsed. Class elements removed by keep or profiles are skipped. If include_referenced
+# is True, the objects they reference but which were skipped are read in a second round before the fixup table is
+# applied. If overlay is given, the objects of its base topology are not changed, see cim_import_overlay. The strings
+# read are interned in strings.
+def _import_single_pass(
+    import_result,
+    xml_files,
+    schema,
+    namespace_rdf,
+    base,
+    diagnostics,
+    stats,
+    workers=None,
+    keep=None,
+    profiles=None,
+    include_referenced=False,
+    overlay=None,
+    parser="iterparse",
+    strings=None,
+):
+
+    if strings is None:
+        strings = {}
+    topology = import_result["topology"]
+    meta_info = import_result["meta_info"]
+    urls = meta_info["urls"]
 
-        package = ""
+    # Entries (uuid, tag, package, attr, text, resource). Entries with attr None mark the start of a class element.
+    fixups = []
+    # uuids, (class name, attribute) and (None, attribute) for url mappings touched by the entries in fixups
+    pending = set()
 
-        for event, elem in context:
+    # uuids of the class elements removed by the filter and whether the rest of a file was skipped
+    skipped = set()
+    skipped_files = False
 
-            # Process 'start' elements in the CGMES namespace.
-            if event == "start" and elem.tag[:m] == base:
-                uuid = elem.get("{%s}ID" % namespace_rdf)
-                if uuid is None:
-                    uuid = elem.get("{%s}about" % namespace_rdf)
-                    if uuid is not None:
-                        uuid = uuid[1:]
-                if uuid is not None:
-                    # Locate the CGMES object using the uuid.
-                    try:
-                        obj = topology[uuid]
-                    except KeyError:
-                        error_msg = "Missing {} object with uuid: {}".format(elem.tag[m:], uuid)
-                        try:
-                            logger_grouped["errors"][error_msg] += 1
-                        except KeyError:
-                            logger_grouped["errors"][error_msg] = 1
-                        root.clear()
-                        continue
+    start = perf_counter()
+    stats.start_phase("single_pass")
+    streams = _iter_record_streams(xml_files, namespace_rdf, base, workers, keep, profiles, parser)
+    while streams is not None:
+        for xml_file, records in stats.streams(streams, "single_pass"):
 
-                    # Iterate over attributes/references.
-                    for event, elem in context:
-                        # Process end events with elements in the CIM namespace.
-                        if event == "end" and elem.tag[:m] == base:
-                            # Break if class closing element (e.g. </cim:Terminal>).
-                            if (
-                                elem.get("{%s}ID" % namespace_rdf) is None
-                                and elem.get("{%s}about" % namespace_rdf) is None
-                            ):
-                                # Get the attribute/reference name.
-                                attr = elem.tag[m:].rsplit(".")[-1]
-
-                                if not hasattr(obj, attr):
-                                    error_msg = "'%s' has not attribute '%s'" % (
-                                        obj.__class__.__name__,
-                                        attr,
-                                    )
-                                    try:
-                                        logger_grouped["errors"][error_msg] += 1
-                                    except KeyError:
-                                        logger_grouped["errors"][error_msg] = 1
-                                    continue
-
-                                # Use the rdf:resource attribute to distinguish between attributes and references/enums.
-                                uuid2 = elem.get("{%s}resource" % namespace_rdf)
-
-                                if uuid2 is None:  # attribute
-                                    # Convert value type using the default value.
-                                    try:
-                                        typ = type(getattr(obj, attr))
-                                        if isinstance(getattr(obj, attr), bool):  # if typ==<class 'bool'>
-                                            # The function bool("false") returns True,
-                                            # because it is called upon non-empty string!
-                                            # This means that it wrongly reads "false" value as boolean True.
-                                            # This is why this special case testing is necessary.
-                                            if str.title(elem.text) == "True":
-                                                setattr(obj, attr, True)
-                                            else:
-                                                setattr(obj, attr, False)
-                                        else:
-                                            setattr(obj, attr, typ(elem.text))
-                                    except TypeError:
-                                        try:
-                                            setattr(obj, attr, elem.text)
-                                        except TypeError:
-                                            pass
-
-                                else:  # reference or enum (uuid2 is not None)
-                                    # Use the '#' prefix to distinguish between references and enumerations.
-                                    if uuid2[0] == "#":  # reference
-                                        try:
-                                            val = topology[uuid2[1:]]  # remove '#' prefix
-                                        except KeyError:
-                                            error_msg = "Referenced {} [{}] object missing.".format(
-                                                obj.__class__.__name__, uuid2[1:]
-                                            )
-                                            try:
-                                                logger_grouped["errors"][error_msg] += 1
-                                            except KeyError:
-                                                logger_grouped["errors"][error_msg] = 1
-
-                                            continue
-
-                                        default = getattr(obj, attr)
-                                        if default is None:  # 1..1 or 0..1
-                                            # Rely on properties to set any bi-directional references.
-                                            setattr(obj, attr, val)
-                                        elif default == "list":  # Many
-                                            setattr(obj, attr, [val])
-                                        elif isinstance(default, list):  # Many
-                                            attribute = getattr(obj, attr)
-                                            if val not in attribute:
-                                                attribute.append(val)
-                                                setattr(obj, attr, attribute)
-                                        elif default == val:
-                                            # Attribute reference already resolved
-                                            pass
-                                        else:
-                                            # Note here
-                                            error_msg = (
-                                                "Multiplicity Error for class {} [{}], attribute {}. ".format(
-                                                    obj.__class__.__name__, uuid, attr
-                                                )
-                                                + "Multiplicity should be 1..1 or 0..1"
-                                            )
-                                            try:
-                                                logger_grouped["errors"][error_msg] += 1
-                                            except KeyError:
-                                                logger_grouped["errors"][error_msg] = 1
-
-                                        if hasattr(val, obj.__class__.__name__):
-                                            default1 = getattr(val, obj.__class__.__name__)
-                                            if default1 is None:
-                                                setattr(val, obj.__class__.__name__, obj)
-                                            elif default1 == "list":  # Many
-                                                setattr(val, obj.__class__.__name__, [obj])
-                                            elif isinstance(default1, list):  # Many
-                                                attribute2 = getattr(val, obj.__class__.__name__)
-                                                if obj not in attribute2:
-                                                    attribute2.append(obj)
-                                                    setattr(
-                                                        val,
-                                                        obj.__class__.__name__,
-                                                        attribute2,
-                                                    )
-                                            elif default1 == obj:
-                                                pass
-                                            else:
-                                                error_msg = (
-                                                    "Multiplicity Error for class {} [{}], attribute {}. ".format(
-                                                        val.__class__.__name__,
-                                                        uuid2[1:],
-                                                        obj.__class__.__name__,
-                                                    )
-                                                    + "Multiplicity should be 1..1 or 0..1"
-                                                )
-                                                try:
-                                                    logger_grouped["errors"][error_msg] += 1
-                                                except KeyError:
-                                                    logger_grouped["errors"][error_msg] = 1
-
-                                    else:  # Enum
-                                        # if http in uuid2 reference to URL, create mapping
-                                        if "http" in uuid2:
-                                            if attr in urls.keys():
-                                                if uuid2.rsplit(".", 1)[1] not in urls[attr].keys():
-                                                    urls[attr][uuid2.rsplit(".", 1)[1]] = uuid2
-                                            else:
-                                                urls[attr] = {uuid2.rsplit(".", 1)[1]: uuid2}
-
-                                            # url_reference_dict[uuid2.rsplit(".", 1)[1]] = uuid2
-                                        val = uuid2.rsplit(".", 1)[1]
-                                        setattr(obj, attr, val)
-
-                                if package != "":
-                                    obj.serializationProfile[attr] = short_profile_name[package]
-                                else:
-                                    error_msg = "Package information not found for class {}, attribute {}".format(
-                                        obj.__class__.__name__, attr
-                                    )
-                                    try:
-                                        logger_grouped["errors"][error_msg] += 1
-                                    except KeyError:
-                                        logger_grouped["errors"][error_msg] = 1
-                            else:  # if elem.get("{%s}ID" % nd_rdf is not None:
-                                # Finished setting object attributes.
-                                break
-
-            # Check which package is read
-            elif event == "end" and "Model.profile" in elem.tag:
-                for package_key in short_profile_name.keys():
-                    if package_key in elem.text:
-                        package = package_key
-                        break
+            logger.info('START of parsing file "%s"', xml_file)
 
-            # Clear children of the root element to minimise memory usage.
-            root.clear()
+            obj = uuid = tag = package = None
+            deferred = False
 
-        logger.info('END of parsing file "%s"', xml_file)
-    return import_result, logger_grouped
+            for record in records:
+                kind = record[0]
+
+                if kind == _ATTRIBUTE:
+                    if obj is None and not deferred:
+                        # Class not implemented
+                        continue
 
+                    _, attr, text, resource = record
+                    profile_key = (obj.__class__.__name__ if obj is not None else tag, attr)
+                    forward = False
+                    if resource is None:
+                        resource_key = uuid
+                    elif resource[0] == "#":
+                        resource_key = resource[1:]
+                        forward = resource_key not in topology
+                    else:
+                        resource_key = (None, attr)
+
+                    if not deferred and (
+                        forward or uuid in pending or profile_key in pending or resource_key in pending
+                    ):
+                        fixups.append((uuid, tag, package, None, None, None))
+                        deferred = True
+
+                    if deferred:
+                        fixups.append((uuid, tag, package, attr, text, resource))
+                        pending.add(uuid)
+                        pending.add(profile_key)
+                        pending.add(resource_key)
+                    else:
+                        _set_attribute(
+                            obj,
+                            uuid,
+                            attr,
+                            text,
+                            resource,
+                            package,
+                            topology,
+                            urls,
+                            schema,
+                            diagnostics,
+                            stats,
+                            strings,
+                            overlay,
+                        )
+
+                elif kind == _CLASS:
+                    _, uuid, tag, package = record
+                    obj = _create_object(topology, uuid, tag, package, schema, diagnostics, strings)
+                    deferred = False
+                    if obj is None:
+                        _get_object(topology, uuid, tag, diagnostics)
+
+                elif kind == _ABOUT:
+                    _, uuid, tag, package = record
+                    obj = _overlay_object(topology, overlay, uuid, topology.get(uuid))
+                    deferred = obj is None or uuid in pending
+                    if deferred:
+                        fixups.append((uuid, tag, package, None, None, None))
+                        pending.add(uuid)
+
+                elif kind == _SKIPPED:
+                    if record[1] is None:
+                        skipped_files = True
+                    else:
+                        skipped.add(record[1])
+
+                else:
+                    _set_author(meta_info, record[1], record[2])
+
+            logger.info('END of parsing file "%s"', xml_file)
+
+        streams = None
+        if include_referenced and (skipped or skipped_files):
+            # Read the skipped objects referenced by the imported objects
+            referenced = set(
+                resource[1:]
+                for _, _, _, attr, _, resource in fixups
+                if resource is not None and resource[0] == "#" and resource[1:] not in topology
+            )
+            if referenced:
+                streams = _iter_record_streams(
+                    xml_files, namespace_rdf, base, workers, _ElementFilter(uuids=referenced), parser=parser
+                )
+            include_referenced = False
+
+    stats.add_phase("single_pass", perf_counter() - start)
+    start = perf_counter()
+    stats.start_phase("fixups")
+
+    # Drain the fixup table
+    obj = None
+    for uuid, tag, package, attr, text, resource in fixups:
+        if attr is None:
+            if uuid not in topology and (skipped_files or uuid in skipped):
+                obj = None
+                diagnostics.add("filtered_object", tag, sample=uuid)
+            else:
+                obj = _overlay_object(topology, overlay, uuid, _get_object(topology, uuid, tag, diagnostics))
+        elif obj is not None:
+            if (
+                resource is not None
+                and resource[0] == "#"
+                and resource[1:] not in topology
+                and (skipped_files or resource[1:] in skipped)
+            ):
+                diagnostics.add("filtered_reference", obj.__class__.__name__, attr, resource[1:])
+                continue
+            _set_attribute(
+                obj,
+                uuid,
+                attr,
+                text,
+                resource,
+                package,
+                topology,
+                urls,
+                schema,
+                diagnostics,
+                stats,
+                strings,
+                overlay,
+            )
+
+    stats.add_phase("fixups", perf_counter() - start)
+    return import_result, diagnostics
+
+
+# Yields (xml_file, records) for every file in the given order. With more than one worker the files are parsed in a
+# process pool and the records of a file are returned as a list as soon as the file is parsed.
+def _iter_record_streams(xml_files, namespace_rdf, base, workers=None, keep=None, profiles=None, parser="iterparse"):
+    paths = [xml_file for xml_file in xml_files if isinstance(xml_file, (str, os.PathLike, ZipMember, MappedFile))]
+    if not workers or workers <= 1 or len(paths) <= 1:
+        for xml_file in xml_files:
+            yield xml_file, _iter_records(xml_file, namespace_rdf, base, keep=keep, profiles=profiles, parser=parser)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        futures = [
+            (
+                executor.submit(_parse_records, xml_file, namespace_rdf, base, keep, profiles, parser)
+                if xml_file in paths
+                else None
+            )
+            for xml_file in xml_files
+        ]
+        for xml_file, future in zip(xml_files, futures):
+            if future is not None:
+                yield xml_file, future.result()
+            else:
+                yield xml_file, _iter_records(
+                    xml_file, namespace_rdf, base, keep=keep, profiles=profiles, parser=parser
+                )
+
+
+# Parses one file in a worker process and returns its records
+def _parse_records(source, namespace_rdf, base, keep=None, profiles=None, parser="iterparse"):
+    return list(_iter_records(source, namespace_rdf, base, keep=keep, profiles=profiles, parser=parser))
+
+
+# Filter of class elements by their class name and uuid. A class is kept if it is in include (if given) and not in
+# exclude (if given) and its uuid is in uuids (if given). Defined on module level to be passed to worker processes.
+class _ElementFilter:
+    def __init__(self, include=None, exclude=None, uuids=None):
+        self.include = frozenset(include) if include is not None else None
+        self.exclude = frozenset(exclude) if exclude is not None else None
+        self.uuids = uuids
+
+    def __call__(self, tag, uuid):
+        if self.uuids is not None and uuid not in self.uuids:
+            return False
+        if self.include is not None and tag not in self.include:
+            return False
+        return self.exclude is None or tag not in self.exclude
+
+
+# Returns the object mapped to uuid or logs an error if the object is missing
+def _get_object(topology, uuid, tag, diagnostics):
+    try:
+        return topology[uuid]
+    except KeyError:
+        diagnostics.add("missing_object", tag, sample=uuid)
+        return None
+
+
+# Returns the object of uuid to be changed by an overlay import. An object of the base topology is copied on the first
+# write and the copy replaces it in the topology, so the base model is not changed. Its lists of references are copied
+# and the inverse references the overlay held for it are moved to the copy. The other objects of the base topology
+# still refer to the original.
+def _overlay_object(topology, overlay, uuid, obj):
+    if overlay is None or obj is None or overlay.base_topology.get(uuid) is not obj:
+        return obj
+    original = obj
+    obj = original.__class__.__new__(original.__class__)
+    obj.__dict__ = {
+        attr: ReferenceList(value) if isinstance(value, list) else value for attr, value in vars(original).items()
+    }
+    obj.__dict__.update(overlay.references.pop(uuid, {}))
+    topology[uuid] = obj
+    return obj
+
+
+# Sets the inverse reference attribute inverse of val, the object of key, to obj, the object of uuid, in an overlay
+# import. The inverse reference of an object shared with the base model is held in the references of the overlay, the
+# object itself is not changed. obj may be the copy of an object of the base model, which is already referred to as
+# the original by the objects of the base model.
+def _set_overlay_inverse(overlay, key, val, inverse, obj, uuid, diagnostics):
+    if overlay.base_topology.get(key) is val:
+        target = overlay.references.setdefault(key, {})
+        if inverse not in target:
+            default = getattr(val, inverse)
+            target[inverse] = ReferenceList(default) if isinstance(default, list) else default
+    else:
+        target = vars(val)
+
+    original = overlay.base_topology.get(uuid)
+    default = target[inverse]
+    if default is None:
+        target[inverse] = obj
+    elif default == "list":  # Many
+        target[inverse] = ReferenceList([obj])
+    elif isinstance(default, list):  # Many
+        if obj not in default and original not in default:
+            default.append(obj)
+    elif default is obj or default is original:
+        pass
+    else:
+        diagnostics.add("multiplicity", val.__class__.__name__, inverse, key)
+
+
+# This function sets one attribute or reference of obj. The type conversion and the multiplicity are looked up in the
+# schema registry. Cyclic attributes like PowerTransformerEnd <-> PowerTransformer are set and the package the
+# attribute was read from is stored in the serializationProfile dictionary. String and enumeration values are
+# interned in strings. In an overlay import, the objects of the base topology of overlay are not changed, see
+# _set_overlay_inverse.
+def _set_attribute(
+    obj, uuid, attr, text, uuid2, package, topology, urls, schema, diagnostics, stats, strings, overlay=None
+):
 
-# Returns a map of prefix to namespace for the given XML file.
+    try:
+        attribute_schema = schema.attributes(obj.__class__)[attr]
+    except KeyError:
+        diagnostics.add("unknown_attribute", obj.__class__.__name__, attr, uuid)
+        return
+
+    if uuid2 is None:  # attribute
+        # Convert value type using the coercer derived from the default value.
+        coercer = attribute_schema.coercer
+        value = text
+        if coercer is not None:
+            try:
+                value = coercer(text)
+            except TypeError:
+                pass
+        if value.__class__ is str:
+            value = strings.setdefault(value, value)
+        setattr(obj, attr, value)
+        stats.attributes_set += 1
+
+    else:  # reference or enum (uuid2 is not None)
+        # Use the '#' prefix to distinguish between references and enumerations.
+        if uuid2[0] == "#":  # reference
+            try:
+                val = topology[uuid2[1:]]  # remove '#' prefix
+            except KeyError:
+                diagnostics.add("missing_reference", obj.__class__.__name__, attr, uuid2[1:])
+                return
+            stats.references_resolved += 1
+
+            default = getattr(obj, attr)
+            if attribute_schema.multiplicity == MANY and default == "list":
+                setattr(obj, attr, ReferenceList([val]))
+            elif attribute_schema.multiplicity == MANY and isinstance(default, list):
+                if val not in default and (overlay is None or overlay.base_topology.get(uuid2[1:]) not in default):
+                    default.append(val)
+            elif default is None:  # 1..1 or 0..1
+                # Rely on properties to set any bi-directional references.
+                setattr(obj, attr, val)
+            elif default == val:
+                # Attribute reference already resolved
+                pass
+            elif overlay is not None and default is overlay.base_topology.get(uuid2[1:]):
+                # Reference to the original of a copied object of the base topology
+                setattr(obj, attr, val)
+            else:
+                diagnostics.add("multiplicity", obj.__class__.__name__, attr, uuid)
+
+            inverse = attribute_schema.inverse
+            if overlay is not None and inverse in schema.attributes(val.__class__):
+                _set_overlay_inverse(overlay, uuid2[1:], val, inverse, obj, uuid, diagnostics)
+            elif inverse in schema.attributes(val.__class__):
+                default1 = getattr(val, inverse)
+                if default1 is None:
+                    setattr(val, inverse, obj)
+                elif default1 == "list":  # Many
+                    setattr(val, inverse, ReferenceList([obj]))
+                elif isinstance(default1, list):  # Many
+                    if obj not in default1:
+                        default1.append(obj)
+                elif default1 == obj:
+                    pass
+                else:
+                    diagnostics.add("multiplicity", val.__class__.__name__, inverse, uuid2[1:])
+
+        else:  # Enum
+            # if http in uuid2 reference to URL, create mapping
+            if "http" in uuid2:
+                if attr in urls.keys():
+                    if uuid2.rsplit(".", 1)[1] not in urls[attr].keys():
+                        urls[attr][uuid2.rsplit(".", 1)[1]] = uuid2
+                else:
+                    urls[attr] = {uuid2.rsplit(".", 1)[1]: uuid2}
+
+                # url_reference_dict[uuid2.rsplit(".", 1)[1]] = uuid2
+            val = uuid2.rsplit(".", 1)[1]
+            setattr(obj, attr, strings.setdefault(val, val))
+            stats.attributes_set += 1
+
+    if package != "":
+        obj.serializationProfile[attr] = short_profile_name[package]
+    else:
+        diagnostics.add("attribute_package_not_found", obj.__class__.__name__, attr, uuid)
+
+
+# Returns a map of prefix to namespace for the given XML file. The namespaces are found by a byte search in the header
+# of files on disk and of memory maps. Other sources and files for which the search fails are parsed until the first
+# closing tag.
 def _get_namespaces(source):
+    if isinstance(source, (str, os.PathLike)) and os.path.isfile(source):
+        source = MappedFile(source)
+    if isinstance(source, (MappedFile, mmap.mmap)):
+        with open_source(source) as stream:
+            header = scan_header(stream) if isinstance(stream, mmap.mmap) else None
+        if header is not None:
+            return header[0]
+
     namespaces = {}
     events = ("end", "start-ns", "end-ns")
-    for event, elem in etree.iterparse(source, events):
-        if event == "start-ns":
-            prefix, ns = elem
-            namespaces[prefix] = ns
-        elif event == "end":
-            break
-
-    # Reset stream
-    if hasattr(source, "seek"):
-        source.seek(0)
+    with open_source(source) as stream:
+        for event, elem in etree.iterparse(stream, events):
+            if event == "start-ns":
+                prefix, ns = elem
+                namespaces[prefix] = ns
+            elif event == "end":
+                break
+
+        # Reset stream
+        if hasattr(stream, "seek") and stream is source:
+            stream.seek(0)
 
     return namespaces
 
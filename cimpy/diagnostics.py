@@ -0,0 +1,97 @@
+import logging
+
+# Categories of the import diagnostics: {category: (level, message)}. The message is formatted with the class and
+# the attribute of a counter only when the diagnostics are logged.
+CATEGORIES = {
+    "class_not_implemented": (logging.WARNING, "Module {cls} not implemented"),
+    "package_not_found": (logging.WARNING, "Package information not found for class {cls}"),
+    "attribute_package_not_found": (
+        logging.WARNING,
+        "Package information not found for class {cls}, attribute {attr}",
+    ),
+    "missing_object": (logging.WARNING, "Missing {cls} object"),
+    "unknown_attribute": (logging.WARNING, "'{cls}' has not attribute '{attr}'"),
+    "missing_reference": (logging.WARNING, "Referenced object of {cls}.{attr} missing"),
+    "multiplicity": (
+        logging.WARNING,
+        "Multiplicity Error for class {cls}, attribute {attr}. Multiplicity should be 1..1 or 0..1",
+    ),
+    "object_created": (logging.INFO, "CIM object {cls} created"),
+    "filtered_object": (logging.INFO, "Attributes of filtered {cls} objects not set"),
+    "filtered_reference": (logging.INFO, "Reference {cls}.{attr} to filtered object not set"),
+}
+
+# Default number of sample ids kept per category
+DEFAULT_MAX_SAMPLES = 10
+
+
+class ImportDiagnostics:
+    """Counters of the errors and infos of an import
+
+    Every event of the import is counted by (category, class, attribute) with an integer counter, the categories are
+    the keys of :data:`CATEGORIES`. For each category at most max_samples different ids of the affected objects are
+    kept, e.g. the uuids of missing objects. Nothing is formatted while importing, the messages are built only by
+    :meth:`log`. The memory used is bounded by the number of classes and attributes, not by the number of elements
+    read.
+    """
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        # {(category, class, attribute): count}, attribute is None for events of a class
+        self.counts = {}
+        # {category: [id]}
+        self.samples = {}
+
+    def add(self, category, cls, attr=None, sample=None):
+        """Counts an event of category for the class name cls and attribute attr
+
+        :param sample: id of the affected object, kept if the category has less than max_samples different ids
+        """
+        key = (category, cls, attr)
+        try:
+            self.counts[key] += 1
+        except KeyError:
+            self.counts[key] = 1
+        if sample is not None:
+            samples = self.samples.setdefault(category, [])
+            if len(samples) < self.max_samples and sample not in samples:
+                samples.append(sample)
+
+    def count(self, category, cls=None):
+        """Returns the number of events of category, only of the class name cls if given"""
+        return sum(
+            count
+            for (key_category, key_cls, _), count in self.counts.items()
+            if key_category == category and (cls is None or key_cls == cls)
+        )
+
+    def as_dict(self):
+        """Returns the diagnostics as plain dictionaries
+
+        :return: {'errors': {category: entry}, 'info': {category: entry}} where entry is a dictionary with the keys \
+        'count', the number of events of the category, 'classes', the numbers by class name or 'class.attribute', \
+        and 'samples', a list of at most max_samples ids of affected objects.
+        """
+        result = dict(errors={}, info={})
+        for (category, cls, attr), count in self.counts.items():
+            group = "errors" if CATEGORIES[category][0] >= logging.WARNING else "info"
+            entry = result[group].get(category)
+            if entry is None:
+                entry = result[group][category] = dict(
+                    count=0, classes={}, samples=list(self.samples.get(category, ()))
+                )
+            entry["count"] += count
+            name = cls if attr is None else "{}.{}".format(cls, attr)
+            entry["classes"][name] = entry["classes"].get(name, 0) + count
+        return result
+
+    def log(self, logger):
+        """Logs one message per counter, errors as warning and infos as info, followed by the sample ids"""
+        for (category, cls, attr), count in sorted(self.counts.items(), key=lambda item: -CATEGORIES[item[0][0]][0]):
+            level, message = CATEGORIES[category]
+            if logger.isEnabledFor(level):
+                logger.log(level, "%s: %d times", message.format(cls=cls, attr=attr), count)
+        for category, samples in self.samples.items():
+            level = CATEGORIES[category][0]
+            if logger.isEnabledFor(level):
+                logger.log(level, "Samples of %s: %s", category, ", ".join(str(sample) for sample in samples))
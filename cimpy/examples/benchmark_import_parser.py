@@ -0,0 +1,67 @@
+import logging
+import cimpy
+import re
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+# Compares the parser backends of cim_import on the CIGRE_MV sample and on a synthetic large grid. The large grid
+# consists of copies of the CIGRE_MV sample with renamed rdf:IDs, the number of copies is the first argument.
+# Usage: python benchmark_import_parser.py [copies] [repetitions]
+
+logging.basicConfig(level=logging.CRITICAL)
+
+example = Path(__file__).resolve().parent
+sample_folder = example / "sampledata" / "CIGRE_MV"
+sample_files = sorted(str(file.absolute()) for file in sample_folder.glob("*.xml"))
+
+copies = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+id_pattern = re.compile(r'(rdf:ID="|rdf:about="#|rdf:resource="#)([^"]+)"')
+
+
+def write_large_grid(folder):
+    large_files = []
+    for file in sample_files:
+        text = Path(file).read_text(encoding="utf-8")
+        head_end = text.index("</md:FullModel>") + len("</md:FullModel>")
+        tail_start = text.rindex("</rdf:RDF>")
+        large_file = Path(folder) / Path(file).name
+        with open(large_file, "w", encoding="utf-8") as output:
+            output.write(text[:head_end])
+            for copy in range(copies):
+                output.write(
+                    id_pattern.sub(
+                        lambda match: '{}{}_{}"'.format(match.group(1), match.group(2), copy),
+                        text[head_end:tail_start],
+                    )
+                )
+            output.write(text[tail_start:])
+        large_files.append(str(large_file))
+    return large_files
+
+
+def benchmark(name, xml_files, **options):
+    for parser in ("iterparse", "target"):
+        times = []
+        for _ in range(repetitions):
+            start = perf_counter()
+            import_result = cimpy.cim_import(xml_files, "cgmes_v2_4_15", parser=parser, **options)
+            times.append(perf_counter() - start)
+        stats = import_result["meta_info"]["stats"]
+        print(
+            "{:<30} {:<10} {:>8} objects  best {:7.3f} s  parse {:7.3f} s  link {:7.3f} s".format(
+                name, parser, len(import_result["topology"]), min(times), stats["parse_time"], stats["link_time"]
+            )
+        )
+
+
+benchmark("CIGRE_MV", sample_files)
+benchmark("CIGRE_MV single pass", sample_files, single_pass=True)
+
+with tempfile.TemporaryDirectory() as folder:
+    large_files = write_large_grid(folder)
+    benchmark("CIGRE_MV x {}".format(copies), large_files)
+    benchmark("CIGRE_MV x {} single pass".format(copies), large_files, single_pass=True)
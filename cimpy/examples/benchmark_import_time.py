@@ -0,0 +1,59 @@
+import subprocess
+import sys
+from pathlib import Path
+
+# Measures the startup cost of cimpy. Each statement runs in a new interpreter with "python -X importtime", the best
+# time of the statement, the cumulative import time of cimpy reported by importtime and the number of imported class
+# modules of cgmes_v2_4_15 are printed. The class modules are imported on first access, so "import cimpy" does not
+# import them and an import of the CIGRE_MV sample only imports the classes it uses. The class modules imported with
+# importlib are not reported by importtime, they are counted in sys.modules.
+# Usage: python benchmark_import_time.py [repetitions]
+
+repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+example = Path(__file__).resolve().parent
+sample_folder = example / "sampledata" / "CIGRE_MV"
+sample_files = sorted(str(file.absolute()) for file in sample_folder.glob("*.xml"))
+
+statements = [
+    ("import cimpy", "import cimpy"),
+    (
+        "import CIGRE_MV",
+        "import cimpy, logging; logging.disable(); cimpy.cim_import({!r}, 'cgmes_v2_4_15')".format(sample_files),
+    ),
+    ("all classes", "import cimpy.cgmes_v2_4_15 as package; [getattr(package, name) for name in dir(package)]"),
+]
+
+measure = """import time
+start = time.perf_counter()
+{}
+import sys
+print(time.perf_counter() - start, sum(1 for module in sys.modules if module.startswith("cimpy.cgmes_v2_4_15.")))
+"""
+
+
+# Returns the time of statement in seconds, the cumulative import time of cimpy in microseconds reported by
+# importtime and the number of imported class modules in one interpreter
+def run(statement):
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", measure.format(statement)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    cimpy_time = None
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[2].strip() == "cimpy":
+            cimpy_time = int(line.split("|")[1])
+    elapsed, class_modules = process.stdout.split()
+    return float(elapsed), cimpy_time, int(class_modules)
+
+
+for name, statement in statements:
+    elapsed, cimpy_time, class_modules = min(run(statement) for _ in range(repetitions))
+    print(
+        "{:<16} {:7.1f} ms  import cimpy {:7.1f} ms  {:>4} class modules".format(
+            name, elapsed * 1000, cimpy_time / 1000, class_modules
+        )
+    )
@@ -0,0 +1,250 @@
+from collections import namedtuple
+import hashlib
+import importlib
+import importlib.util
+import logging
+import os
+import pickle
+
+logger = logging.getLogger(__name__)
+
+# Increase if the content of the cached registry changes
+_SCHEMA_FORMAT = 1
+
+# Multiplicity of an attribute, derived from the default value in the generated classes
+ATTRIBUTE = 0  # Primitive or datatype attribute, e.g. default 0.0, "" or False
+SINGLE = 1  # 0..1 or 1..1 reference or enumeration, default None
+MANY = 2  # 0..n or 1..n reference, default "list", set to a ReferenceList by the import
+
+# Module of a class and its attributes {attr: AttributeSchema} including the inherited ones
+ClassSchema = namedtuple("ClassSchema", ["module", "attributes"])
+
+# coercer: function converting the text of the xml element to the attribute type, None keeps the text
+# multiplicity: ATTRIBUTE, SINGLE or MANY
+# inverse: name of the attribute of a referenced object pointing back to the object (the class name)
+AttributeSchema = namedtuple("AttributeSchema", ["coercer", "multiplicity", "inverse"])
+
+# Registries already loaded in this process: {cgmes_version: SchemaRegistry}
+_registries = {}
+
+
+def _to_bool(text):
+    # The function bool("false") returns True, because it is called upon non-empty string!
+    return str.title(text) == "True"
+
+
+class SchemaRegistry:
+    """Class and attribute schema of a CGMES version
+
+    The registry maps each tag to its class and each attribute of a class to an
+    :class:`~cimpy.schema.AttributeSchema`. The classes are imported on first access. The fingerprint identifies the
+    state of the modules of the version the registry was generated from.
+    """
+
+    def __init__(self, cgmes_version, classes, fingerprint=None):
+        self.cgmes_version = cgmes_version
+        self.classes = classes
+        self.fingerprint = fingerprint
+        self._types = {}
+        self._attributes = {}
+
+    def get_class(self, tag):
+        """Returns the class for the tag or None if the class is not implemented"""
+        try:
+            return self._types[tag]
+        except KeyError:
+            entry = self.classes.get(tag)
+            klass = getattr(importlib.import_module(entry.module), tag) if entry is not None else None
+            self._types[tag] = klass
+            return klass
+
+    def attributes(self, klass):
+        """Returns the dictionary {attr: AttributeSchema} of a class"""
+        try:
+            return self._attributes[klass]
+        except KeyError:
+            entry = self.classes.get(klass.__name__)
+            if entry is not None and self.get_class(klass.__name__) is klass:
+                attributes = entry.attributes
+            else:
+                # Class not generated for this version, e.g. a subclass created by the user
+                attributes = _class_attributes(klass)
+            self._attributes[klass] = attributes
+            return attributes
+
+
+class ReferenceList(list):
+    """List of the objects of a 0..n or 1..n reference
+
+    The list keeps the insertion order and supports indexing like a list. A set of the elements is kept next to the
+    list, so membership tests take constant time. This keeps the import of objects with many references, e.g. a
+    TopologicalNode with thousands of Terminals, linear.
+    """
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._rebuild()
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __contains__(self, item):
+        if self._members is None:
+            return super().__contains__(item)
+        try:
+            return item in self._members
+        except TypeError:
+            return super().__contains__(item)
+
+    def append(self, item):
+        super().append(item)
+        self._add(item)
+
+    def extend(self, iterable):
+        items = list(iterable)
+        super().extend(items)
+        for item in items:
+            self._add(item)
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._add(item)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, value):
+        super().__imul__(value)
+        self._rebuild()
+        return self
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild()
+
+    def remove(self, item):
+        super().remove(item)
+        self._rebuild()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._rebuild()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._members = set()
+
+    def _add(self, item):
+        if self._members is not None:
+            try:
+                self._members.add(item)
+            except TypeError:
+                # Unhashable element, fall back to the membership test of list
+                self._members = None
+
+    def _rebuild(self):
+        try:
+            self._members = set(self)
+        except TypeError:
+            self._members = None
+
+
+def get_schema(cgmes_version, cache_dir=None):
+    """Returns the schema registry of a CGMES version
+
+    The registry is generated once per version from the default values of the generated classes and stored in
+    cache_dir. It is regenerated if a module of the version changes.
+
+    :param cgmes_version: cgmes version, e.g. "cgmes_v2_4_15"
+    :param cache_dir: directory of the cached registry, by default the environment variable CIMPY_CACHE_DIR or \
+    ~/.cache/cimpy
+    :return: a :class:`~cimpy.schema.SchemaRegistry`
+    """
+    try:
+        return _registries[cgmes_version]
+    except KeyError:
+        pass
+
+    package_path = os.path.dirname(importlib.util.find_spec("cimpy." + cgmes_version).origin)
+    module_names = sorted(
+        name[:-3] for name in os.listdir(package_path) if name.endswith(".py") and not name.startswith("__")
+    )
+
+    fingerprint = _fingerprint(package_path, module_names)
+    cache_file = os.path.join(
+        cache_dir or default_cache_dir(), "schema_{}_{}.pickle".format(cgmes_version, fingerprint)
+    )
+
+    classes = None
+    try:
+        with open(cache_file, "rb") as file:
+            classes = pickle.load(file)
+    except FileNotFoundError:
+        pass
+    except Exception as error:
+        logger.warning("Schema cache %s not readable, generate schema: %s", cache_file, error)
+
+    if classes is None:
+        classes = _generate_classes("cimpy." + cgmes_version, module_names)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = cache_file + ".%d.tmp" % os.getpid()
+            with open(tmp_file, "wb") as file:
+                pickle.dump(classes, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as error:
+            logger.info("Schema cache %s not writable: %s", cache_file, error)
+
+    registry = SchemaRegistry(cgmes_version, classes, fingerprint)
+    _registries[cgmes_version] = registry
+    return registry
+
+
+def default_cache_dir():
+    """Returns the directory for cached data, the environment variable CIMPY_CACHE_DIR or ~/.cache/cimpy"""
+    cache_dir = os.environ.get("CIMPY_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    return os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "cimpy")
+
+
+# Hash over the names, sizes and modification times of the modules of a version
+def _fingerprint(package_path, module_names):
+    fingerprint = hashlib.sha1(str(_SCHEMA_FORMAT).encode())
+    for name in module_names:
+        stat = os.stat(os.path.join(package_path, name + ".py"))
+        fingerprint.update("{}:{}:{};".format(name, stat.st_size, stat.st_mtime_ns).encode())
+    return fingerprint.hexdigest()[:16]
+
+
+# Imports all modules of a version and returns {tag: ClassSchema} for every class
+def _generate_classes(version_path, module_names):
+    classes = {}
+    for name in module_names:
+        module_name = version_path + "." + name
+        klass = getattr(importlib.import_module(module_name), name, None)
+        if not isinstance(klass, type):
+            continue
+        classes[name] = ClassSchema(module_name, _class_attributes(klass))
+    return classes
+
+
+# Derives the attribute schema of a class from the default values of a new instance
+def _class_attributes(klass):
+    attributes = {}
+    for attr, default in vars(klass()).items():
+        if default is None:
+            attributes[attr] = AttributeSchema(None, SINGLE, klass.__name__)
+        elif default == "list":
+            attributes[attr] = AttributeSchema(str, MANY, klass.__name__)
+        elif isinstance(default, bool):
+            attributes[attr] = AttributeSchema(_to_bool, ATTRIBUTE, klass.__name__)
+        else:
+            attributes[attr] = AttributeSchema(type(default), ATTRIBUTE, klass.__name__)
+    return attributes
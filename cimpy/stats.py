@@ -0,0 +1,177 @@
+from cimpy.archive import source_size
+from collections import namedtuple
+from itertools import islice
+from time import perf_counter
+import gc
+import sys
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Number of records parsed before they are linked, the parse and link times are measured once per batch
+_BATCH_SIZE = 4096
+
+# Progress event of an import
+# event: "phase_started", "file_started", "elements" (after each batch of elements), "file_finished" or "done"
+# phase: the import phase, e.g. "single_pass", "fixups", "instantiate_classes" or "set_attributes"
+# file: the file read, None for events of a phase
+# elements: the number of elements of the file processed so far
+# result: the import result for "done", otherwise None
+ImportProgress = namedtuple("ImportProgress", ["event", "phase", "file", "elements", "result"])
+
+
+class ImportStats:
+    """Throughput statistics of an import
+
+    The records of every file are read in batches. The time spent reading a batch from the parser is the parse time
+    and the time spent creating and linking its objects is the link time of the file. The counters attributes_set and
+    references_resolved are incremented by the import. Between :meth:`watch_gc` and :meth:`unwatch_gc` the collections
+    of the cyclic garbage collector and the time spent in them are counted.
+
+    :param callback: function called with the statistics dictionary of each file after the file is imported, see \
+    :meth:`as_dict`
+    :param progress: function called with an :class:`ImportProgress` at the start of each phase and file and after \
+    each batch of elements. An exception raised by progress aborts the import.
+    """
+
+    def __init__(self, callback=None, progress=None):
+        self.callback = callback
+        self.progress = progress
+        self.files = []
+        self.phases = {}
+        self.attributes_set = 0
+        self.references_resolved = 0
+        self.gc_mode = None
+        self.gc_collections = 0
+        self.gc_time = 0.0
+        self._gc_start = None
+        self._start = perf_counter()
+        self._start_rss = _peak_rss()
+
+    def streams(self, streams, phase):
+        """Wraps an iterable of (xml_file, records) and measures the records of each file
+
+        The time waiting for the records of a file, e.g. for a worker process parsing it, is added to its parse time.
+        """
+        streams = iter(streams)
+        while True:
+            start = perf_counter()
+            try:
+                xml_file, records = next(streams)
+            except StopIteration:
+                return
+            yield xml_file, self.records(xml_file, phase, records, perf_counter() - start)
+
+    def records(self, xml_file, phase, records, parse_time=0.0):
+        """Yields the records of one file and adds the statistics of the file after the last record"""
+        entry = dict(
+            file=str(xml_file),
+            phase=phase,
+            bytes=source_size(xml_file),
+            elements=0,
+            parse_time=parse_time,
+            link_time=0.0,
+            elements_per_second=None,
+            attributes_set=self.attributes_set,
+            references_resolved=self.references_resolved,
+            peak_rss_delta=None,
+        )
+        start_rss = _peak_rss()
+        progress = self.progress
+        if progress is not None:
+            progress(ImportProgress("file_started", phase, entry["file"], 0, None))
+        records = iter(records)
+        while True:
+            start = perf_counter()
+            batch = list(islice(records, _BATCH_SIZE))
+            entry["parse_time"] += perf_counter() - start
+            if not batch:
+                break
+            entry["elements"] += len(batch)
+            start = perf_counter()
+            yield from batch
+            entry["link_time"] += perf_counter() - start
+            if progress is not None:
+                progress(ImportProgress("elements", phase, entry["file"], entry["elements"], None))
+
+        elapsed = entry["parse_time"] + entry["link_time"]
+        if elapsed > 0:
+            entry["elements_per_second"] = entry["elements"] / elapsed
+        entry["attributes_set"] = self.attributes_set - entry["attributes_set"]
+        entry["references_resolved"] = self.references_resolved - entry["references_resolved"]
+        if start_rss is not None:
+            entry["peak_rss_delta"] = _peak_rss() - start_rss
+        self.files.append(entry)
+        if self.callback is not None:
+            self.callback(entry)
+        if progress is not None:
+            progress(ImportProgress("file_finished", phase, entry["file"], entry["elements"], None))
+
+    def start_phase(self, phase):
+        """Reports the start of phase to progress"""
+        if self.progress is not None:
+            self.progress(ImportProgress("phase_started", phase, None, 0, None))
+
+    def add_phase(self, phase, elapsed):
+        """Adds elapsed seconds to the time of phase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+    def watch_gc(self, gc_mode=None):
+        """Starts counting the garbage collections, gc_mode is the mode of the import reported by :meth:`as_dict`"""
+        self.gc_mode = gc_mode
+        gc.callbacks.append(self._gc_callback)
+
+    def unwatch_gc(self):
+        """Stops counting the garbage collections"""
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+
+    def _gc_callback(self, phase, info):
+        if phase == "start":
+            self._gc_start = perf_counter()
+        elif self._gc_start is not None:
+            self.gc_collections += 1
+            self.gc_time += perf_counter() - self._gc_start
+            self._gc_start = None
+
+    def as_dict(self, diagnostics=None):
+        """Returns the statistics as plain dictionaries
+
+        :param diagnostics: :class:`~cimpy.diagnostics.ImportDiagnostics` of the import, the created objects are \
+        taken from its counters
+        :return: a dictionary with the keys 'total_time', 'parse_time', 'link_time' (seconds), 'phases' \
+        ({phase: seconds}), 'files' (list of the statistics of each file with the keys 'file', 'phase', 'bytes', \
+        'elements', 'parse_time', 'link_time', 'elements_per_second', 'attributes_set', 'references_resolved' and \
+        'peak_rss_delta'), 'objects_created' ({class name: count}), 'attributes_set', 'references_resolved', \
+        'peak_rss_delta', the growth of the peak resident set size of the process in bytes or None if it cannot \
+        be measured, and 'gc' with the keys 'mode', 'collections' and 'time' (seconds) of the garbage collections \
+        during the import. With the mode None the time is what a paused garbage collector would save.
+        """
+        objects_created = {}
+        if diagnostics is not None:
+            for (category, cls, _), count in diagnostics.counts.items():
+                if category == "object_created":
+                    objects_created[cls] = objects_created.get(cls, 0) + count
+        return dict(
+            total_time=perf_counter() - self._start,
+            parse_time=sum(entry["parse_time"] for entry in self.files),
+            link_time=sum(entry["link_time"] for entry in self.files),
+            phases=dict(self.phases),
+            files=list(self.files),
+            objects_created=objects_created,
+            attributes_set=self.attributes_set,
+            references_resolved=self.references_resolved,
+            peak_rss_delta=_peak_rss() - self._start_rss if self._start_rss is not None else None,
+            gc=dict(mode=self.gc_mode, collections=self.gc_collections, time=self.gc_time),
+        )
+
+
+# Returns the peak resident set size of the process in bytes or None
+def _peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -7,6 +8,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
 from cimpy.llm_routing.config import CIM_ROOT
+from cimpy.cimpy.schema import default_cache_dir
 from cimpy.cimpy_time_analysis.load_cim_data import (
     scan_snapshot_inventory as _scan_snapshot_inventory_raw,
     load_base_snapshot,
@@ -487,6 +489,8 @@ def build_cim_services(cim_root: Optional[str] = None) -> Dict[str, Any]:
         "status": "ok",
         "tool": "cim_context",
         "cim_root": normalized_root,
+        # Wiederholte Importe des Basissnapshots werden aus dem Import-Cache geladen
+        "import_cache_dir": os.path.join(default_cache_dir(), "imports"),
     }
 
 
@@ -1136,6 +1140,7 @@ def _scan_snapshot_inventory_with_services(
     base_snapshot = load_base_snapshot(
         root_folder=cim_root,
         snapshot_inventory=inventory,
+        cache_dir=services.get("import_cache_dir"),
     )
 
     network_index = build_network_index_from_snapshot(base_snapshot)
@@ -1370,6 +1375,7 @@ def _resolve_voltage_limit_values_via_global_lookup(
         base_snapshot = load_base_snapshot(
             root_folder=cim_root,
             snapshot_inventory=inventory,
+            cache_dir=services.get("import_cache_dir"),
         )
         all_objects = _collect_all_cim_objects(base_snapshot)
     except Exception:
@@ -1908,6 +1914,7 @@ def _load_snapshot_cache_with_services(
             start_time=parsed_query.get("time_start"),
             end_time=parsed_query.get("time_end"),
             snapshot_inventory=snapshot_inventory,
+            include_classes=required_state_types or None,
         )
 
         if not cim_snapshots:
@@ -1,5 +1,8 @@
 from pathlib import Path
-from cimpy.cimpy import cim_import
+from cimpy.cimpy import cim_import, cim_import_overlay
+from cimpy.cimpy.archive import expand_sources, is_archive, open_source
+from cimpy.cimpy.cache import file_digest
+from collections import OrderedDict
 from datetime import datetime, timezone
 import xml.etree.ElementTree as ET
 
@@ -49,19 +52,30 @@ def _parse_cgmes_datetime(value: str):
     return dt.astimezone(timezone.utc)
 
 
-def _extract_profile_and_times(xml_path: Path):
+def _extract_profile_and_times(xml_path):
     """
     Liest md:Model.profile, md:Model.scenarioTime und md:Model.created aus einer CGMES XML-Datei.
     Gibt (profile_url, scenario_dt, created_dt) zurück.
+
+    xml_path kann auch ein Member eines Zip-Archivs sein ("snapshot.zip/SV.xml").
+    Es wird nur bis zum Ende von md:FullModel gelesen, nicht die ganze Datei.
     """
+    ns = {"md": "http://iec.ch/TC57/61970-552/ModelDescription/1#"}
+    full_model_tag = "{%s}FullModel" % ns["md"]
+
+    full_model = None
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        for source in expand_sources([str(xml_path)]):
+            if isinstance(source, str):
+                with open(source, "rb") as stream:
+                    full_model = _find_element(stream, full_model_tag)
+            else:
+                with open_source(source) as stream:
+                    full_model = _find_element(stream, full_model_tag)
+            break
     except Exception:
         return None, None, None
 
-    ns = {"md": "http://iec.ch/TC57/61970-552/ModelDescription/1#"}
-    full_model = root.find(".//md:FullModel", ns)
     if full_model is None:
         return None, None, None
 
@@ -74,6 +88,16 @@ def _extract_profile_and_times(xml_path: Path):
     return profile, scenario_dt, created_dt
 
 
+def _find_element(stream, tag):
+    """
+    Liest den Stream nur bis zum Ende des ersten Elements mit diesem Tag.
+    """
+    for _, elem in ET.iterparse(stream, ("end",)):
+        if elem.tag == tag:
+            return elem
+    return None
+
+
 def _classify_profile(profile_url: str):
     """
     Grobe Klassifikation über URL-Substring.
@@ -111,7 +135,7 @@ def _extract_times_by_profile(xml_files):
     all_scenario_times = set()
 
     for f in xml_files:
-        profile_url, scenario_dt, created_dt = _extract_profile_and_times(Path(f))
+        profile_url, scenario_dt, created_dt = _extract_profile_and_times(f)
         prof = _classify_profile(profile_url)
         bucket = times_by_profile.get(prof, times_by_profile["OTHER"])
 
@@ -191,18 +215,17 @@ def scan_snapshot_inventory(root_folder):
             "snapshots": [],
         }
 
-    case_dirs = sorted(p for p in root_folder.iterdir() if p.is_dir())
+    # Snapshot = Ordner mit XML-/Zip-Dateien oder ein einzelnes Zip-Archiv
+    case_dirs = sorted(p for p in root_folder.iterdir() if p.is_dir() or is_archive(p))
 
     for case_dir in case_dirs:
-        xml_files = sorted(case_dir.glob("*.xml"))
-        if not xml_files:
+        xml_files_str = _list_snapshot_files(case_dir)
+        if not xml_files_str:
             continue
-
-        xml_files_str = [str(p) for p in xml_files]
         times_by_profile, default_time, default_source, all_scenario_times = _extract_times_by_profile(xml_files_str)
 
         snapshot_meta = {
-            "snapshot_name": case_dir.name,
+            "snapshot_name": _snapshot_name(case_dir),
             "case_dir": str(case_dir),
             "xml_files": xml_files_str,
             "default_time": default_time,
@@ -230,6 +253,30 @@ def scan_snapshot_inventory(root_folder):
     }
 
 
+def _snapshot_name(case_dir):
+    """
+    Name eines Snapshots: Ordnername bzw. Name des Zip-Archivs ohne Endung.
+    """
+    case_dir = Path(case_dir)
+    if case_dir.suffix.lower() == ".zip" and not case_dir.is_dir():
+        return case_dir.stem
+    return case_dir.name
+
+
+def _list_snapshot_files(case_dir):
+    """
+    Liefert die XML-Dateien eines Snapshots als Strings.
+    Zip-Archive (auch verschachtelt) werden nicht entpackt, ihre Member
+    werden als "archiv.zip/member.xml" aufgeführt und beim Import gestreamt.
+    """
+    case_dir = Path(case_dir)
+    if case_dir.is_dir():
+        sources = sorted(case_dir.glob("*.xml")) + sorted(p for p in case_dir.glob("*.zip") if is_archive(p))
+    else:
+        sources = [case_dir]
+    return [str(source) for source in expand_sources([str(p) for p in sources])]
+
+
 def _parse_iso_datetime(value):
     if value is None:
         return None
@@ -289,10 +336,32 @@ def get_snapshot_metadata_by_name(snapshot_inventory, snapshot_name):
 # NEU: Gezieltes Laden einzelner / ausgewählter Snapshots
 # =============================================================================
 
-def load_single_snapshot_from_metadata(snapshot_meta):
+def load_single_snapshot_from_metadata(
+    snapshot_meta, include_classes=None, reuse_static_model=False, cache_dir=None, intern_table=None
+):
     """
-    Lädt genau einen Snapshot vollständig per cim_import.
+    Lädt genau einen Snapshot per cim_import.
     Erwartet einen Eintrag aus scan_snapshot_inventory(...).
+
+    include_classes: optional Liste von Klassennamen (z. B. ["SvVoltage"]).
+    Dann werden nur diese Objekte und die direkt von ihnen referenzierten
+    Objekte importiert, statt des vollständigen Snapshots.
+
+    reuse_static_model: wenn True, werden alle Profile außer SSH/SV (EQ, TP, ...)
+    nur einmal pro Dateiinhalt importiert und zwischengespeichert. SSH und SV
+    werden per cim_import_overlay(...) darauf gelegt. Das statische Modell wird
+    von allen Snapshots mit byte-identischem EQ/TP geteilt und nicht verändert.
+    Nur die in SSH/SV genannten Objekte werden pro Snapshot kopiert, inverse
+    Referenzen wie TopologicalNode.SvVoltage liegen im Ergebnis und werden per
+    cimpy.get_overlay_attribute(...) gelesen. Exporte entsprechen einem
+    vollständigen Import.
+
+    cache_dir: optionales Verzeichnis des Import-Caches von cim_import(...).
+    Wiederholte Importe derselben Dateien werden von dort geladen.
+
+    intern_table: optionales Dictionary für cim_import(intern_table=...).
+    Wird dasselbe Dictionary für mehrere Snapshots übergeben, teilen sie sich
+    mRIDs, Enum-Werte und Namen als identische String-Objekte.
     """
     if not snapshot_meta:
         return None
@@ -301,7 +370,25 @@ def load_single_snapshot_from_metadata(snapshot_meta):
     if not xml_files_str:
         return None
 
-    cim_case = cim_import(xml_files_str, "cgmes_v2_4_15")
+    static_model = None
+    if reuse_static_model:
+        static_model, overlay_files = _load_static_model(
+            snapshot_meta, cache_dir=cache_dir, intern_table=intern_table
+        )
+
+    if static_model is not None:
+        cim_case = cim_import_overlay(static_model, overlay_files, "cgmes_v2_4_15", intern_table=intern_table)
+    elif include_classes:
+        cim_case = cim_import(
+            xml_files_str,
+            "cgmes_v2_4_15",
+            include_classes=include_classes,
+            include_referenced=True,
+            cache_dir=cache_dir,
+            intern_table=intern_table,
+        )
+    else:
+        cim_case = cim_import(xml_files_str, "cgmes_v2_4_15", cache_dir=cache_dir, intern_table=intern_table)
 
     default_time = snapshot_meta.get("default_time")
     default_source = snapshot_meta.get("default_time_source")
@@ -317,22 +404,62 @@ def load_single_snapshot_from_metadata(snapshot_meta):
     return cim_case
 
 
+# Statische Modelle (alle Profile außer SSH/SV) für reuse_static_model,
+# Schlüssel sind die Hashes der Dateiinhalte. Nur die zuletzt genutzten bleiben im Speicher.
+_STATIC_MODEL_CACHE = OrderedDict()
+_STATIC_MODEL_CACHE_SIZE = 2
+
+
+def _load_static_model(snapshot_meta, cache_dir=None, intern_table=None):
+    """
+    Liefert (statisches Modell, SSH/SV-Dateien) eines Snapshots oder (None, None),
+    wenn der Snapshot keine SSH/SV-Dateien oder nur SSH/SV-Dateien hat.
+    """
+    times_by_profile = snapshot_meta.get("times_by_profile", {})
+    overlay_files = []
+    for profile in ("SSH", "SV"):
+        overlay_files.extend(times_by_profile.get(profile, {}).get("files", []))
+
+    overlay_set = set(overlay_files)
+    static_files = [f for f in snapshot_meta.get("xml_files", []) if f not in overlay_set]
+    if not static_files or not overlay_files:
+        return None, None
+
+    key = tuple(sorted(file_digest(expand_sources([f])[0]) for f in static_files))
+    static_model = _STATIC_MODEL_CACHE.get(key)
+    if static_model is None:
+        static_model = cim_import(static_files, "cgmes_v2_4_15", cache_dir=cache_dir, intern_table=intern_table)
+        _STATIC_MODEL_CACHE[key] = static_model
+        while len(_STATIC_MODEL_CACHE) > _STATIC_MODEL_CACHE_SIZE:
+            _STATIC_MODEL_CACHE.popitem(last=False)
+    else:
+        _STATIC_MODEL_CACHE.move_to_end(key)
+
+    return static_model, overlay_files
+
+
 def load_single_snapshot(case_dir):
     """
     Komfortfunktion für einen einzelnen Snapshot-Ordner.
     """
     case_dir = Path(case_dir)
     inventory = scan_snapshot_inventory(case_dir.parent)
-    snapshot_meta = get_snapshot_metadata_by_name(inventory, case_dir.name)
+    snapshot_meta = get_snapshot_metadata_by_name(inventory, _snapshot_name(case_dir))
     if snapshot_meta is None:
         return None
     return load_single_snapshot_from_metadata(snapshot_meta)
 
 
-def load_cim_snapshots_from_inventory(snapshot_inventory, selected_snapshot_names=None):
+def load_cim_snapshots_from_inventory(
+    snapshot_inventory, selected_snapshot_names=None, include_classes=None, reuse_static_model=False
+):
     """
     Lädt nur die ausgewählten Snapshots.
     Wenn selected_snapshot_names=None, werden alle Snapshots geladen.
+    include_classes und reuse_static_model werden an
+    load_single_snapshot_from_metadata(...) durchgereicht.
+    Alle Snapshots eines Aufrufs nutzen eine gemeinsame Intern-Tabelle, gleiche
+    mRIDs, Enum-Werte und Namen liegen daher nur einmal im Speicher.
 
     Rückgabe:
     {
@@ -345,13 +472,21 @@ def load_cim_snapshots_from_inventory(snapshot_inventory, selected_snapshot_name
 
     selected_set = set(selected_snapshot_names) if selected_snapshot_names is not None else None
 
+    # Gemeinsame Strings aller geladenen Snapshots
+    intern_table = {}
+
     for snapshot_meta in all_meta:
         snapshot_name = snapshot_meta.get("snapshot_name")
         if selected_set is not None and snapshot_name not in selected_set:
             continue
 
         try:
-            cim_case = load_single_snapshot_from_metadata(snapshot_meta)
+            cim_case = load_single_snapshot_from_metadata(
+                snapshot_meta,
+                include_classes=include_classes,
+                reuse_static_model=reuse_static_model,
+                intern_table=intern_table,
+            )
             if cim_case is not None:
                 snapshots[snapshot_name] = cim_case
         except Exception as e:
@@ -372,9 +507,19 @@ def load_cim_snapshots(root_folder, selected_snapshot_names=None):
     )
 
 
-def load_snapshots_for_time_window(root_folder, start_time=None, end_time=None, snapshot_inventory=None):
+def load_snapshots_for_time_window(
+    root_folder,
+    start_time=None,
+    end_time=None,
+    snapshot_inventory=None,
+    include_classes=None,
+    reuse_static_model=False,
+):
     """
     Lädt nur die Snapshots, deren default_time im gewünschten Zeitfenster liegt.
+    Mit include_classes werden nur diese Klassen (plus Referenzen) importiert.
+    Mit reuse_static_model wird EQ/TP nur einmal importiert (siehe
+    load_single_snapshot_from_metadata).
     """
     if snapshot_inventory is None:
         snapshot_inventory = scan_snapshot_inventory(root_folder)
@@ -388,6 +533,8 @@ def load_snapshots_for_time_window(root_folder, start_time=None, end_time=None,
     return load_cim_snapshots_from_inventory(
         snapshot_inventory=snapshot_inventory,
         selected_snapshot_names=selected_names,
+        include_classes=include_classes,
+        reuse_static_model=reuse_static_model,
     )
 
 
@@ -416,9 +563,11 @@ def choose_base_snapshot_metadata(snapshot_inventory, preferred_snapshot_name=No
     return snapshots[0]
 
 
-def load_base_snapshot(root_folder, snapshot_inventory=None, preferred_snapshot_name=None):
+def load_base_snapshot(root_folder, snapshot_inventory=None, preferred_snapshot_name=None, cache_dir=None):
     """
     Lädt genau einen Basissnapshot für Netzwerkindex und Topologie.
+    Mit cache_dir wird der Import aus dem Import-Cache von cim_import(...) geladen,
+    solange sich die Dateien nicht ändern.
     """
     if snapshot_inventory is None:
         snapshot_inventory = scan_snapshot_inventory(root_folder)
@@ -430,7 +579,7 @@ def load_base_snapshot(root_folder, snapshot_inventory=None, preferred_snapshot_
     if base_meta is None:
         return None
 
-    return load_single_snapshot_from_metadata(base_meta)
+    return load_single_snapshot_from_metadata(base_meta, cache_dir=cache_dir)
 
 
 # =============================================================================
@@ -97,6 +97,7 @@ def _load_relevant_snapshots(
         start_time=time_start,
         end_time=time_end,
         snapshot_inventory=snapshot_inventory,
+        reuse_static_model=True,
     )
 
 
@@ -3,7 +3,9 @@ import cimpy
 from cimpy.cgmes_v2_4_15.CGMESProfile import short_profile_name
 import xmltodict
 import os
+import re
 import pytest_check as check
+import zipfile
 from pathlib import Path
 import pytest
 
@@ -213,3 +215,109 @@ def test_export_with_imported_files(sample_cimdata, tmpdir):
                                     test_item = (test_item, item[1])
 
                                 check.is_in(test_item, export_attr)
+
+
+def test_export_stream_writer(sample_cimdata, tmpdir):
+    # Values which the template engine escapes
+    line = next(obj for obj in sample_cimdata["topology"].values() if obj.__class__.__name__ == "ACLineSegment")
+    line.name = 'Line "A" & <B>'
+
+    def without_created(text):
+        return re.sub(r"<md:Model.created>[^<]*<", "<md:Model.created><", text)
+
+    rendered = cimpy.cim_export_to_string_array(sample_cimdata, "Test", "cgmes_v2_4_15")
+    streamed = cimpy.cim_export_to_string_array(sample_cimdata, "Test", "cgmes_v2_4_15", writer="stream")
+    check.equal([without_created(text) for text in streamed], [without_created(text) for text in rendered])
+
+    cimpy.cim_export(sample_cimdata, tmpdir + "/Stream", "cgmes_v2_4_15", ["EQ", "SV"], writer="stream")
+    files = sorted(Path(tmpdir).glob("Stream_*.xml"))
+    check.equal([file.name for file in files], ["Stream_Equipment.xml", "Stream_StateVariables.xml"])
+    check.is_in("Line &quot;A&quot; &amp; &lt;B&gt;", files[0].read_text())
+    with pytest.raises(ValueError):
+        cimpy.cim_export_to_string_array(sample_cimdata, "Test", "cgmes_v2_4_15", writer="lxml")
+
+
+def test_export_iter(sample_cimdata):
+    def without_created(text):
+        return re.sub(r"<md:Model.created>[^<]*<", "<md:Model.created><", text)
+
+    chunks = {}
+    for profile, chunk in cimpy.cim_export_iter(sample_cimdata, "Test", "cgmes_v2_4_15", ["EQ", "SV"], chunk_size=100):
+        check.less_equal(len(chunk), 100)
+        chunks.setdefault(profile, []).append(chunk)
+    check.equal(list(chunks), ["EQ", "SV"])
+
+    streamed = cimpy.cim_export_to_string_array(sample_cimdata, "Test", "cgmes_v2_4_15", ["EQ", "SV"], writer="stream")
+    exported = [b"".join(profile_chunks).decode("utf-8") for profile_chunks in chunks.values()]
+    check.equal([without_created(text) for text in exported], [without_created(text) for text in streamed])
+    with pytest.raises(ValueError):
+        cimpy.cim_export_iter(sample_cimdata, "Test", "cgmes_v2_4_15", chunk_size=0)
+
+
+def test_export_workers(sample_cimdata, tmpdir):
+    cimpy.cim_export(sample_cimdata, tmpdir + "/Serial", "cgmes_v2_4_15")
+    cimpy.cim_export(sample_cimdata, tmpdir + "/Parallel", "cgmes_v2_4_15", writer="stream", workers=2)
+    serial = sorted(Path(tmpdir).glob("Serial_*.xml"))
+    parallel = sorted(Path(tmpdir).glob("Parallel_*.xml"))
+    check.equal(len(parallel), 5)
+    profiles = [file.name.replace("Serial_", "") for file in serial]
+    check.equal([file.name.replace("Parallel_", "") for file in parallel], profiles)
+    for serial_file, parallel_file in zip(serial, parallel):
+        serial_text = re.sub(r"<md:Model.created>[^<]*<", "", serial_file.read_text()).replace("Serial_", "")
+        parallel_text = re.sub(r"<md:Model.created>[^<]*<", "", parallel_file.read_text()).replace("Parallel_", "")
+        check.equal(parallel_text, serial_text)
+
+
+def test_export_archive(sample_cimdata, tmpdir):
+    archive = str(tmpdir.join("bundle.zip"))
+    cimpy.cim_export(sample_cimdata, "Bundle", "cgmes_v2_4_15", ["EQ", "TP", "SV"], writer="stream", archive=archive)
+    with zipfile.ZipFile(archive) as bundle:
+        check.equal(bundle.namelist(), ["Bundle_Equipment.xml", "Bundle_Topology.xml", "Bundle_StateVariables.xml"])
+        check.equal(bundle.getinfo("Bundle_Topology.xml").compress_type, zipfile.ZIP_DEFLATED)
+        exported = xmltodict.parse(bundle.read("Bundle_StateVariables.xml"))
+    check.equal(len(exported["rdf:RDF"]["cim:SvVoltage"]), 15)
+    check.equal(os.listdir(str(tmpdir)), ["bundle.zip"])
+
+    with pytest.raises(FileExistsError):
+        cimpy.cim_export(sample_cimdata, "Bundle", "cgmes_v2_4_15", archive=archive)
+    with pytest.raises(ValueError):
+        cimpy.cim_export(sample_cimdata, "Bundle", "cgmes_v2_4_15", archive=archive + "2", workers=2)
+    cimpy.cim_export(sample_cimdata, tmpdir + "/Files", "cgmes_v2_4_15", ["SV"])
+    with pytest.raises(FileExistsError):
+        cimpy.cim_export(sample_cimdata, tmpdir + "/Files", "cgmes_v2_4_15", ["SV"])
+
+
+def test_export_state(sample_cimdata, tmpdir):
+    cimpy.cim_export(sample_cimdata, tmpdir + "/Full", "cgmes_v2_4_15", writer="stream")
+    cimpy.cim_export_state(sample_cimdata, tmpdir + "/Full", "cgmes_v2_4_15", archive=str(tmpdir.join("state.zip")))
+    with zipfile.ZipFile(str(tmpdir.join("state.zip"))) as bundle:
+        check.equal(bundle.namelist(), ["Full_StateVariables.xml"])
+        state = bundle.read("Full_StateVariables.xml").decode()
+    full = Path(tmpdir + "/Full_StateVariables.xml").read_text(encoding="utf-8")
+    created = re.compile("<md:Model.created>.*</md:Model.created>")
+    check.equal(created.sub("", state), created.sub("", full))
+
+    svvoltage = [obj for obj in sample_cimdata["topology"].values() if type(obj).__name__ == "SvVoltage"][0]
+    node = svvoltage.TopologicalNode.mRID
+    cimpy.cim_export_state(
+        sample_cimdata,
+        tmpdir + "/Study",
+        "cgmes_v2_4_15",
+        values={"SvVoltage.v": ([node], [21.5])},
+        dependent_on=["Full_Equipment", "Full_Topology"],
+    )
+    exported = xmltodict.parse(Path(tmpdir + "/Study_StateVariables.xml").read_text(encoding="utf-8"))
+    model = exported["rdf:RDF"]["md:FullModel"]
+    check.equal(
+        [entry["@rdf:resource"] for entry in model["md:Model.DependentOn"]], ["Full_Equipment", "Full_Topology"]
+    )
+    voltages = {
+        entry["cim:SvVoltage.TopologicalNode"]["@rdf:resource"]: entry for entry in exported["rdf:RDF"]["cim:SvVoltage"]
+    }
+    check.equal(voltages["#" + node]["cim:SvVoltage.v"], "21.5")
+    check.not_equal(svvoltage.v, 21.5)
+
+    with pytest.raises(KeyError):
+        cimpy.cim_export_state(sample_cimdata, tmpdir + "/Bad", "cgmes_v2_4_15", values={"SvVoltage.v": {"x": 1.0}})
+    with pytest.raises(ValueError):
+        cimpy.cim_export_state(sample_cimdata, tmpdir + "/Bad", "cgmes_v2_4_15", values={"SvVoltage.x": {node: 1.0}})
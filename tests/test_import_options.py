@@ -0,0 +1,424 @@
+import cimpy
+import cimpy.archive
+import cimpy.cache
+import cimpy.diagnostics
+import asyncio
+import concurrent.futures
+import gc
+import io
+import os
+import pickle
+import re
+import subprocess
+import sys
+import time
+import pytest_check as check
+import zipfile
+from pathlib import Path
+import pytest
+
+example_dir = Path(os.path.join(os.path.dirname(__file__), "../cimpy/examples/sampledata/CIGRE_MV")).resolve()
+reference_path = Path(os.path.join(os.path.dirname(__file__), "CIGREMV_import_reference_cgmes_v2_4_15.p")).resolve()
+
+
+@pytest.fixture
+def import_files():
+    """Absolute paths of the CIGRE_MV sample files"""
+    return sorted(str(file.absolute()) for file in example_dir.glob("*.xml"))
+
+
+def resolve(import_result):
+    return cimpy.cimexport._get_class_attributes_with_references(import_result, "cgmes_v2_4_15")
+
+
+def check_reference(import_result):
+    """Compare the import result with the pickled reference of the CIGRE_MV import"""
+    import_resolved = resolve(import_result)
+    with open(reference_path, "rb") as file:
+        check_list = pickle.load(file)
+    check.equal(len(import_resolved), len(check_list))
+    for elem in import_resolved:
+        check.is_in(elem, check_list)
+
+
+def test_import_single_pass(import_files):
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", single_pass=True))
+
+
+def test_import_single_pass_forward_references(import_files):
+    # Reversed order: rdf:about and rdf:resource of the TP and SV files are read before the EQ classes exist
+    import_files = list(reversed(import_files))
+    two_pass = resolve(cimpy.cim_import(import_files, "cgmes_v2_4_15"))
+    single_pass = resolve(cimpy.cim_import(import_files, "cgmes_v2_4_15", single_pass=True))
+    check.equal(two_pass, single_pass)
+
+
+def test_import_workers(import_files):
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", workers=2))
+
+
+def test_import_target_parser(import_files):
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", parser="target"))
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", parser="target", single_pass=True))
+    with pytest.raises(ValueError):
+        cimpy.cim_import(import_files, "cgmes_v2_4_15", parser="sax")
+
+
+def test_schema_registry(tmpdir, monkeypatch):
+    monkeypatch.setattr(cimpy.schema, "_registries", {})
+    registry = cimpy.schema.get_schema("cgmes_v2_4_15", cache_dir=str(tmpdir))
+    check.equal(len(tmpdir.listdir()), 1)
+
+    terminal = registry.attributes(registry.get_class("Terminal"))
+    check.equal(terminal["ConductingEquipment"].multiplicity, cimpy.schema.SINGLE)
+    check.equal(terminal["TransformerEnd"].multiplicity, cimpy.schema.MANY)
+    check.equal(terminal["TransformerEnd"].inverse, "Terminal")
+    check.equal(terminal["connected"].coercer("false"), False)
+    check.equal(terminal["sequenceNumber"].coercer("2"), 2)
+    check.is_none(registry.get_class("Name"))
+
+    # Second load is served from the cache directory
+    monkeypatch.setattr(cimpy.schema, "_registries", {})
+    cached = cimpy.schema.get_schema("cgmes_v2_4_15", cache_dir=str(tmpdir))
+    check.equal(cached.classes, registry.classes)
+
+
+def test_import_include_classes(import_files):
+    import_result = cimpy.cim_import(import_files, "cgmes_v2_4_15", include_classes=["SvVoltage"])
+    check.equal({obj.__class__.__name__ for obj in import_result["topology"].values()}, {"SvVoltage"})
+    check.equal(len(import_result["topology"]), 15)
+
+
+def test_import_profiles_include_referenced(import_files):
+    import_result = cimpy.cim_import(import_files, "cgmes_v2_4_15", profiles=["SV"], include_referenced=True)
+    topology = import_result["topology"]
+    voltages = [obj for obj in topology.values() if obj.__class__.__name__ == "SvVoltage"]
+    check.equal(len(voltages), 15)
+    for voltage in voltages:
+        check.equal(voltage.TopologicalNode.__class__.__name__, "TopologicalNode")
+        check.is_in(voltage.TopologicalNode.mRID, topology)
+    check.is_not_in("ACLineSegment", {obj.__class__.__name__ for obj in topology.values()})
+
+
+def test_reference_list(import_files):
+    import_result = cimpy.cim_import(import_files, "cgmes_v2_4_15")
+    node = next(obj for obj in import_result["topology"].values() if obj.__class__.__name__ == "TopologicalNode")
+    check.is_instance(node.Terminal, cimpy.schema.ReferenceList)
+    check.is_instance(node.Terminal, list)
+    terminal = node.Terminal[0]
+    check.is_in(terminal, node.Terminal)
+    node.Terminal.remove(terminal)
+    check.is_not_in(terminal, node.Terminal)
+    node.Terminal.insert(0, terminal)
+    check.equal(node.Terminal[0], terminal)
+    copy = pickle.loads(pickle.dumps(node.Terminal))
+    check.equal([obj.mRID for obj in copy], [obj.mRID for obj in node.Terminal])
+    check.is_in(copy[-1], copy)
+
+
+def test_import_zip(import_files, tmpdir):
+    flat = str(tmpdir.join("flat.zip"))
+    with zipfile.ZipFile(flat, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file in import_files:
+            archive.write(file, os.path.basename(file))
+    check_reference(cimpy.cim_import([flat], "cgmes_v2_4_15"))
+
+    # Zip of one zip per profile, the inner archives compressed and stored
+    nested = str(tmpdir.join("nested.zip"))
+    with zipfile.ZipFile(nested, "w") as archive:
+        for index, file in enumerate(import_files):
+            inner = io.BytesIO()
+            with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as inner_archive:
+                inner_archive.write(file, os.path.basename(file))
+            compression = zipfile.ZIP_STORED if index % 2 else zipfile.ZIP_DEFLATED
+            archive.writestr(os.path.basename(file) + ".zip", inner.getvalue(), compression)
+    sources = cimpy.archive.expand_sources([nested])
+    check.equal(len(sources), len(import_files))
+    check.equal(cimpy.archive.expand_sources([str(source) for source in sources]), sources)
+    check_reference(cimpy.cim_import([nested], "cgmes_v2_4_15", workers=2))
+
+
+def test_import_nested_zip_decompressed_once(import_files, tmpdir, monkeypatch):
+    nested = str(tmpdir.join("nested.zip"))
+    with zipfile.ZipFile(nested, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file in import_files:
+            inner = io.BytesIO()
+            with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as inner_archive:
+                inner_archive.write(file, os.path.basename(file))
+            archive.writestr(os.path.basename(file) + ".zip", inner.getvalue())
+
+    reads = []
+    read = zipfile.ZipFile.read
+
+    def counting_read(archive, name, pwd=None):
+        reads.append(getattr(name, "filename", name))
+        return read(archive, name, pwd)
+
+    monkeypatch.setattr(zipfile.ZipFile, "read", counting_read)
+    # Listing, sizing, hashing for the cache and parsing share one decompression of each inner archive
+    check_reference(cimpy.cim_import([nested], "cgmes_v2_4_15", cache_dir=str(tmpdir.join("cache"))))
+    check.equal(sorted(reads), sorted(os.path.basename(file) + ".zip" for file in import_files))
+
+    # The inner archives are decompressed again after the archive changed
+    os.utime(nested, ns=(0, 0))
+    reads.clear()
+    cimpy.archive.expand_sources([nested])
+    check.equal(len(reads), len(import_files))
+
+
+def test_import_nested_zip_threads(import_files, tmpdir):
+    nested = str(tmpdir.join("nested.zip"))
+    with zipfile.ZipFile(nested, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file in import_files:
+            inner = io.BytesIO()
+            with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as inner_archive:
+                inner_archive.write(file, os.path.basename(file))
+            archive.writestr(os.path.basename(file) + ".zip", inner.getvalue())
+
+    # The nested archives are shared by concurrent imports, the byte total matches the kept contents
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda _: cimpy.cim_import([nested], "cgmes_v2_4_15"), range(8)))
+    for result in results:
+        check_reference(result)
+    with cimpy.archive._nested_lock:
+        check.equal(cimpy.archive._nested_bytes, sum(map(len, cimpy.archive._nested_archives.values())))
+
+
+def test_import_overlay(import_files):
+    sv_files = [file for file in import_files if file.endswith("_SV.xml")]
+    base = cimpy.cim_import([file for file in import_files if file not in sv_files], "cgmes_v2_4_15")
+    base_topology = dict(base["topology"])
+
+    overlay = cimpy.cim_import_overlay(base, sv_files, "cgmes_v2_4_15")
+    check.equal(base["topology"], base_topology)
+    check.equal(len(overlay["topology"]), len(cimpy.cim_import(import_files, "cgmes_v2_4_15")["topology"]))
+
+    voltages = [obj for obj in overlay["topology"].values() if obj.__class__.__name__ == "SvVoltage"]
+    check.equal(len(voltages), 15)
+    for voltage in voltages:
+        # The overlay holds the inverse reference of the TopologicalNode shared with the base model
+        node = voltage.TopologicalNode
+        check.is_(overlay["topology"][node.mRID], base_topology[node.mRID])
+        check.is_(cimpy.get_overlay_attribute(overlay, node, "SvVoltage"), voltage)
+        check.is_none(node.SvVoltage)
+    check_reference(overlay)
+
+
+def test_import_overlay_node_breaker(monkeypatch):
+    # The import records the profiles in the serializationProfile of the classes, keep the ones of CIGRE_MV
+    package = cimpy.cgmes_v2_4_15
+    for name in package.__all__:
+        klass = getattr(package, name)
+        if "serializationProfile" in vars(klass):
+            monkeypatch.setattr(klass, "serializationProfile", dict(klass.serializationProfile))
+
+    folder = example_dir.parent / "Sample_Grid_Switches" / "Node-Breaker"
+    xml_files = sorted(str(file) for file in folder.glob("*.xml"))
+    overlay_files = [file for file in xml_files if "_SSH_" in file or "_SV_" in file]
+    base = cimpy.cim_import([file for file in xml_files if file not in overlay_files], "cgmes_v2_4_15")
+    base_resolved = resolve(base)
+
+    overlay = cimpy.cim_import_overlay(base, overlay_files, "cgmes_v2_4_15")
+    full = cimpy.cim_import([file for file in xml_files if file not in overlay_files] + overlay_files, "cgmes_v2_4_15")
+    check.equal(resolve(overlay), resolve(full))
+    check.equal(resolve(base), base_resolved)
+
+    # Only the objects named by the overlay files are copied
+    copied = [key for key, obj in base["topology"].items() if overlay["topology"][key] is not obj]
+    check.greater(len(copied), 0)
+    check.less_equal(len(copied), len(list(cimpy.iter_records(overlay_files))))
+
+    # Values reached through references of other objects
+    def traversed(import_result):
+        def get(obj, attr):
+            return cimpy.get_overlay_attribute(import_result, obj, attr)
+
+        values = []
+        for obj in import_result["topology"].values():
+            if obj.__class__.__name__ == "TopologicalNode":
+                terminals = get(obj, "Terminal") if isinstance(obj.Terminal, list) else []
+                values.append([get(terminal, "connected") for terminal in terminals])
+                equipment = [get(terminal, "ConductingEquipment") for terminal in terminals]
+                values.append([get(obj, "open") if hasattr(obj, "open") else None for obj in equipment])
+                values.append([get(terminal, "SvPowerFlow") is not None for terminal in terminals])
+                voltage = get(obj, "SvVoltage")
+                values.append(voltage.v if voltage is not None else None)
+        return values
+
+    check.equal(traversed(overlay), traversed(full))
+    check.is_in(True, [connected for values in traversed(overlay)[::4] for connected in values])
+
+    def exported(import_result):
+        texts = cimpy.cim_export_to_string_array(import_result, "Grid", "cgmes_v2_4_15", writer="stream")
+        return [re.sub(r"<md:Model.created>[^<]*<", "<md:Model.created><", text) for text in texts]
+
+    check.equal(exported(overlay), exported(full))
+
+
+def test_import_cache(import_files, tmpdir, monkeypatch):
+    cache_dir = str(tmpdir)
+    cimpy.cim_import(import_files, "cgmes_v2_4_15", cache_dir=cache_dir)
+    check.equal(len(tmpdir.listdir()), 1)
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", cache_dir=cache_dir))
+
+    # A corrupt cache file is replaced
+    cache_file = tmpdir.listdir()[0]
+    cache_file.write_binary(b"corrupt")
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", cache_dir=cache_dir))
+    check.not_equal(cache_file.read_binary(), b"corrupt")
+
+    # Other options are another entry, the least recently used entry is removed if the cache is too large
+    monkeypatch.setenv("CIMPY_IMPORT_CACHE_SIZE", "1")
+    cimpy.cim_import(import_files, "cgmes_v2_4_15", cache_dir=cache_dir, profiles=["SV"])
+    check.equal(len(tmpdir.listdir()), 1)
+    check.is_false(cache_file.exists())
+
+
+def test_import_cache_file_digest(import_files, tmpdir, monkeypatch):
+    files = []
+    for file in import_files:
+        copy = tmpdir.join(os.path.basename(file))
+        copy.write_binary(Path(file).read_bytes())
+        files.append(str(copy))
+    cache_dir = str(tmpdir.join("cache"))
+    cimpy.cim_import(files, "cgmes_v2_4_15", cache_dir=cache_dir)
+
+    hashed = []
+    update_digest = cimpy.cache._update_digest
+
+    def counting_update_digest(digest, stream):
+        hashed.append(digest)
+        update_digest(digest, stream)
+
+    monkeypatch.setattr(cimpy.cache, "_update_digest", counting_update_digest)
+
+    # The digests of unchanged files are computed once per process
+    check_reference(cimpy.cim_import(files, "cgmes_v2_4_15", cache_dir=cache_dir))
+    check.equal(hashed, [])
+
+    # A rewrite with the same size and modification time is detected by the status change time
+    sv_file = next(file for file in files if file.endswith("_SV.xml"))
+    stat = os.stat(sv_file)
+    content = Path(sv_file).read_bytes()
+    time.sleep(0.05)
+    Path(sv_file).write_bytes(content.replace(b"<cim:SvVoltage.v>19.605385", b"<cim:SvVoltage.v>18.605385", 1))
+    os.utime(sv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    check.equal(os.stat(sv_file).st_size, stat.st_size)
+
+    import_result = cimpy.cim_import(files, "cgmes_v2_4_15", cache_dir=cache_dir)
+    check.equal(len(hashed), 1)
+    voltages = [obj.v for obj in import_result["topology"].values() if obj.__class__.__name__ == "SvVoltage"]
+    check.is_in(18.605385, voltages)
+
+
+def test_import_diagnostics(import_files):
+    diagnostics = cimpy.cim_import(import_files, "cgmes_v2_4_15")["meta_info"]["diagnostics"]
+    not_implemented = diagnostics["errors"]["class_not_implemented"]
+    check.equal(not_implemented["count"], 67)
+    check.equal(not_implemented["classes"], {"Name": 65, "NameType": 2})
+    check.equal(len(not_implemented["samples"]), cimpy.diagnostics.DEFAULT_MAX_SAMPLES)
+    check.equal(len(set(not_implemented["samples"])), cimpy.diagnostics.DEFAULT_MAX_SAMPLES)
+    check.equal(diagnostics["info"]["object_created"]["classes"]["SvVoltage"], 15)
+
+
+def test_import_stats(import_files):
+    file_stats = []
+    import_result = cimpy.cim_import(import_files, "cgmes_v2_4_15", single_pass=True, stats_callback=file_stats.append)
+    stats = import_result["meta_info"]["stats"]
+    check.equal(stats["files"], file_stats)
+    check.equal([entry["file"] for entry in file_stats], import_files)
+    check.equal(sum(stats["objects_created"].values()), len(import_result["topology"]))
+    check.equal(stats["objects_created"]["SvVoltage"], 15)
+    check.equal(set(stats["phases"]), {"single_pass", "fixups"})
+    for entry in file_stats:
+        check.equal(entry["bytes"], os.path.getsize(entry["file"]))
+        check.greater(entry["elements"], 0)
+    check.greater(stats["references_resolved"], 0)
+
+
+def test_import_async(import_files):
+    async def collect():
+        return [event async for event in cimpy.cim_import_async(import_files, "cgmes_v2_4_15", single_pass=True)]
+
+    events = asyncio.run(collect())
+    check.equal(events[0].event, "phase_started")
+    check.equal([event.file for event in events if event.event == "file_started"], import_files)
+    check.equal(events[-2].phase, "fixups")
+    check.equal(events[-1].event, "done")
+    check_reference(events[-1].result)
+
+
+def test_iter_records(import_files):
+    topology = cimpy.cim_import(import_files, "cgmes_v2_4_15")["topology"]
+    records = list(cimpy.iter_records(import_files, classes=["SvVoltage"], attributes=["v", "TopologicalNode"]))
+    check.equal(len(records), 15)
+    for record in records:
+        voltage = topology[record.mRID]
+        check.equal(record.class_name, "SvVoltage")
+        check.equal(record.profile, "SV")
+        check.equal(float(record.attrs["v"]), voltage.v)
+        check.equal(record.refs, {"TopologicalNode": voltage.TopologicalNode.mRID})
+
+    # Objects of several profiles are yielded once per class element
+    terminal = topology[records[0].refs["TopologicalNode"]].Terminal[0].mRID
+    profiles = [record.profile for record in cimpy.iter_records(import_files, classes=["Terminal"])]
+    check.equal(len(profiles), 94)
+    profiles = [record.profile for record in cimpy.iter_records(import_files) if record.mRID == terminal]
+    check.equal(sorted(profiles), ["EQ", "TP"])
+
+
+def test_import_mmap(import_files):
+    check_reference(cimpy.cim_import(import_files, "cgmes_v2_4_15", use_mmap=True, workers=2))
+    sv_file = next(file for file in import_files if file.endswith("_SV.xml"))
+    with open(sv_file, "rb") as file:
+        namespaces, profiles = cimpy.archive.scan_header(file.read())
+    check.equal(namespaces["cim"], "http://iec.ch/TC57/2012/CIM-schema-cim16#")
+    check.equal(profiles, ["http://iec.ch/TC57/61970-456/StateVariables/3"])
+
+
+def test_import_intern_table(import_files):
+    strings = {}
+    first = cimpy.cim_import(import_files, "cgmes_v2_4_15", intern_table=strings)
+    second = cimpy.cim_import(import_files, "cgmes_v2_4_15", single_pass=True, intern_table=strings)
+    check_reference(second)
+    for uuid, obj in second["topology"].items():
+        check.is_(uuid, next(key for key in first["topology"] if key == uuid))
+        if hasattr(obj, "mRID"):
+            check.is_(obj.mRID, first["topology"][uuid].mRID)
+    line = next(obj for obj in second["topology"].values() if obj.__class__.__name__ == "ACLineSegment")
+    check.is_(line.name, first["topology"][line.mRID].name)
+
+
+def test_import_gc_mode(import_files):
+    gc_enabled = gc.isenabled()
+    import_result = cimpy.cim_import(import_files, "cgmes_v2_4_15", gc_mode="pause")
+    check_reference(import_result)
+    check.equal(gc.isenabled(), gc_enabled)
+    check.equal(import_result["meta_info"]["stats"]["gc"]["mode"], "pause")
+    check.equal(import_result["meta_info"]["stats"]["gc"]["collections"], 0)
+    check.equal(cimpy.cim_import(import_files, "cgmes_v2_4_15")["meta_info"]["stats"]["gc"]["mode"], None)
+
+    # The frozen objects are released again for the other tests
+    try:
+        cimpy.cim_import(import_files, "cgmes_v2_4_15", single_pass=True, gc_mode="freeze")
+        check.greater(gc.get_freeze_count(), 0)
+    finally:
+        gc.unfreeze()
+    with pytest.raises(ValueError):
+        cimpy.cim_import(import_files, "cgmes_v2_4_15", gc_mode="off")
+
+
+def test_lazy_class_package():
+    # Only CGMESProfile is imported with cimpy. A new interpreter, the classes of this process are already imported.
+    code = "import sys, cimpy; print(sum(1 for name in sys.modules if name.startswith('cimpy.cgmes_v2_4_15.')))"
+    output = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, text=True, check=True).stdout
+    check.equal(output.strip(), "1")
+
+    from cimpy.cgmes_v2_4_15 import ACLineSegment
+    from cimpy.cgmes_v2_4_15.Conductor import Conductor
+
+    check.is_true(issubclass(ACLineSegment, Conductor))
+    check.is_(cimpy.cgmes_v2_4_15.Conductor, Conductor)
+    check.is_in("Terminal", dir(cimpy.cgmes_v2_4_15))
+    with pytest.raises(AttributeError):
+        cimpy.cgmes_v2_4_15.NoClass